@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+NPU-253 Benchmarks
+
+Measures driver throughput for common workloads.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from npu253 import PatternCoprocessorDriver, NPUConfig
+from npu253.patterns import DOMAINS
+from pattern_template import CompiledTemplate
+
+
+def print_header(title: str) -> None:
+    """Print section header"""
+    print("\n" + "=" * 70)
+    print(f"  {title}")
+    print("=" * 70)
+
+
+def mixed_workload(npu: PatternCoprocessorDriver, seed: int, ops: int, lock=None) -> None:
+    """Run a mix of id, name and text queries plus transformations"""
+    names = [npu.patterns[i].name for i in range(1, 254, 7)]
+    archetypal_ids = list(npu.archetypal_patterns)[:16]
+    domains = ["physical", "social", "conceptual", "individual"]
+    guard = lock or nullcontext()
+
+    for i in range(ops):
+        n = seed * 7919 + i
+        with guard:
+            kind = n % 10
+            if kind < 6:
+                npu.query_by_id(n % 253 + 1)
+            elif kind < 8:
+                npu.query_by_name(names[n % len(names)])
+            elif kind < 9:
+                npu.query_by_text("garden")
+            elif archetypal_ids:
+                npu.transform_pattern(archetypal_ids[n % len(archetypal_ids)], domains[n % 4])
+
+
+def run_threads(npu: PatternCoprocessorDriver, n_threads: int, ops: int, lock=None) -> float:
+    """Run the mixed workload on n threads; return aggregate ops/second"""
+    threads = [
+        threading.Thread(target=mixed_workload, args=(npu, t, ops, lock))
+        for t in range(n_threads)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return n_threads * ops / elapsed
+
+
+def bench_thread_scaling(ops: int = 5000) -> None:
+    """Compare an externally locked driver with the concurrent mode"""
+    print_header("Thread Scaling (mixed id/name/text/transform workload)")
+
+    locked = PatternCoprocessorDriver(NPUConfig(cache_size=64))
+    locked.load()
+    concurrent = PatternCoprocessorDriver(NPUConfig(cache_size=64, concurrent=True))
+    concurrent.load()
+    big_lock = threading.Lock()
+
+    print(f"\n{'threads':>8} {'global lock ops/s':>20} {'concurrent ops/s':>18} {'speedup':>9}")
+    for n_threads in (1, 2, 4, 8, 16):
+        baseline = run_threads(locked, n_threads, ops, lock=big_lock)
+        striped = run_threads(concurrent, n_threads, ops)
+        print(f"{n_threads:>8} {baseline:>20,.0f} {striped:>18,.0f} {striped / baseline:>8.2f}x")
+
+    for label, npu in (("Global lock", locked), ("Concurrent mode", concurrent)):
+        telemetry = npu.get_telemetry()
+        print(f"\n{label}: {telemetry.total_queries} queries, "
+              f"cache hit rate {telemetry.to_dict()['cache_hit_rate']:.1%}", end="")
+    print("\n\nNote: CPython's GIL serializes this pure-Python workload, so neither")
+    print("mode scales with threads. Concurrent mode trades some per-query")
+    print("overhead for thread safety without an external lock; scale out with")
+    print("processes instead.")
+
+
+def replace_render(text: str, domain_mappings: dict, domain: str) -> str:
+    """Previous renderer: one full-text str.replace per placeholder"""
+    for placeholder, mappings in domain_mappings.items():
+        if domain in mappings:
+            text = text.replace(f"{{{{{placeholder}}}}}", mappings[domain])
+    return text
+
+
+def time_per_call(fn, calls: int) -> float:
+    """Microseconds per call of fn()"""
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def bench_template_rendering(calls: int = 20000) -> None:
+    """Compare repeated str.replace with single-pass compiled rendering"""
+    print_header("Template Rendering (str.replace passes vs compiled)")
+
+    npu = PatternCoprocessorDriver(NPUConfig())
+    npu.load()
+    patterns = list(npu.archetypal_patterns.values())
+    if not patterns:
+        print("\nNo archetypal patterns loaded")
+        return
+
+    # Real templates are short, so also try a long template with many placeholders
+    mappings = {
+        f"slot-{i}": {domain: f"{domain}-value-{i}" for domain in DOMAINS}
+        for i in range(40)
+    }
+    long_text = " ".join(
+        f"lorem ipsum dolor sit amet {{{{slot-{i % 40}}}}} consectetur" for i in range(400)
+    )
+    cases = [
+        ("archetypal patterns", [(p.archetypal_pattern, p.domain_mappings) for p in patterns]),
+        ("long template (40 slots, 400 uses)", [(long_text, mappings)]),
+    ]
+
+    print(f"\n{'case':<36} {'replace us':>11} {'compiled us':>12} {'speedup':>9}")
+    for label, templates in cases:
+        compiled = [(CompiledTemplate(text, maps), maps) for text, maps in templates]
+        for (text, maps), (template, _) in zip(templates, compiled):
+            for domain in DOMAINS:
+                assert replace_render(text, maps, domain) == template.render_domain(maps, domain)
+
+        n = len(templates)
+        counter = iter(range(10 ** 9))
+
+        def old():
+            i = next(counter)
+            text, maps = templates[i % n]
+            replace_render(text, maps, DOMAINS[i % 4])
+
+        def new():
+            i = next(counter)
+            template, maps = compiled[i % n]
+            template.render_domain(maps, DOMAINS[i % 4])
+
+        runs = calls if n > 1 else calls // 20
+        old_us = time_per_call(old, runs)
+        new_us = time_per_call(new, runs)
+        print(f"{label:<36} {old_us:>11.2f} {new_us:>12.2f} {old_us / new_us:>8.2f}x")
+
+    cached_us = time_per_call(lambda: patterns[0].transform_to_domain("social"), calls)
+    print(f"\nCached transform_to_domain(): {cached_us:.2f} us per call")
+
+
+STARTUP_SCRIPT = """
+import sys, time
+sys.path.insert(0, {root!r})
+from npu253 import PatternCoprocessorDriver, NPUConfig
+npu = PatternCoprocessorDriver(NPUConfig(snapshot_path={snapshot!r}))
+start = time.perf_counter()
+assert npu.load()
+print((time.perf_counter() - start) * 1e3)
+"""
+
+
+def bench_startup(runs: int = 21) -> None:
+    """Median load() time in fresh processes, from JSON and from a snapshot"""
+    print_header("Start-up (load() in a fresh process)")
+
+    root = str(Path(__file__).parent)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        snapshot = os.path.join(tmpdir, "patterns.npusnap")
+        PatternCoprocessorDriver(NPUConfig(snapshot_path=snapshot)).load()
+
+        def median_ms(snapshot_path) -> float:
+            script = STARTUP_SCRIPT.format(root=root, snapshot=snapshot_path)
+            return statistics.median(
+                float(subprocess.check_output([sys.executable, "-c", script], cwd=root))
+                for _ in range(runs)
+            )
+
+        json_ms = median_ms(None)
+        snapshot_ms = median_ms(snapshot)
+
+    print(f"\n{'source':<10} {'median ms':>10}")
+    print(f"{'JSON':<10} {json_ms:>10.1f}")
+    print(f"{'snapshot':<10} {snapshot_ms:>10.1f}")
+    print(f"\nSnapshot load: {json_ms / snapshot_ms:.2f}x faster over {runs} runs")
+
+
+def main():
+    """Run all benchmarks"""
+    bench_startup()
+    bench_thread_scaling()
+    bench_template_rendering()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,6 +17,8 @@ import re
 from typing import List, Dict, Set, Tuple
 from pyDatalog import pyDatalog
 
+from pattern_centrality import load_centrality, network_centrality
+
 # Initialize pyDatalog terms
 pyDatalog.create_terms('Pattern, Category, Sequence, X, Y, Z, P, C, S')
 pyDatalog.create_terms('InCategory, InSequence, DependsOn, HasForce')
@@ -47,7 +49,9 @@ class PatternLanguageQuerySystem:
         with open(json_path, 'r') as f:
             data = json.load(f)
         
+        self.pattern_json_path = json_path
         self.patterns = {}
+        self._centrality = None
         
         # Load patterns
         if 'patterns' in data:
@@ -203,23 +207,15 @@ class PatternLanguageQuerySystem:
         """
         Compute pattern centrality for salience
         
-        Patterns with more dependencies/dependents are more central
+        Combines PageRank, betweenness and eigenvector centrality of the
+        pattern network (see pattern_centrality.py), normalized to 0-1.
+        Computed once and shared with the salience engine's disk cache;
+        each call returns a new dict.
         """
-        centrality = {}
-        
-        for pattern_id in self.patterns:
-            deps = len(self.find_all_dependencies(pattern_id))
-            dependents = len(self.find_dependents(pattern_id))
-            
-            # Simple centrality: (dependencies + dependents) / 2
-            centrality[pattern_id] = (deps + dependents) / 2
-        
-        # Normalize
-        max_cent = max(centrality.values()) if centrality else 1
-        if max_cent > 0:
-            centrality = {k: v/max_cent for k, v in centrality.items()}
-        
-        return centrality
+        if self._centrality is None:
+            measures = load_centrality(self.pattern_json_path, self.patterns)
+            self._centrality = network_centrality(measures)
+        return dict(self._centrality)
     
     def find_patterns_by_context(self, 
                                   domain: str = None,
@@ -233,6 +229,7 @@ class PatternLanguageQuerySystem:
         """
         candidates = set(self.patterns.keys())
         scores = {}
+        centralities = self.compute_pattern_centrality()
         
         # Filter by category if specified
         if category:
@@ -254,7 +251,7 @@ class PatternLanguageQuerySystem:
                 score += 0.4 * (matches / len(keywords) if keywords else 0)
             
             # Centrality
-            centrality = self.compute_pattern_centrality().get(pattern_id, 0)
+            centrality = centralities.get(pattern_id, 0)
             score += 0.3 * centrality
             
             # Connection to active patterns (emergence)
@@ -179,10 +179,17 @@ def demo_telemetry(npu: PatternCoprocessorDriver) -> None:
     
     # Get telemetry
     print("\n1. Performance Telemetry:")
-    telemetry = npu.get_telemetry()
-    for key, value in telemetry.to_dict().items():
+    telemetry = npu.get_telemetry().to_dict()
+    commands = telemetry.pop("commands")
+    for key, value in telemetry.items():
         print(f"   {key}: {value}")
     
+    print("\n   Per-command latency (μs):")
+    print(f"   {'command':<12} {'count':>7} {'mean':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}")
+    for kind, stats in commands.items():
+        print(f"   {kind:<12} {stats['count']:>7} {stats['mean']:>9.2f} {stats['p50']:>9.2f} "
+              f"{stats['p95']:>9.2f} {stats['p99']:>9.2f} {stats['max']:>9.2f}")
+    
     # Get device status
     print("\n2. Device Status:")
     print(f"   {npu.get_device_status()}")
@@ -11,7 +11,8 @@ from .registers import (
     # Command codes
     CMD_RESET, CMD_LOAD_PATTERNS, CMD_QUERY_BY_ID, CMD_QUERY_BY_NAME,
     CMD_QUERY_BY_TEXT, CMD_TRANSFORM, CMD_GET_PRECEDING, CMD_GET_FOLLOWING,
-    CMD_GET_SEQUENCE, CMD_GET_CATEGORY, CMD_SELF_TEST,
+    CMD_GET_SEQUENCE, CMD_GET_CATEGORY, CMD_SELF_TEST, CMD_PROCESS_RING,
+    CMD_GET_NEIGHBORHOOD, CMD_SHORTEST_PATH, CMD_GET_PREREQUISITES,
     
     # Status bits
     STATUS_IDLE, STATUS_BUSY, STATUS_READY, STATUS_ERROR,
@@ -20,14 +21,25 @@ from .registers import (
     # Error codes
     ERR_NONE, ERR_INVALID_CMD, ERR_PATTERN_NOT_FOUND, ERR_INVALID_DOMAIN,
     ERR_QUERY_TIMEOUT, ERR_TRANSFORM_FAIL, ERR_MEMORY_ERROR, ERR_NOT_LOADED,
+    ERR_RING_FULL,
     
     # Register offsets
     REG_CMD, REG_STATUS, REG_PATTERN_ID, REG_PATTERN_COUNT,
     REG_QUERY_ADDR, REG_QUERY_LEN, REG_RESULT_ADDR, REG_RESULT_COUNT,
     REG_DOMAIN_MODE, REG_SEQUENCE_ID, REG_CATEGORY, REG_ERROR_CODE,
-    REG_PERF_QUERIES, REG_PERF_TRANSFORMS, REG_PERF_AVG_TIME_US
+    REG_PERF_QUERIES, REG_PERF_TRANSFORMS, REG_PERF_AVG_TIME_US,
+    REG_SQ_HEAD, REG_SQ_TAIL, REG_CQ_HEAD, REG_CQ_TAIL, REG_RING_SIZE
 )
-from .telemetry import NPUTelemetry, NPUConfig
+from .telemetry import NPUTelemetry, NPUConfig, ShardedTelemetry
+from .cache import StripedLRUCache
+from .histogram import LatencyHistogram, EWMARate
+from .template import CompiledTemplate, compile_template
+from .graph import PatternGraph
+from .bitset import bitset_from_ids, bitset_ids
+from .text_index import TextIndex
+from .name_index import NameIndex, normalize_name
+from .snapshot import SnapshotError
+from .ring import SubmissionEntry, CompletionEntry
 
 __version__ = "1.0.0"
 __all__ = [
@@ -36,14 +48,31 @@ __all__ = [
     "ArchetypalPattern",
     "NPUTelemetry",
     "NPUConfig",
+    "ShardedTelemetry",
+    "StripedLRUCache",
+    "LatencyHistogram",
+    "EWMARate",
+    "CompiledTemplate",
+    "compile_template",
+    "PatternGraph",
+    "bitset_from_ids",
+    "bitset_ids",
+    "TextIndex",
+    "NameIndex",
+    "normalize_name",
+    "SnapshotError",
+    "SubmissionEntry",
+    "CompletionEntry",
     # Command codes
     "CMD_RESET", "CMD_LOAD_PATTERNS", "CMD_QUERY_BY_ID", "CMD_QUERY_BY_NAME",
     "CMD_QUERY_BY_TEXT", "CMD_TRANSFORM", "CMD_GET_PRECEDING", "CMD_GET_FOLLOWING",
-    "CMD_GET_SEQUENCE", "CMD_GET_CATEGORY", "CMD_SELF_TEST",
+    "CMD_GET_SEQUENCE", "CMD_GET_CATEGORY", "CMD_SELF_TEST", "CMD_PROCESS_RING",
+    "CMD_GET_NEIGHBORHOOD", "CMD_SHORTEST_PATH", "CMD_GET_PREREQUISITES",
     # Status bits
     "STATUS_IDLE", "STATUS_BUSY", "STATUS_READY", "STATUS_ERROR",
     "STATUS_PATTERNS_LOADED", "STATUS_CACHE_HOT", "STATUS_SELF_TEST_OK",
     # Error codes
     "ERR_NONE", "ERR_INVALID_CMD", "ERR_PATTERN_NOT_FOUND", "ERR_INVALID_DOMAIN",
     "ERR_QUERY_TIMEOUT", "ERR_TRANSFORM_FAIL", "ERR_MEMORY_ERROR", "ERR_NOT_LOADED",
+    "ERR_RING_FULL",
 ]
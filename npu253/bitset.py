@@ -0,0 +1,57 @@
+"""
+NPU-253 Pattern Bitsets
+
+Sets of pattern IDs packed into Python ints (bit n set for pattern n),
+so set algebra over the 253 patterns is a single bitwise operation.
+"""
+
+from typing import Iterable, List, Sequence, Tuple
+
+
+def bitset_from_ids(ids: Iterable[int]) -> int:
+    """Pack pattern IDs into a bitset"""
+    bits = 0
+    for pattern_id in ids:
+        bits |= 1 << pattern_id
+    return bits
+
+
+def bitset_ids(bits: int) -> List[int]:
+    """Positions of the set bits, ascending"""
+    ids = []
+    while bits:
+        low = bits & -bits
+        ids.append(low.bit_length() - 1)
+        bits ^= low
+    return ids
+
+
+
+class PackedBitsets:
+    """
+    Read-only sequence of bitsets stored as fixed-width little-endian rows
+
+    Row n is decoded on access, so the backing buffer can be a view into a
+    memory-mapped file shared between processes.
+    """
+
+    __slots__ = ("data", "width")
+
+    def __init__(self, data, width: int):
+        self.data = data
+        self.width = width
+
+    @staticmethod
+    def pack(bitsets: Sequence[int]) -> Tuple[bytes, int]:
+        """Encode bitsets as (row bytes, row width)"""
+        width = max(1, (max(bitsets, default=0).bit_length() + 7) // 8)
+        return b"".join(bits.to_bytes(width, "little") for bits in bitsets), width
+
+    def __len__(self) -> int:
+        return len(self.data) // self.width
+
+    def __getitem__(self, index: int) -> int:
+        if not 0 <= index < len(self):
+            raise IndexError("bitset index out of range")
+        start = index * self.width
+        return int.from_bytes(self.data[start:start + self.width], "little")
@@ -0,0 +1,70 @@
+"""
+NPU-253 Pattern Cache
+
+Lock-striped LRU cache used by the driver in concurrent mode.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional
+
+
+# Smallest share of the capacity a stripe gets. Smaller stripes make
+# per-stripe LRU evict far earlier than one LRU of the same total size.
+MIN_STRIPE_CAPACITY = 64
+
+
+class StripedLRUCache:
+    """
+    LRU cache split into independently locked stripes
+
+    Keys hash to one stripe, and each stripe is its own OrderedDict with its
+    own lock and a share of the total capacity. Threads that touch
+    different stripes never contend. Eviction is LRU within each stripe.
+
+    stripes is an upper bound: every stripe holds at least
+    MIN_STRIPE_CAPACITY entries, so small caches use a single stripe and
+    keep the hit rate of a plain LRU.
+    """
+
+    def __init__(self, capacity: int, stripes: int = 16):
+        if capacity < 1:
+            raise ValueError(f"Invalid cache capacity: {capacity}")
+        n = max(1, min(stripes, capacity // MIN_STRIPE_CAPACITY))
+        self.capacity = capacity
+        self._stripes: List[OrderedDict] = [OrderedDict() for _ in range(n)]
+        self._locks = [threading.Lock() for _ in range(n)]
+        self._limits = [capacity // n + (1 if i < capacity % n else 0) for i in range(n)]
+
+    def __len__(self) -> int:
+        return sum(len(stripe) for stripe in self._stripes)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._stripes[hash(key) % len(self._stripes)]
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value (marking it most recent) or None"""
+        i = hash(key) % len(self._stripes)
+        stripe = self._stripes[i]
+        with self._locks[i]:
+            value = stripe.get(key)
+            if value is not None:
+                stripe.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Insert or refresh a value, evicting the stripe's oldest entry if full"""
+        i = hash(key) % len(self._stripes)
+        stripe = self._stripes[i]
+        with self._locks[i]:
+            if key in stripe:
+                stripe.move_to_end(key)
+                return
+            if len(stripe) >= self._limits[i]:
+                stripe.popitem(last=False)
+            stripe[key] = value
+
+    def clear(self) -> None:
+        for stripe, lock in zip(self._stripes, self._locks):
+            with lock:
+                stripe.clear()
@@ -4,47 +4,102 @@ NPU-253 Pattern Coprocessor Driver
 Main driver implementation for the NPU-253 virtual hardware device.
 """
 
+import copy
 import json
+import threading
 import time
 import re
+from contextlib import nullcontext
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
 from collections import OrderedDict
 
-from .patterns import PatternMetadata, ArchetypalPattern, PatternSequence, PatternCategory
-from .telemetry import NPUTelemetry, NPUConfig
+from .patterns import PatternMetadata, ArchetypalPattern, PatternSequence, PatternCategory, DOMAINS
+from .telemetry import NPUTelemetry, NPUConfig, ShardedTelemetry
+from .cache import StripedLRUCache
+from .graph import PatternGraph, DIRECTIONS
+from .bitset import bitset_from_ids, bitset_ids
+from .text_index import TextIndex
+from .name_index import NameIndex
+from .ring import CommandRing, SubmissionEntry, CompletionEntry
+from . import snapshot
 from .registers import *
 
 
+# Registers describing the calling thread's last command. In concurrent
+# mode each thread sees its own copy, like per-core register banks.
+_THREAD_LOCAL_REGS = frozenset({REG_PATTERN_ID, REG_RESULT_COUNT, REG_SEQUENCE_ID, REG_ERROR_CODE})
+_THREAD_LOCAL_STATUS = STATUS_READY | STATUS_ERROR
+
+# Telemetry breakdown for ring commands
+_TELEMETRY_KINDS = {
+    CMD_QUERY_BY_ID: "id",
+    CMD_QUERY_BY_NAME: "name",
+    CMD_QUERY_BY_TEXT: "text",
+    CMD_TRANSFORM: "transform",
+    CMD_GET_PRECEDING: "navigation",
+    CMD_GET_FOLLOWING: "navigation",
+    CMD_GET_NEIGHBORHOOD: "navigation",
+    CMD_SHORTEST_PATH: "navigation",
+    CMD_GET_PREREQUISITES: "navigation",
+}
+
+# Tables built by load() and published together once complete
+_TABLE_ATTRS = (
+    "patterns", "archetypal_patterns", "sequences", "categories",
+    "text_index", "_search_text", "name_index", "graph",
+    "_all_bitset", "_asterisk_bitsets",
+)
+
+
 class PatternCoprocessorDriver:
     """
     NPU-253 Pattern Coprocessor Driver
     
     Implements a virtual hardware device for accelerated pattern language
     operations with memory-mapped I/O interface.
+    
+    Not thread-safe by default. With NPUConfig(concurrent=True) one driver
+    can be shared between threads: tables are published read-only, the
+    cache is lock-striped, telemetry and per-command registers are kept
+    per thread, and ring operations take a ring lock.
     """
     
     def __init__(self, config: Optional[NPUConfig] = None):
         """Initialize the NPU-253 device driver"""
         self.config = config or NPUConfig()
+        self._concurrent = self.config.concurrent
+        self._local = threading.local()
+        self._write_lock = threading.RLock()
+        self._ring_lock = threading.RLock() if self._concurrent else nullcontext()
         
         # Simulated MMIO registers (dictionary for register state)
         self.registers: Dict[int, int] = {}
         self._init_registers()
         
-        # Pattern storage
+        # Pattern storage and search structures (built at load time)
         self.patterns: Dict[int, PatternMetadata] = {}
         self.archetypal_patterns: Dict[str, ArchetypalPattern] = {}
         self.sequences: Dict[int, PatternSequence] = {}
         self.categories: Dict[str, PatternCategory] = {}
+        self._reset_tables()
         
         # Pattern cache (LRU)
-        self.cache: OrderedDict = OrderedDict()
         self.cache_enabled = config.enable_cache if config else True
         self.cache_size = config.cache_size if config else 128
+        if self._concurrent:
+            self.cache = StripedLRUCache(self.cache_size, self.config.cache_stripes)
+        else:
+            self.cache: OrderedDict = OrderedDict()
         
         # Telemetry
-        self.telemetry = NPUTelemetry()
+        self._telemetry = self._new_telemetry()
+        
+        # Submission/completion rings for batched commands
+        self.submission_ring = CommandRing(self.config.ring_size)
+        self.completion_ring = CommandRing(self.config.ring_size)
+        self._next_tag = 0
         
         # Internal state
         self._loaded = False
@@ -70,6 +125,11 @@ class PatternCoprocessorDriver:
         self.registers[REG_PERF_QUERIES] = 0
         self.registers[REG_PERF_TRANSFORMS] = 0
         self.registers[REG_PERF_AVG_TIME_US] = 0
+        self.registers[REG_SQ_HEAD] = 0
+        self.registers[REG_SQ_TAIL] = 0
+        self.registers[REG_CQ_HEAD] = 0
+        self.registers[REG_CQ_TAIL] = 0
+        self.registers[REG_RING_SIZE] = self.config.ring_size
     
     # === Low-level MMIO Interface ===
     
@@ -78,7 +138,7 @@ class PatternCoprocessorDriver:
         if offset not in self.registers:
             self._set_error(ERR_MEMORY_ERROR)
             return
-        self.registers[offset] = value & 0xFFFFFFFF
+        self._put_reg(offset, value & 0xFFFFFFFF)
         
         if self.config.verbose:
             print(f"[NPU-253] WRITE REG[0x{offset:02X}] = 0x{value:08X}")
@@ -90,6 +150,8 @@ class PatternCoprocessorDriver:
             return 0
         
         value = self.registers[offset]
+        if self._concurrent:
+            value = self._thread_view(offset, value)
         if self.config.verbose:
             print(f"[NPU-253] READ REG[0x{offset:02X}] = 0x{value:08X}")
         return value
@@ -115,26 +177,100 @@ class PatternCoprocessorDriver:
         high = self.read_reg32(offset + 4)
         return (high << 32) | low
     
+    def _put_reg(self, offset: int, value: int) -> None:
+        """Store a register value, in the thread's bank where applicable"""
+        if self._concurrent and offset in _THREAD_LOCAL_REGS:
+            self._thread_registers()[offset] = value
+        else:
+            self.registers[offset] = value
+    
+    def _thread_registers(self) -> Dict[int, int]:
+        """Register bank of the calling thread (concurrent mode)"""
+        try:
+            return self._local.registers
+        except AttributeError:
+            self._local.registers = {REG_STATUS: 0}
+            return self._local.registers
+    
+    def _thread_view(self, offset: int, value: int) -> int:
+        """Overlay the calling thread's registers on a shared register value"""
+        if offset in _THREAD_LOCAL_REGS:
+            return self._thread_registers().get(offset, value)
+        if offset == REG_STATUS:
+            return (value & ~_THREAD_LOCAL_STATUS) | self._thread_registers()[REG_STATUS]
+        if offset in (REG_PERF_QUERIES, REG_PERF_TRANSFORMS, REG_PERF_AVG_TIME_US):
+            # Performance counters are merged from per-thread telemetry on read
+            telemetry = self.telemetry
+            return {
+                REG_PERF_QUERIES: telemetry.total_queries,
+                REG_PERF_TRANSFORMS: telemetry.total_transformations,
+                REG_PERF_AVG_TIME_US: int(telemetry.avg_query_time_us),
+            }[offset] & 0xFFFFFFFF
+        return value
+    
+    # === Concurrency Support ===
+    
+    def _new_telemetry(self):
+        """Telemetry store: per-thread shards in concurrent mode"""
+        return ShardedTelemetry() if self._concurrent else NPUTelemetry()
+    
+    @property
+    def telemetry(self) -> NPUTelemetry:
+        """Performance telemetry (merged across threads in concurrent mode)"""
+        if self._concurrent:
+            return self._telemetry.merged()
+        return self._telemetry
+    
+    def _tel(self) -> NPUTelemetry:
+        """Telemetry record the calling thread writes to"""
+        if self._concurrent:
+            return self._telemetry.shard()
+        return self._telemetry
+    
+    def _update_perf_registers(self) -> None:
+        """Mirror telemetry into the PERF registers (computed on read when concurrent)"""
+        if self._concurrent:
+            return
+        self.registers[REG_PERF_QUERIES] = self._telemetry.total_queries
+        self.registers[REG_PERF_TRANSFORMS] = self._telemetry.total_transformations
+        self.registers[REG_PERF_AVG_TIME_US] = int(self._telemetry.avg_query_time_us)
+    
     # === Status Management ===
     
     def _set_status(self, status_bits: int) -> None:
         """Set status bits"""
-        self.registers[REG_STATUS] |= status_bits
+        if self._concurrent:
+            self._thread_registers()[REG_STATUS] |= status_bits & _THREAD_LOCAL_STATUS
+            status_bits &= ~_THREAD_LOCAL_STATUS
+            if not status_bits:
+                return
+            with self._write_lock:
+                self.registers[REG_STATUS] |= status_bits
+        else:
+            self.registers[REG_STATUS] |= status_bits
     
     def _clear_status(self, status_bits: int) -> None:
         """Clear status bits"""
-        self.registers[REG_STATUS] &= ~status_bits
+        if self._concurrent:
+            self._thread_registers()[REG_STATUS] &= ~(status_bits & _THREAD_LOCAL_STATUS)
+            status_bits &= ~_THREAD_LOCAL_STATUS
+            if not status_bits:
+                return
+            with self._write_lock:
+                self.registers[REG_STATUS] &= ~status_bits
+        else:
+            self.registers[REG_STATUS] &= ~status_bits
     
     def _set_error(self, error_code: int) -> None:
         """Set error condition"""
-        self.registers[REG_ERROR_CODE] = error_code
+        self._put_reg(REG_ERROR_CODE, error_code)
         self._set_status(STATUS_ERROR)
         if self.config.verbose:
             print(f"[NPU-253] ERROR: 0x{error_code:02X}")
     
     def _clear_error(self) -> None:
         """Clear error condition"""
-        self.registers[REG_ERROR_CODE] = ERR_NONE
+        self._put_reg(REG_ERROR_CODE, ERR_NONE)
         self._clear_status(STATUS_ERROR)
     
     # === Device Driver Interface ===
@@ -144,10 +280,41 @@ class PatternCoprocessorDriver:
         if self.config.verbose:
             print("[NPU-253] Loading patterns into device memory...")
         
-        self._set_status(STATUS_BUSY)
-        self._clear_status(STATUS_IDLE)
+        with self._write_lock:
+            self._set_status(STATUS_BUSY)
+            self._clear_status(STATUS_IDLE)
+            
+            try:
+                # Build into a staging copy so readers never see partial tables
+                staged = self._staged_tables()
+                staged._load_tables()
+                self._publish_tables(staged)
+                
+                self._loaded = True
+                self.registers[REG_PATTERN_COUNT] = len(self.patterns)
+                self._set_status(STATUS_PATTERNS_LOADED)
+                
+                if self.config.verbose:
+                    print(f"[NPU-253] Loaded {len(self.patterns)} APL patterns")
+                    print(f"[NPU-253] Loaded {len(self.archetypal_patterns)} archetypal patterns")
+                    print(f"[NPU-253] Loaded {len(self.sequences)} sequences")
+                
+                return True
+                
+            except Exception as e:
+                self._set_error(ERR_MEMORY_ERROR)
+                if self.config.verbose:
+                    print(f"[NPU-253] Load failed: {e}")
+                return False
+            finally:
+                self._clear_status(STATUS_BUSY)
+                self._set_status(STATUS_IDLE)
+    
+    def _load_tables(self) -> None:
+        """Fill pattern tables and indexes from the snapshot or JSON sources"""
+        from_snapshot = self._load_snapshot()
         
-        try:
+        if not from_snapshot:
             # Load APL patterns
             pattern_path = Path(self.config.pattern_data_path)
             if pattern_path.exists():
@@ -168,29 +335,103 @@ class PatternCoprocessorDriver:
                 with open(sequences_path, 'r') as f:
                     data = json.load(f)
                     self._load_sequences(data)
+        
+        # Initialize categories and membership bitsets
+        self._init_categories()
+        self._index_sequences(rebuild_memberships=not from_snapshot)
+        
+        if not from_snapshot:
+            self._build_graph()
             
-            # Initialize categories
-            self._init_categories()
-            
-            self._loaded = True
-            self.registers[REG_PATTERN_COUNT] = len(self.patterns)
-            self._set_status(STATUS_PATTERNS_LOADED)
-            
-            if self.config.verbose:
-                print(f"[NPU-253] Loaded {len(self.patterns)} APL patterns")
-                print(f"[NPU-253] Loaded {len(self.archetypal_patterns)} archetypal patterns")
-                print(f"[NPU-253] Loaded {len(self.sequences)} sequences")
-            
-            return True
-            
-        except Exception as e:
-            self._set_error(ERR_MEMORY_ERROR)
+            # Render every archetypal pattern into all four domains up front
+            for pattern in self.archetypal_patterns.values():
+                pattern.precompute()
+        
+        # Build search indexes (the snapshot carries the text and name indexes)
+        self._build_text_index(rebuild_index=not from_snapshot)
+        if not from_snapshot:
+            self._build_name_index()
+            self._save_snapshot()
+    
+    def _staged_tables(self) -> "PatternCoprocessorDriver":
+        """Shallow copy of the driver with empty tables for load() to fill"""
+        staged = copy.copy(self)
+        staged._reset_tables()
+        return staged
+    
+    def _reset_tables(self) -> None:
+        """Bind empty pattern tables and indexes"""
+        self.patterns = {}
+        self.archetypal_patterns = {}
+        self.sequences = {}
+        self.categories = {}
+        self.text_index = TextIndex()
+        self._search_text = {}
+        self.name_index = NameIndex()
+        self.graph = PatternGraph()
+        self._all_bitset = 0
+        self._asterisk_bitsets: List[int] = [0, 0, 0, 0]
+    
+    def _publish_tables(self, staged: "PatternCoprocessorDriver") -> None:
+        """Swap in fully built tables (read-only in concurrent mode)"""
+        for attr in _TABLE_ATTRS:
+            value = getattr(staged, attr)
+            if self._concurrent and isinstance(value, dict):
+                value = MappingProxyType(value)
+            setattr(self, attr, value)
+    
+    def _snapshot_sources(self) -> List[str]:
+        """JSON files a snapshot is derived from"""
+        return [
+            self.config.pattern_data_path,
+            self.config.archetypal_data_path,
+            self.config.sequences_data_path,
+        ]
+    
+    def _load_snapshot(self) -> bool:
+        """Load device memory from the binary snapshot if it is fresh"""
+        path = self.config.snapshot_path
+        if not path:
+            return False
+        
+        # Taken before any JSON is read, so a rewritten snapshot never
+        # records the digest of newer sources than it was built from
+        self._source_digest = snapshot.source_digest(self._snapshot_sources())
+        if not snapshot.is_fresh(path, self._source_digest):
+            return False
+        
+        try:
+            data = snapshot.read_snapshot(path, self.text_index, self._source_digest)
+        except snapshot.SnapshotError as e:
             if self.config.verbose:
-                print(f"[NPU-253] Load failed: {e}")
+                print(f"[NPU-253] Ignoring snapshot {path}: {e}")
             return False
-        finally:
-            self._clear_status(STATUS_BUSY)
-            self._set_status(STATUS_IDLE)
+        
+        self.patterns = data["patterns"]
+        self.archetypal_patterns = data["archetypal_patterns"]
+        self.sequences = data["sequences"]
+        self.name_index = data["name_index"]
+        self.graph = data["graph"]
+        
+        if self.config.verbose:
+            print(f"[NPU-253] Loaded snapshot {path}")
+        return True
+    
+    def _save_snapshot(self) -> None:
+        """Write device memory to the binary snapshot, if configured"""
+        path = self.config.snapshot_path
+        if not path:
+            return
+        
+        try:
+            snapshot.write_snapshot(
+                path, self.patterns, self.archetypal_patterns, self.sequences,
+                self.text_index, self.name_index, self.graph, self._source_digest
+            )
+        except OSError as e:
+            # Read-only deployments still work, they just parse JSON
+            if self.config.verbose:
+                print(f"[NPU-253] Snapshot write failed: {e}")
     
     def _load_apl_patterns(self, data: dict) -> None:
         """Load APL patterns from JSON data"""
@@ -268,6 +509,70 @@ class PatternCoprocessorDriver:
             pattern_range=(205, 253),
             pattern_ids=[i for i in range(205, 254) if i in self.patterns]
         )
+        
+        for category in self.categories.values():
+            category.bitset = bitset_from_ids(category.pattern_ids)
+            category.patterns = tuple(self.patterns[pid] for pid in category.pattern_ids)
+        
+        self._all_bitset = bitset_from_ids(self.patterns)
+        self._asterisk_bitsets = [0, 0, 0, 0]
+        for pid, pattern in self.patterns.items():
+            self._asterisk_bitsets[min(max(pattern.asterisks, 0), 3)] |= 1 << pid
+    
+    def _index_sequences(self, rebuild_memberships: bool = True) -> None:
+        """Build sequence bitsets and each pattern's sequence memberships"""
+        if rebuild_memberships:
+            for pattern in self.patterns.values():
+                pattern.sequence_memberships = []
+        
+        for sequence_id in sorted(self.sequences):
+            sequence = self.sequences[sequence_id]
+            sequence.bitset = bitset_from_ids(pid for pid in sequence.pattern_ids if pid in self.patterns)
+            sequence.patterns = tuple(self.patterns[pid] for pid in sequence.pattern_ids if pid in self.patterns)
+            if rebuild_memberships:
+                for pid in bitset_ids(sequence.bitset):
+                    self.patterns[pid].sequence_memberships.append(sequence_id)
+    
+    def _build_graph(self) -> None:
+        """Build CSR adjacency arrays and prerequisite closures"""
+        self.graph.build(
+            {pid: p.following_patterns for pid, p in self.patterns.items()},
+            {pid: p.preceding_patterns for pid, p in self.patterns.items()},
+        )
+        self.graph.precompute_closures("preceding")
+    
+    def _build_text_index(self, rebuild_index: bool = True) -> None:
+        """Build the inverted index and substring corpus for text search"""
+        if rebuild_index:
+            self.text_index.clear()
+        self._search_text.clear()
+        
+        for pattern_id, pattern in self.patterns.items():
+            # Search in name, context, problem, and solution
+            searchable = (
+                pattern.name + " " +
+                pattern.context + " " +
+                pattern.problem_summary + " " +
+                pattern.solution
+            )
+            if rebuild_index:
+                self.text_index.add(pattern_id, searchable)
+            self._search_text[pattern_id] = searchable.lower()
+        
+        if rebuild_index:
+            self.text_index.finalize()
+    
+    def _build_name_index(self) -> None:
+        """Build the normalized-name index for name lookups"""
+        self.name_index.clear()
+        
+        for pattern_id, pattern in self.patterns.items():
+            # Some source names carry their pattern number ("24 SACRED SITES")
+            number, _, rest = pattern.name.partition(" ")
+            if rest and number == str(pattern_id):
+                self.name_index.add(pattern_id, rest, pattern.name)
+            else:
+                self.name_index.add(pattern_id, pattern.name)
     
     def initialize(self) -> bool:
         """Initialize device and run self-test"""
@@ -304,14 +609,15 @@ class PatternCoprocessorDriver:
     
     def remove(self) -> bool:
         """Cleanup and remove device"""
-        self.patterns.clear()
-        self.archetypal_patterns.clear()
-        self.sequences.clear()
-        self.categories.clear()
-        self.cache.clear()
-        
-        self._loaded = False
-        self._init_registers()
+        with self._write_lock:
+            self._reset_tables()
+            self.cache.clear()
+            with self._ring_lock:
+                self.submission_ring.clear()
+                self.completion_ring.clear()
+            
+            self._loaded = False
+            self._init_registers()
         
         if self.config.verbose:
             print("[NPU-253] Device removed")
@@ -339,6 +645,9 @@ class PatternCoprocessorDriver:
             return self.load()
         elif cmd == CMD_SELF_TEST:
             return self.run_self_test()
+        elif cmd == CMD_PROCESS_RING:
+            self.process_ring()
+            return True
         else:
             # Other commands handled by high-level methods
             return True
@@ -347,7 +656,10 @@ class PatternCoprocessorDriver:
         """Reset device state"""
         self._init_registers()
         self.cache.clear()
-        self.telemetry = NPUTelemetry()
+        with self._ring_lock:
+            self.submission_ring.clear()
+            self.completion_ring.clear()
+        self._telemetry = self._new_telemetry()
         self._set_status(STATUS_IDLE)
         return True
     
@@ -372,12 +684,20 @@ class PatternCoprocessorDriver:
         if not self.cache_enabled:
             return None
         
+        if self._concurrent:
+            value = self.cache.get(key)
+            if value is not None:
+                self._tel().cache_hits += 1
+            else:
+                self._tel().cache_misses += 1
+            return value
+        
         if key in self.cache:
             self.cache.move_to_end(key)  # LRU: move to end
-            self.telemetry.cache_hits += 1
+            self._telemetry.cache_hits += 1
             return self.cache[key]
         
-        self.telemetry.cache_misses += 1
+        self._telemetry.cache_misses += 1
         return None
     
     def _cache_put(self, key: int, value: PatternMetadata) -> None:
@@ -385,6 +705,10 @@ class PatternCoprocessorDriver:
         if not self.cache_enabled:
             return
         
+        if self._concurrent:
+            self.cache.put(key, value)
+            return
+        
         if key in self.cache:
             self.cache.move_to_end(key)
         else:
@@ -401,7 +725,7 @@ class PatternCoprocessorDriver:
         # Check cache first
         cached = self._cache_get(pattern_id)
         if cached:
-            self.telemetry.record_query_time((time.time() - start_time) * 1e6)
+            self._tel().record_query_time((time.time() - start_time) * 1e6, "id")
             return cached
         
         # Query from storage
@@ -418,59 +742,106 @@ class PatternCoprocessorDriver:
         self._set_status(STATUS_READY)
         
         elapsed = (time.time() - start_time) * 1e6
-        self.telemetry.record_query_time(elapsed)
-        self.registers[REG_PERF_QUERIES] = self.telemetry.total_queries
-        self.registers[REG_PERF_AVG_TIME_US] = int(self.telemetry.avg_query_time_us)
+        self._tel().record_query_time(elapsed, "id")
+        self._update_perf_registers()
         
         return pattern
     
-    def query_by_name(self, name: str) -> Optional[PatternMetadata]:
-        """Query pattern by name"""
+    def query_by_name(self, name: str, fuzzy: bool = True) -> Optional[PatternMetadata]:
+        """
+        Query pattern by name
+        
+        Names are compared after casefolding and stripping punctuation and
+        asterisks. When no name matches exactly and fuzzy is set, the
+        closest name by trigram similarity is returned if it reaches
+        config.name_match_threshold.
+        """
         start_time = time.time()
         
-        name_lower = name.lower()
-        for pattern in self.patterns.values():
-            if pattern.name.lower() == name_lower:
-                elapsed = (time.time() - start_time) * 1e6
-                self.telemetry.record_query_time(elapsed)
-                self.write_reg32(REG_RESULT_COUNT, 1)
-                self._set_status(STATUS_READY)
-                return pattern
+        pattern_id = self._resolve_name(name, fuzzy)
+        if pattern_id is None:
+            self._set_error(ERR_PATTERN_NOT_FOUND)
+            return None
         
-        self._set_error(ERR_PATTERN_NOT_FOUND)
-        return None
+        elapsed = (time.time() - start_time) * 1e6
+        self._tel().record_query_time(elapsed, "name")
+        self.write_reg32(REG_RESULT_COUNT, 1)
+        self._set_status(STATUS_READY)
+        return self.patterns[pattern_id]
     
-    def query_by_text(self, text: str) -> List[PatternMetadata]:
-        """Full-text search across patterns"""
-        start_time = time.time()
-        
-        text_lower = text.lower()
-        results = []
-        
-        for pattern in self.patterns.values():
-            # Search in name, context, problem, and solution
-            searchable = (
-                pattern.name + " " +
-                pattern.context + " " +
-                pattern.problem_summary + " " +
-                pattern.solution
-            ).lower()
+    def _resolve_name(self, name: str, fuzzy: bool = True) -> Optional[int]:
+        """Pattern ID for a name, falling back to trigram matching"""
+        pattern_id = self.name_index.lookup(name)
+        if pattern_id is None and fuzzy:
+            match = self.name_index.fuzzy_lookup(name, self.config.name_match_threshold)
+            if match:
+                pattern_id = match[0]
+        return pattern_id
+    
+    def query_by_text(
+        self,
+        text: str,
+        mode: Optional[str] = None,
+        limit: Optional[int] = None,
+        within: Optional[int] = None
+    ) -> List[PatternMetadata]:
+        """
+        Full-text search across patterns
+        
+        Args:
+            text: Query text. In "bm25" mode this is a list of terms,
+                "quoted phrases" and prefix* terms that must all match;
+                in "substring" mode it is matched literally.
+            mode: "bm25" or "substring" (defaults to config.text_search_mode)
+            limit: Maximum number of results to return
+            within: Optional pattern bitset (see pattern_bitset()) that
+                results must belong to
             
-            if text_lower in searchable:
-                results.append(pattern)
+        Returns:
+            Matching patterns, ranked by BM25 score in "bm25" mode or in
+            pattern order in "substring" mode
+        """
+        start_time = time.time()
+        results = self._search(text, mode, limit, within)
+        if results is None:
+            self._set_error(ERR_INVALID_CMD)
+            return []
         
         elapsed = (time.time() - start_time) * 1e6
-        self.telemetry.record_query_time(elapsed)
+        self._tel().record_query_time(elapsed, "text")
         self.write_reg32(REG_RESULT_COUNT, len(results))
         self._set_status(STATUS_READY)
         
         return results
     
+    def _search(
+        self,
+        text: str,
+        mode: Optional[str] = None,
+        limit: Optional[int] = None,
+        within: Optional[int] = None
+    ) -> Optional[List[PatternMetadata]]:
+        """Run a text search; None if the mode is unknown"""
+        mode = mode or self.config.text_search_mode
+        
+        if mode == "bm25":
+            ranked = self.text_index.search(text, within)
+            return [self.patterns[pid] for pid, _ in ranked[:limit]]
+        if mode == "substring":
+            text_lower = text.lower()
+            candidates = self._search_text if within is None else bitset_ids(within & self._all_bitset)
+            return [
+                self.patterns[pid]
+                for pid in candidates
+                if text_lower in self._search_text[pid]
+            ][:limit]
+        return None
+    
     def transform_pattern(self, pattern_id: str, domain: str) -> Optional[str]:
         """Transform archetypal pattern to specific domain"""
         start_time = time.time()
         
-        if domain not in ["physical", "social", "conceptual", "individual"]:
+        if domain not in DOMAINS:
             self._set_error(ERR_INVALID_DOMAIN)
             return None
         
@@ -482,8 +853,8 @@ class PatternCoprocessorDriver:
         try:
             result = pattern.transform_to_domain(domain)
             elapsed = (time.time() - start_time) * 1e6
-            self.telemetry.record_transform_time(elapsed)
-            self.registers[REG_PERF_TRANSFORMS] = self.telemetry.total_transformations
+            self._tel().record_transform_time(elapsed)
+            self._update_perf_registers()
             self._set_status(STATUS_READY)
             return result
         except Exception as e:
@@ -494,17 +865,14 @@ class PatternCoprocessorDriver:
     
     def get_preceding_patterns(self, pattern_id: int) -> List[PatternMetadata]:
         """Get patterns that precede this pattern"""
+        start_time = time.time()
         if pattern_id not in self.patterns:
             self._set_error(ERR_PATTERN_NOT_FOUND)
             return []
         
-        pattern = self.patterns[pattern_id]
-        results = [
-            self.patterns[pid] for pid in pattern.preceding_patterns
-            if pid in self.patterns
-        ]
+        results = [self.patterns[pid] for pid in self.graph.reverse.neighbors(pattern_id)]
         
-        self.telemetry.total_navigations += 1
+        self._tel().record_navigation_time((time.time() - start_time) * 1e6)
         self.write_reg32(REG_RESULT_COUNT, len(results))
         self._set_status(STATUS_READY)
         
@@ -512,17 +880,14 @@ class PatternCoprocessorDriver:
     
     def get_following_patterns(self, pattern_id: int) -> List[PatternMetadata]:
         """Get patterns that follow this pattern"""
+        start_time = time.time()
         if pattern_id not in self.patterns:
             self._set_error(ERR_PATTERN_NOT_FOUND)
             return []
         
-        pattern = self.patterns[pattern_id]
-        results = [
-            self.patterns[pid] for pid in pattern.following_patterns
-            if pid in self.patterns
-        ]
+        results = [self.patterns[pid] for pid in self.graph.forward.neighbors(pattern_id)]
         
-        self.telemetry.total_navigations += 1
+        self._tel().record_navigation_time((time.time() - start_time) * 1e6)
         self.write_reg32(REG_RESULT_COUNT, len(results))
         self._set_status(STATUS_READY)
         
@@ -534,11 +899,7 @@ class PatternCoprocessorDriver:
             self._set_error(ERR_PATTERN_NOT_FOUND)
             return []
         
-        sequence = self.sequences[sequence_id]
-        results = [
-            self.patterns[pid] for pid in sequence.pattern_ids
-            if pid in self.patterns
-        ]
+        results = list(self.sequences[sequence_id].patterns)
         
         self.write_reg32(REG_SEQUENCE_ID, sequence_id)
         self.write_reg32(REG_RESULT_COUNT, len(results))
@@ -552,14 +913,315 @@ class PatternCoprocessorDriver:
             self._set_error(ERR_PATTERN_NOT_FOUND)
             return []
         
-        cat = self.categories[category]
-        results = [self.patterns[pid] for pid in cat.pattern_ids]
+        results = list(self.categories[category].patterns)
         
         self.write_reg32(REG_RESULT_COUNT, len(results))
         self._set_status(STATUS_READY)
         
         return results
     
+    def pattern_bitset(
+        self,
+        sequence: Optional[int] = None,
+        category: Optional[str] = None,
+        min_asterisks: int = 0
+    ) -> Optional[int]:
+        """
+        Bitset of the patterns meeting every given condition
+        
+        Bit n is set for pattern n. The result can be combined with other
+        bitsets using &, | and ~, and passed to query_by_text(within=...).
+        
+        Returns:
+            The bitset, or None if the sequence or category is unknown
+        """
+        bits = self._all_bitset
+        if sequence is not None:
+            if sequence not in self.sequences:
+                return None
+            bits &= self.sequences[sequence].bitset
+        if category is not None:
+            if category not in self.categories:
+                return None
+            bits &= self.categories[category].bitset
+        if min_asterisks > 0:
+            for level in range(min(min_asterisks, len(self._asterisk_bitsets))):
+                bits &= ~self._asterisk_bitsets[level]
+        return bits
+    
+    def filter_patterns(
+        self,
+        sequence: Optional[int] = None,
+        category: Optional[str] = None,
+        min_asterisks: int = 0
+    ) -> List[PatternMetadata]:
+        """
+        Get patterns meeting every given condition, in ID order
+        
+        Example: filter_patterns(sequence=12, category="towns", min_asterisks=1)
+        """
+        bits = self.pattern_bitset(sequence, category, min_asterisks)
+        if bits is None:
+            self._set_error(ERR_PATTERN_NOT_FOUND)
+            return []
+        
+        results = [self.patterns[pid] for pid in bitset_ids(bits)]
+        self.write_reg32(REG_RESULT_COUNT, len(results))
+        self._set_status(STATUS_READY)
+        return results
+    
+    # === Multi-hop Navigation ===
+    
+    def get_neighborhood(
+        self,
+        pattern_id: int,
+        hops: int = 2,
+        direction: str = "following"
+    ) -> List[PatternMetadata]:
+        """
+        Get patterns within a number of links of a pattern
+        
+        Args:
+            pattern_id: Starting pattern (not included in the result)
+            hops: Maximum number of links to follow
+            direction: "following", "preceding" or "both" (links in
+                either direction)
+        
+        Returns:
+            Patterns ordered by distance, then pattern ID
+        """
+        start_time = time.time()
+        error, ids = self._neighborhood_ids(pattern_id, hops, direction)
+        return self._navigation_result(error, ids, start_time)
+    
+    def find_path(
+        self,
+        from_id: int,
+        to_id: int,
+        direction: str = "following"
+    ) -> List[PatternMetadata]:
+        """
+        Get the shortest chain of links between two patterns
+        
+        Returns:
+            Patterns on the path including both ends, or an empty list if
+            to_id cannot be reached from from_id
+        """
+        start_time = time.time()
+        error, ids = self._shortest_path_ids(from_id, to_id, direction)
+        return self._navigation_result(error, ids, start_time)
+    
+    def get_prerequisites(self, pattern_id: int) -> List[PatternMetadata]:
+        """
+        Get every pattern that transitively precedes a pattern
+        
+        Returns:
+            Patterns in ascending ID order, read from closure bitsets
+            computed at load time
+        """
+        start_time = time.time()
+        error, ids = self._prerequisite_ids(pattern_id)
+        return self._navigation_result(error, ids, start_time)
+    
+    def _neighborhood_ids(self, pattern_id: int, hops: int = 2, direction: str = "following") -> Tuple[int, List[int]]:
+        if direction not in DIRECTIONS or hops < 0:
+            return ERR_INVALID_CMD, []
+        if pattern_id not in self.patterns:
+            return ERR_PATTERN_NOT_FOUND, []
+        return ERR_NONE, [pid for pid, _ in self.graph.neighborhood(pattern_id, hops, direction)]
+    
+    def _shortest_path_ids(self, from_id: int, to_id: int, direction: str = "following") -> Tuple[int, List[int]]:
+        if direction not in DIRECTIONS:
+            return ERR_INVALID_CMD, []
+        if from_id not in self.patterns or to_id not in self.patterns:
+            return ERR_PATTERN_NOT_FOUND, []
+        return ERR_NONE, self.graph.shortest_path(from_id, to_id, direction)
+    
+    def _prerequisite_ids(self, pattern_id: int) -> Tuple[int, List[int]]:
+        if pattern_id not in self.patterns:
+            return ERR_PATTERN_NOT_FOUND, []
+        return ERR_NONE, self.graph.closure_ids(pattern_id, "preceding")
+    
+    def _navigation_result(self, error: int, ids: List[int], start_time: float) -> List[PatternMetadata]:
+        """Finish a navigation command: set error or result registers and telemetry"""
+        if error != ERR_NONE:
+            self._set_error(error)
+            return []
+        
+        results = [self.patterns[pid] for pid in ids]
+        self._tel().record_navigation_time((time.time() - start_time) * 1e6)
+        self.write_reg32(REG_RESULT_COUNT, len(results))
+        self._set_status(STATUS_READY)
+        return results
+    
+    # === Batched Command Rings ===
+    
+    def submit(self, cmd: int, *args) -> Optional[int]:
+        """
+        Queue a command on the submission ring
+        
+        Args:
+            cmd: CMD_QUERY_BY_ID, CMD_QUERY_BY_NAME, CMD_QUERY_BY_TEXT,
+                CMD_TRANSFORM, CMD_GET_PRECEDING, CMD_GET_FOLLOWING,
+                CMD_GET_SEQUENCE, CMD_GET_CATEGORY, CMD_GET_NEIGHBORHOOD,
+                CMD_SHORTEST_PATH or CMD_GET_PREREQUISITES
+            *args: Arguments of the matching high-level method, e.g.
+                submit(CMD_TRANSFORM, "12610010", "social")
+        
+        Returns:
+            Tag identifying the command's completion, or None if the
+            submission ring is full
+        """
+        with self._ring_lock:
+            tag = self._next_tag
+            if not self.submission_ring.push(SubmissionEntry(tag, cmd, args)):
+                self._set_error(ERR_RING_FULL)
+                return None
+            
+            self._next_tag = (tag + 1) & 0xFFFFFFFF
+            self.registers[REG_SQ_TAIL] = self.submission_ring.tail & 0xFFFFFFFF
+            return tag
+    
+    def process_ring(self) -> int:
+        """
+        Execute queued submissions (the CMD_PROCESS_RING doorbell)
+        
+        Commands run without per-command register writes, status toggles
+        or telemetry updates, and bypass the LRU pattern cache. Registers
+        and telemetry are updated once for the whole batch. Execution stops
+        early if the completion ring fills up.
+        
+        Returns:
+            Number of commands completed
+        """
+        if not self._loaded:
+            self._set_error(ERR_NOT_LOADED)
+            return 0
+        
+        with self._ring_lock:
+            start_time = time.time()
+            self.write_reg64(REG_QUERY_ADDR, SQ_BASE)
+            self.write_reg64(REG_RESULT_ADDR, CQ_BASE)
+            self._set_status(STATUS_BUSY)
+            
+            kinds: Dict[str, int] = {}
+            completed = 0
+            sq, cq = self.submission_ring, self.completion_ring
+            while len(sq) and not cq.is_full():
+                entry = sq.pop()
+                cq.push(self._execute_entry(entry))
+                completed += 1
+                kind = _TELEMETRY_KINDS.get(entry.cmd)
+                if kind:
+                    kinds[kind] = kinds.get(kind, 0) + 1
+            
+            elapsed = (time.time() - start_time) * 1e6
+            self._tel().record_batch(kinds, elapsed)
+            
+            self.registers[REG_SQ_HEAD] = sq.head & 0xFFFFFFFF
+            self.registers[REG_CQ_TAIL] = cq.tail & 0xFFFFFFFF
+            self._put_reg(REG_RESULT_COUNT, completed)
+            self._update_perf_registers()
+            self._clear_status(STATUS_BUSY)
+            self._set_status(STATUS_READY)
+            
+            return completed
+    
+    def reap_completions(self, max_entries: Optional[int] = None) -> List[CompletionEntry]:
+        """Remove completed commands from the completion ring, oldest first"""
+        with self._ring_lock:
+            cq = self.completion_ring
+            count = len(cq) if max_entries is None else min(max_entries, len(cq))
+            completions = [cq.pop() for _ in range(count)]
+            self.registers[REG_CQ_HEAD] = cq.head & 0xFFFFFFFF
+            return completions
+    
+    def execute_batch(self, commands: List[Tuple]) -> List[CompletionEntry]:
+        """
+        Run a list of (cmd, *args) tuples through the rings
+        
+        Batches larger than the ring are processed in ring-sized chunks.
+        
+        Returns:
+            One completion per command, in submission order
+        """
+        if not self._loaded:
+            self._set_error(ERR_NOT_LOADED)
+            return []
+        
+        with self._ring_lock:
+            completions: List[CompletionEntry] = []
+            for cmd, *args in commands:
+                if self.submission_ring.is_full():
+                    self.process_ring()
+                    completions.extend(self.reap_completions())
+                self.submit(cmd, *args)
+            
+            while len(self.submission_ring):
+                self.process_ring()
+                completions.extend(self.reap_completions())
+            completions.extend(self.reap_completions())
+            return completions
+    
+    def _execute_entry(self, entry: SubmissionEntry) -> CompletionEntry:
+        """Execute one ring command without touching registers or telemetry"""
+        cmd, args = entry.cmd, entry.args
+        completion = CompletionEntry(tag=entry.tag, cmd=cmd)
+        
+        try:
+            if cmd == CMD_QUERY_BY_ID:
+                completion.result = self.patterns.get(args[0])
+            elif cmd == CMD_QUERY_BY_NAME:
+                pattern_id = self._resolve_name(*args)
+                completion.result = self.patterns.get(pattern_id)
+            elif cmd == CMD_QUERY_BY_TEXT:
+                completion.result = self._search(*args)
+                if completion.result is None:
+                    completion.error = ERR_INVALID_CMD
+                return completion
+            elif cmd == CMD_TRANSFORM:
+                pattern_id, domain = args
+                if domain not in DOMAINS:
+                    completion.error = ERR_INVALID_DOMAIN
+                    return completion
+                if pattern_id not in self.archetypal_patterns:
+                    completion.error = ERR_PATTERN_NOT_FOUND
+                    return completion
+                completion.result = self.archetypal_patterns[pattern_id].transform_to_domain(domain)
+                return completion
+            elif cmd in (CMD_GET_PRECEDING, CMD_GET_FOLLOWING):
+                if args[0] in self.patterns:
+                    adjacency = self.graph.reverse if cmd == CMD_GET_PRECEDING else self.graph.forward
+                    completion.result = [self.patterns[pid] for pid in adjacency.neighbors(args[0])]
+            elif cmd in (CMD_GET_NEIGHBORHOOD, CMD_SHORTEST_PATH, CMD_GET_PREREQUISITES):
+                navigate = {
+                    CMD_GET_NEIGHBORHOOD: self._neighborhood_ids,
+                    CMD_SHORTEST_PATH: self._shortest_path_ids,
+                    CMD_GET_PREREQUISITES: self._prerequisite_ids,
+                }[cmd]
+                completion.error, ids = navigate(*args)
+                completion.result = [self.patterns[pid] for pid in ids]
+                return completion
+            elif cmd == CMD_GET_SEQUENCE:
+                sequence = self.sequences.get(args[0])
+                if sequence is not None:
+                    completion.result = list(sequence.patterns)
+            elif cmd == CMD_GET_CATEGORY:
+                category = self.categories.get(args[0])
+                if category is not None:
+                    completion.result = list(category.patterns)
+            else:
+                completion.error = ERR_INVALID_CMD
+                return completion
+        except (IndexError, TypeError, ValueError):
+            completion.error = ERR_TRANSFORM_FAIL if cmd == CMD_TRANSFORM else ERR_INVALID_CMD
+            completion.result = None
+            return completion
+        
+        if completion.result is None:
+            completion.error = ERR_PATTERN_NOT_FOUND
+        return completion
+    
     # === Diagnostics and Telemetry ===
     
     def run_self_test(self) -> bool:
@@ -638,8 +1300,9 @@ class PatternCoprocessorDriver:
     
     def get_telemetry(self) -> NPUTelemetry:
         """Get performance telemetry"""
-        self.telemetry.update_uptime()
-        return self.telemetry
+        telemetry = self.telemetry
+        telemetry.update_uptime()
+        return telemetry
     
     def get_hardware_diagnostics(self) -> str:
         """Get detailed hardware diagnostics"""
@@ -652,9 +1315,18 @@ class PatternCoprocessorDriver:
         diag.append(f"Cache Size: {len(self.cache)}/{self.cache_size}")
         diag.append("")
         
-        telemetry = self.get_telemetry()
+        telemetry = self.get_telemetry().to_dict()
+        commands = telemetry.pop("commands")
         diag.append("=== Performance Metrics ===")
-        for key, value in telemetry.to_dict().items():
+        for key, value in telemetry.items():
             diag.append(f"{key}: {value}")
+        diag.append("")
+        
+        diag.append("=== Command Latency (us) ===")
+        for kind, stats in commands.items():
+            diag.append(
+                f"{kind}: count={stats['count']} p50={stats['p50']} p95={stats['p95']} "
+                f"p99={stats['p99']} max={stats['max']}"
+            )
         
         return "\n".join(diag)
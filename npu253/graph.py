@@ -0,0 +1,224 @@
+"""
+NPU-253 Pattern Graph
+
+CSR adjacency arrays over the pattern language and the multi-hop
+navigation built on them.
+"""
+
+from array import array
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .bitset import bitset_ids
+
+
+DIRECTIONS = ("following", "preceding", "both")
+
+
+class CSRAdjacency:
+    """
+    Compressed sparse row adjacency
+
+    The neighbors of node n are targets[offsets[n]:offsets[n + 1]]. Nodes
+    are pattern IDs, so the arrays are indexed directly without a lookup.
+    The arrays may also be typed memoryviews into a loaded snapshot.
+    """
+
+    def __init__(self, offsets: Sequence[int], targets: Sequence[int]):
+        self.offsets = offsets
+        self.targets = targets
+
+    @classmethod
+    def from_lists(cls, lists: Dict[int, Iterable[int]], size: int) -> "CSRAdjacency":
+        """Build from node -> neighbor lists (size is one past the largest node)"""
+        offsets = array("I", [0]) * (size + 1)
+        targets = array("H")
+        for node in range(size):
+            targets.extend(lists.get(node, ()))
+            offsets[node + 1] = len(targets)
+        return cls(offsets, targets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def neighbors(self, node: int) -> Sequence[int]:
+        if node >= len(self.offsets) - 1:
+            return array("H")
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+
+class PatternGraph:
+    """
+    Navigation structure over pattern links
+
+    Following and preceding links come from separate lists in the source
+    data and are not mirror images of each other, so each direction gets
+    its own CSR array. "both" is the undirected union of all links.
+    Transitive closures are kept as bitsets (bit n set for pattern n).
+    """
+
+    def __init__(self):
+        self.forward = CSRAdjacency(array("I", [0]), array("H"))
+        self.reverse = CSRAdjacency(array("I", [0]), array("H"))
+        self.undirected = CSRAdjacency(array("I", [0]), array("H"))
+        self._closures: Dict[str, Sequence[int]] = {}
+
+    @classmethod
+    def from_arrays(cls, forward: CSRAdjacency, reverse: CSRAdjacency, undirected: CSRAdjacency,
+                    closures: Optional[Dict[str, Sequence[int]]] = None) -> "PatternGraph":
+        """Wrap prebuilt adjacency arrays and closure bitsets (e.g. snapshot views)"""
+        graph = cls()
+        graph.forward = forward
+        graph.reverse = reverse
+        graph.undirected = undirected
+        graph._closures = dict(closures or {})
+        return graph
+
+    def __len__(self) -> int:
+        return len(self.forward)
+
+    def build(self, following: Dict[int, List[int]], preceding: Dict[int, List[int]]) -> None:
+        """Build all adjacency arrays from node -> neighbor lists"""
+        nodes = set(following) | set(preceding)
+        size = max(nodes) + 1 if nodes else 0
+
+        valid = nodes.__contains__
+        following = {n: [m for m in links if valid(m)] for n, links in following.items()}
+        preceding = {n: [m for m in links if valid(m)] for n, links in preceding.items()}
+
+        both: Dict[int, set] = {n: set() for n in nodes}
+        for lists in (following, preceding):
+            for node, links in lists.items():
+                for other in links:
+                    both[node].add(other)
+                    both[other].add(node)
+
+        self.forward = CSRAdjacency.from_lists(following, size)
+        self.reverse = CSRAdjacency.from_lists(preceding, size)
+        self.undirected = CSRAdjacency.from_lists({n: sorted(links) for n, links in both.items()}, size)
+        self._closures = {}
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def adjacency(self, direction: str) -> Optional[CSRAdjacency]:
+        """CSR array for a direction, or None if the direction is unknown"""
+        if direction == "following":
+            return self.forward
+        if direction == "preceding":
+            return self.reverse
+        if direction == "both":
+            return self.undirected
+        return None
+
+    # === Traversal ===
+
+    def neighborhood(self, start: int, hops: int, direction: str = "following") -> List[Tuple[int, int]]:
+        """
+        Nodes within hops links of start, excluding start.
+
+        Returns:
+            (node, distance) pairs ordered by distance, then node
+        """
+        adjacency = self.adjacency(direction)
+        offsets, targets = adjacency.offsets, adjacency.targets
+        seen = {start}
+        frontier = [start]
+        result: List[Tuple[int, int]] = []
+
+        for distance in range(1, hops + 1):
+            reached = []
+            for node in frontier:
+                for i in range(offsets[node], offsets[node + 1]):
+                    other = targets[i]
+                    if other not in seen:
+                        seen.add(other)
+                        reached.append(other)
+            if not reached:
+                break
+            reached.sort()
+            result.extend((node, distance) for node in reached)
+            frontier = reached
+        return result
+
+    def shortest_path(self, source: int, target: int, direction: str = "following") -> List[int]:
+        """Fewest-links path from source to target (both included), or [] if unreachable"""
+        if source == target:
+            return [source]
+
+        adjacency = self.adjacency(direction)
+        offsets, targets = adjacency.offsets, adjacency.targets
+        parent = {source: source}
+        queue = deque([source])
+
+        while queue:
+            node = queue.popleft()
+            for i in range(offsets[node], offsets[node + 1]):
+                other = targets[i]
+                if other in parent:
+                    continue
+                parent[other] = node
+                if other == target:
+                    path = [target]
+                    while path[-1] != source:
+                        path.append(parent[path[-1]])
+                    path.reverse()
+                    return path
+                queue.append(other)
+        return []
+
+    def precompute_closures(self, *directions: str) -> None:
+        """Compute closure bitsets ahead of the first closure() call"""
+        for direction in directions:
+            if direction not in self._closures:
+                self._closures[direction] = self._compute_closures(self.adjacency(direction))
+
+    def closure(self, node: int, direction: str = "preceding") -> int:
+        """Bitset of every node reachable from node in direction"""
+        closures = self._closures.get(direction)
+        if closures is None:
+            self.precompute_closures(direction)
+            closures = self._closures[direction]
+        return closures[node] if node < len(closures) else 0
+
+    def closure_ids(self, node: int, direction: str = "preceding") -> List[int]:
+        """Nodes reachable from node, in ascending order"""
+        return bitset_ids(self.closure(node, direction))
+
+    @staticmethod
+    def _compute_closures(adjacency: CSRAdjacency) -> List[int]:
+        """
+        Reachability bitsets for every node.
+
+        Iterates reach[n] = OR(bit(m) | reach[m]) over neighbors m until
+        nothing changes, which also handles cycles. Links mostly point
+        between nearby pattern numbers, so a few passes suffice.
+        """
+        offsets, targets = adjacency.offsets, adjacency.targets
+        size = len(adjacency)
+        reach = [0] * size
+        # Visit nodes so that most links point at already-updated nodes
+        downward = sum(
+            1 for node in range(size)
+            for i in range(offsets[node], offsets[node + 1]) if targets[i] < node
+        )
+        order = range(size) if 2 * downward >= len(targets) else range(size - 1, -1, -1)
+        changed = True
+        while changed:
+            changed = False
+            for node in order:
+                bits = reach[node]
+                for i in range(offsets[node], offsets[node + 1]):
+                    other = targets[i]
+                    bits |= (1 << other) | reach[other]
+                if bits != reach[node]:
+                    reach[node] = bits
+                    changed = True
+        for node in range(size):
+            reach[node] &= ~(1 << node)
+        return reach
+
@@ -0,0 +1,162 @@
+"""
+NPU-253 Streaming Statistics
+
+Constant-time latency histograms and rate meters for device telemetry.
+"""
+
+import math
+import time
+from typing import Dict, List, Optional, Sequence
+
+
+SUB_BUCKET_BITS = 5  # 32 buckets per power of two: <= 3.2% relative error
+MIN_EXPONENT = -10   # Values below ~0.001 share the first bucket
+MAX_EXPONENT = 40    # Values above ~1e12 share the last bucket
+
+_SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+_BUCKET_COUNT = (MAX_EXPONENT - MIN_EXPONENT + 1) * _SUB_BUCKETS
+
+
+def _bucket_index(value: float) -> int:
+    """Log-linear bucket for a value: exponent selects the octave, mantissa the sub-bucket"""
+    if value <= 0.0:
+        return 0
+    mantissa, exponent = math.frexp(value)  # value = mantissa * 2**exponent, 0.5 <= mantissa < 1
+    if exponent <= MIN_EXPONENT:
+        return 0
+    if exponent > MAX_EXPONENT:
+        return _BUCKET_COUNT - 1
+    sub = int((mantissa - 0.5) * 2 * _SUB_BUCKETS)
+    return (exponent - MIN_EXPONENT) * _SUB_BUCKETS + sub
+
+
+def _bucket_midpoint(index: int) -> float:
+    """Representative value of a bucket"""
+    exponent, sub = divmod(index, _SUB_BUCKETS)
+    width = math.ldexp(1.0, exponent + MIN_EXPONENT - 1) / _SUB_BUCKETS
+    return math.ldexp(1.0, exponent + MIN_EXPONENT - 1) + (sub + 0.5) * width
+
+
+class LatencyHistogram:
+    """
+    Streaming log-bucketed histogram (HDR-style)
+
+    Recording is O(1): one frexp and a list increment. Count, sum, min and
+    max are exact; percentiles are accurate to the bucket width, about 3%
+    of the value, and are clamped to the observed min/max.
+    """
+
+    def __init__(self):
+        self.counts: List[int] = [0] * _BUCKET_COUNT
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def record(self, value: float, count: int = 1) -> None:
+        """Add count observations of value"""
+        self.counts[_bucket_index(value)] += count
+        self.count += count
+        self.total += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's observations to this one"""
+        if not other.count:
+            return
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentiles(self, quantiles: Sequence[float]) -> List[float]:
+        """Values at the given quantiles (0-1), in a single pass over the buckets"""
+        if not self.count:
+            return [0.0] * len(quantiles)
+
+        order = sorted(range(len(quantiles)), key=lambda i: quantiles[i])
+        ranks = [max(1, math.ceil(quantiles[i] * self.count)) for i in order]
+        results = [0.0] * len(quantiles)
+
+        k = 0
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if not bucket_count:
+                continue
+            seen += bucket_count
+            while k < len(order) and seen >= ranks[k]:
+                value = _bucket_midpoint(index)
+                results[order[k]] = min(max(value, self.min), self.max)
+                k += 1
+            if k == len(order):
+                break
+        return results
+
+    def percentile(self, quantile: float) -> float:
+        """Value at a quantile (0-1)"""
+        return self.percentiles([quantile])[0]
+
+    def summary(self) -> Dict:
+        """Count, mean, p50/p95/p99 and max, rounded for reporting"""
+        p50, p95, p99 = self.percentiles([0.50, 0.95, 0.99])
+        return {
+            "count": self.count,
+            "mean": round(self.mean, 2),
+            "p50": round(p50, 2),
+            "p95": round(p95, 2),
+            "p99": round(p99, 2),
+            "max": round(self.max, 2),
+        }
+
+
+class EWMARate:
+    """
+    Exponentially weighted events-per-second meter
+
+    Each event adds 1/window to a rate that decays continuously with time
+    constant window, so marking is O(1) and needs no timer tick. Readings
+    are bias-corrected for meters younger than the window.
+    """
+
+    def __init__(self, window_s: float = 60.0, start_time: Optional[float] = None):
+        self.window_s = window_s
+        self.start_time = time.monotonic() if start_time is None else start_time
+        self._rate = 0.0
+        self._last = self.start_time
+
+    def mark(self, events: int = 1, now: Optional[float] = None) -> None:
+        """Record events happening now"""
+        now = time.monotonic() if now is None else now
+        if now > self._last:
+            self._rate *= math.exp((self._last - now) / self.window_s)
+            self._last = now
+        self._rate += events / self.window_s
+
+    def _decayed(self, now: float) -> float:
+        return self._rate * math.exp(min(0.0, self._last - now) / self.window_s)
+
+    def rate(self, now: Optional[float] = None) -> float:
+        """Current events per second"""
+        now = time.monotonic() if now is None else now
+        age = now - self.start_time
+        if age <= 0.0:
+            return 0.0
+        return self._decayed(now) / -math.expm1(-age / self.window_s)
+
+    def merge(self, other: "EWMARate") -> None:
+        """Add another meter's rate to this one"""
+        now = max(self._last, other._last)
+        self._rate = self._decayed(now) + other._decayed(now)
+        self._last = now
+        self.start_time = min(self.start_time, other.start_time)
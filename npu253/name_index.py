@@ -0,0 +1,100 @@
+"""
+NPU-253 Name Index
+
+Normalized-name hash index with a trigram fallback for fuzzy lookup.
+"""
+
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+
+NON_WORD_RE = re.compile(r"[^\w\s]|_")
+SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_name(name: str) -> str:
+    """Casefold, strip punctuation and asterisks, collapse whitespace"""
+    return SPACE_RE.sub(" ", NON_WORD_RE.sub(" ", name.casefold())).strip()
+
+
+def trigrams(text: str) -> Set[str]:
+    """Character trigrams of a normalized string, padded at word edges"""
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """
+    Pattern name lookup table
+
+    Exact lookups hash the normalized name. Fuzzy lookups walk the
+    trigram postings of the query, so only patterns sharing at least one
+    trigram are considered, and rank them by trigram Jaccard similarity.
+    """
+
+    def __init__(self):
+        self.exact: Dict[str, int] = {}
+        self.trigram_postings: Dict[str, Set[int]] = {}
+        self.trigram_counts: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.trigram_counts)
+
+    def add(self, key: int, name: str, *aliases: str) -> None:
+        """
+        Register a pattern name.
+
+        All names resolve exactly; only the primary name feeds the trigram
+        index so aliases do not dilute fuzzy similarity.
+        """
+        for alias in (name,) + aliases:
+            normalized = normalize_name(alias)
+            if normalized:
+                self.exact.setdefault(normalized, key)
+
+        grams = trigrams(normalize_name(name))
+        for gram in grams:
+            self.trigram_postings.setdefault(gram, set()).add(key)
+        self.trigram_counts[key] = len(grams)
+
+    def clear(self) -> None:
+        """Drop all registered names"""
+        self.exact.clear()
+        self.trigram_postings.clear()
+        self.trigram_counts.clear()
+
+    def lookup(self, name: str) -> Optional[int]:
+        """Exact lookup on the normalized name"""
+        return self.exact.get(normalize_name(name))
+
+    def fuzzy_lookup(self, name: str, threshold: float = 0.5) -> Optional[Tuple[int, float]]:
+        """
+        Best trigram match for a name.
+
+        Returns:
+            (key, similarity) for the closest name scoring at least
+            threshold, or None
+        """
+        matches = self.fuzzy_candidates(name, limit=1)
+        if matches and matches[0][1] >= threshold:
+            return matches[0]
+        return None
+
+    def fuzzy_candidates(self, name: str, limit: int = 5) -> List[Tuple[int, float]]:
+        """Closest names by trigram Jaccard similarity, best first"""
+        normalized = normalize_name(name)
+        if not normalized:
+            return []
+
+        query_grams = trigrams(normalized)
+        shared: Dict[int, int] = {}
+        for gram in query_grams:
+            for key in self.trigram_postings.get(gram, ()):
+                shared[key] = shared.get(key, 0) + 1
+
+        scored = [
+            (key, count / (len(query_grams) + self.trigram_counts[key] - count))
+            for key, count in shared.items()
+        ]
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:limit]
@@ -7,6 +7,11 @@ Data classes for representing patterns and their metadata.
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 
+from .template import CompiledTemplate, render_domains
+
+
+DOMAINS = ("physical", "social", "conceptual", "individual")
+
 
 @dataclass
 class PatternMetadata:
@@ -36,28 +41,51 @@ class ArchetypalPattern:
     placeholders: List[str] = field(default_factory=list)
     domain_mappings: Dict[str, Dict[str, str]] = field(default_factory=dict)
     
+    # Compiled template and per-domain renderings (built on first use)
+    _template: Optional[CompiledTemplate] = field(default=None, init=False, repr=False, compare=False)
+    _renderings: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def compile(self) -> CompiledTemplate:
+        """
+        Compile the template into literal and placeholder segments.
+        
+        Only listed placeholders with domain mappings become slots; any
+        others render unchanged.
+        """
+        slots = [name for name in self.placeholders if name in self.domain_mappings]
+        self._template = CompiledTemplate(self.archetypal_pattern, slots)
+        return self._template
+    
+    def render(self, domain: str) -> str:
+        """Render the compiled template for a domain in a single pass"""
+        template = self._template if self._template is not None else self.compile()
+        return template.render_domain(self.domain_mappings, domain, default="{placeholder}")
+    
+    def precompute(self) -> Dict[str, str]:
+        """(Re)compile the template and render all four domains"""
+        template = self.compile()
+        self._renderings = render_domains(template, self.domain_mappings, DOMAINS, default="{placeholder}")
+        return self._renderings
+    
     def transform_to_domain(self, domain: str) -> str:
         """
         Transform archetypal pattern to specific domain.
         
+        Renderings are computed once for all domains and then returned
+        from cache; call precompute() after editing the template or
+        mappings.
+        
         Args:
             domain: One of "physical", "social", "conceptual", "individual"
             
         Returns:
             Transformed pattern string with placeholders replaced
         """
-        if domain not in ["physical", "social", "conceptual", "individual"]:
-            raise ValueError(f"Invalid domain: {domain}")
-        
-        result = self.archetypal_pattern
-        
-        # Replace each placeholder with domain-specific value
-        for placeholder in self.placeholders:
-            if placeholder in self.domain_mappings:
-                domain_value = self.domain_mappings[placeholder].get(domain, f"{{placeholder}}")
-                result = result.replace(f"{{{{{placeholder}}}}}", domain_value)
-        
-        return result
+        renderings = self._renderings if self._renderings is not None else self.precompute()
+        try:
+            return renderings[domain]
+        except KeyError:
+            raise ValueError(f"Invalid domain: {domain}") from None
 
 
 @dataclass
@@ -68,6 +96,8 @@ class PatternSequence:
     description: str
     emergent_phenomena: str
     pattern_ids: List[int] = field(default_factory=list)
+    bitset: int = 0  # Bit n set if pattern n is in the sequence
+    patterns: tuple = field(default=(), repr=False, compare=False)  # Loaded members, in sequence order
 
 
 @dataclass
@@ -77,3 +107,5 @@ class PatternCategory:
     description: str
     pattern_range: tuple  # (start_id, end_id)
     pattern_ids: List[int] = field(default_factory=list)
+    bitset: int = 0  # Bit n set if pattern n is in the category
+    patterns: tuple = field(default=(), repr=False, compare=False)  # Members, in ID order
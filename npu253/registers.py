@@ -8,6 +8,8 @@ Memory-mapped I/O register addresses and command/status/error codes.
 REG_BASE = 0x50000000
 PATTERN_BASE = 0x50001000
 ARCHETYPAL_BASE = 0x50100000
+SQ_BASE = 0x50200000         # Submission ring
+CQ_BASE = 0x50280000         # Completion ring
 
 # Register offsets from REG_BASE
 REG_CMD = 0x00              # Command register
@@ -25,6 +27,11 @@ REG_ERROR_CODE = 0x34       # Last error code
 REG_PERF_QUERIES = 0x38     # Total queries processed
 REG_PERF_TRANSFORMS = 0x3C  # Total transformations
 REG_PERF_AVG_TIME_US = 0x40 # Average query time (microseconds)
+REG_SQ_HEAD = 0x44          # Submission ring head (next entry to execute)
+REG_SQ_TAIL = 0x48          # Submission ring tail (next free slot)
+REG_CQ_HEAD = 0x4C          # Completion ring head (next entry to reap)
+REG_CQ_TAIL = 0x50          # Completion ring tail (next free slot)
+REG_RING_SIZE = 0x54        # Entries per ring
 
 # Command codes
 CMD_RESET = 0x00           # Reset device state
@@ -38,6 +45,10 @@ CMD_GET_FOLLOWING = 0x07   # Get following patterns
 CMD_GET_SEQUENCE = 0x08    # Get pattern sequence
 CMD_GET_CATEGORY = 0x09    # Get patterns by category
 CMD_SELF_TEST = 0x0A       # Run self-diagnostics
+CMD_PROCESS_RING = 0x0B    # Execute queued submission ring entries
+CMD_GET_NEIGHBORHOOD = 0x0C  # Get patterns within k links
+CMD_SHORTEST_PATH = 0x0D     # Get shortest link path between two patterns
+CMD_GET_PREREQUISITES = 0x0E # Get transitive closure of preceding patterns
 
 # Status bits
 STATUS_IDLE = 0x01            # Device ready for commands
@@ -57,6 +68,7 @@ ERR_QUERY_TIMEOUT = 0x04     # Query timed out
 ERR_TRANSFORM_FAIL = 0x05    # Transformation failed
 ERR_MEMORY_ERROR = 0x06      # Memory access error
 ERR_NOT_LOADED = 0x07        # Patterns not loaded
+ERR_RING_FULL = 0x08         # Submission ring full
 
 # Domain modes
 DOMAIN_NONE = 0
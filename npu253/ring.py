@@ -0,0 +1,76 @@
+"""
+NPU-253 Command Rings
+
+Submission/completion queue structures for batched command execution.
+"""
+
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from .registers import ERR_NONE
+
+
+@dataclass
+class SubmissionEntry:
+    """A command queued on the submission ring"""
+    tag: int
+    cmd: int
+    args: tuple = ()
+
+
+@dataclass
+class CompletionEntry:
+    """Result of a ring command, posted to the completion ring"""
+    tag: int
+    cmd: int
+    error: int = ERR_NONE
+    result: Any = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error == ERR_NONE
+
+
+class CommandRing:
+    """
+    Fixed-capacity circular queue
+
+    Head and tail are free-running counters, as in hardware rings: the
+    slot index is counter % size and the ring holds tail - head entries.
+    """
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError(f"Invalid ring size: {size}")
+        self.size = size
+        self.slots: List[Any] = [None] * size
+        self.head = 0
+        self.tail = 0
+
+    def __len__(self) -> int:
+        return self.tail - self.head
+
+    def is_full(self) -> bool:
+        return self.tail - self.head >= self.size
+
+    def push(self, entry: Any) -> bool:
+        """Append an entry at the tail; False if the ring is full"""
+        if self.is_full():
+            return False
+        self.slots[self.tail % self.size] = entry
+        self.tail += 1
+        return True
+
+    def pop(self) -> Optional[Any]:
+        """Remove and return the entry at the head, or None if empty"""
+        if self.head == self.tail:
+            return None
+        slot = self.head % self.size
+        entry = self.slots[slot]
+        self.slots[slot] = None
+        self.head += 1
+        return entry
+
+    def clear(self) -> None:
+        self.slots = [None] * self.size
+        self.head = self.tail = 0
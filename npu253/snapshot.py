@@ -0,0 +1,459 @@
+"""
+NPU-253 Binary Snapshot
+
+Versioned, checksummed columnar image of the device memory: patterns,
+archetypal patterns with their domain renderings, sequences, and the
+derived indexes (text index, name index, graph adjacency and prerequisite
+closures). Loading one skips JSON parsing and every index build. The file
+is memory-mapped; the graph arrays and closure bitsets stay views into the
+mapping, so processes loading the same snapshot share those pages, while
+everything else is decoded into ordinary objects per process. The header
+records a SHA-256 digest of the JSON sources, and a snapshot is only used
+while it matches.
+
+Layout (little-endian):
+
+    header    magic[8] version:u16 section_count:u16 crc32:u32 payload_len:u64 source_digest[32]
+    sections  section_count x (name[12] typecode[1] pad[3] offset:u64 length:u64)
+    payload   8-byte aligned section data; crc32 covers the whole payload
+
+Typed sections are raw arrays ('B', 'H', 'I'); strings live in one UTF-8
+blob addressed by an offsets array. Ragged lists (postings, trigrams)
+are stored as a flat values array plus an offsets ("_ptr") array.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Union
+
+from .bitset import PackedBitsets
+from .graph import CSRAdjacency, PatternGraph
+from .name_index import NameIndex
+from .patterns import PatternMetadata, ArchetypalPattern, PatternSequence, DOMAINS
+from .text_index import TextIndex
+
+
+SNAPSHOT_MAGIC = b"NPU253SS"
+SNAPSHOT_VERSION = 3
+
+_HEADER = struct.Struct("<8sHHIQ32s")
+_SECTION = struct.Struct("<12sc3xQQ")
+_ALIGN = 8
+
+# Graph adjacency attributes and their section name prefixes
+_GRAPH_ARRAYS = {"forward": "gr_fwd", "reverse": "gr_rev", "undirected": "gr_und"}
+
+# String fields of PatternMetadata and their section names
+_PATTERN_TEXT_FIELDS = {
+    "name": "pat_name",
+    "category": "pat_cat",
+    "context": "pat_ctx",
+    "problem_summary": "pat_psum",
+    "problem_details": "pat_pdet",
+    "solution": "pat_sol",
+    "diagram": "pat_diag",
+    "connections": "pat_conn",
+}
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot is missing, stale, corrupt or of another version"""
+
+
+def source_digest(source_paths: List[Union[str, Path]]) -> bytes:
+    """SHA-256 over the contents of the source files (missing files count too)"""
+    h = hashlib.sha256()
+    for source in source_paths:
+        try:
+            with open(source, "rb") as f:
+                data = f.read()
+        except OSError:
+            h.update(b"\xff" * 8)
+            continue
+        h.update(struct.pack("<Q", len(data)))
+        h.update(data)
+    return h.digest()
+
+
+def is_fresh(snapshot_path: Union[str, Path], digest: bytes) -> bool:
+    """True if the snapshot exists and was written from sources with this digest"""
+    try:
+        with open(snapshot_path, "rb") as f:
+            header = f.read(_HEADER.size)
+    except OSError:
+        return False
+    if len(header) < _HEADER.size:
+        return False
+    magic, version, _, _, _, snapshot_digest = _HEADER.unpack(header)
+    return magic == SNAPSHOT_MAGIC and version == SNAPSHOT_VERSION and snapshot_digest == digest
+
+
+class _SnapshotWriter:
+    """Accumulates sections and interned strings for a snapshot file"""
+
+    def __init__(self):
+        self.sections: Dict[str, array] = {}
+        self._strings: Dict[str, int] = {}
+        self._string_data = bytearray()
+        self._string_offsets = array("I", [0])
+
+    def string(self, value: str) -> int:
+        """Intern a string and return its index"""
+        index = self._strings.get(value)
+        if index is None:
+            index = len(self._strings)
+            self._strings[value] = index
+            self._string_data += value.encode("utf-8")
+            self._string_offsets.append(len(self._string_data))
+        return index
+
+    def column(self, name: str, typecode: str, values) -> None:
+        self.sections[name] = array(typecode, values)
+
+    def ragged(self, name: str, typecode: str, lists) -> None:
+        """Store a list of lists as flat values plus offsets"""
+        values = array(typecode)
+        offsets = array("I", [0])
+        for items in lists:
+            values.extend(items)
+            offsets.append(len(values))
+        self.sections[name] = values
+        self.sections[name + "_ptr"] = offsets
+
+    def write(self, path: Union[str, Path], digest: bytes) -> None:
+        """Serialize all sections and atomically replace path"""
+        sections = dict(self.sections)
+        sections["str_ptr"] = self._string_offsets
+        sections["str_data"] = array("B", bytes(self._string_data))
+
+        table = []
+        payload = bytearray()
+        for name, values in sections.items():
+            payload += b"\0" * (-len(payload) % _ALIGN)
+            if sys.byteorder != "little" and values.itemsize > 1:
+                values = array(values.typecode, values)
+                values.byteswap()
+            data = values.tobytes()
+            table.append((name, values.typecode, len(payload), len(data)))
+            payload += data
+
+        # Section offsets are absolute so readers can slice the mmap directly
+        base = _HEADER.size + _SECTION.size * len(table)
+        base += -base % _ALIGN
+        header = _HEADER.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(table),
+            zlib.crc32(payload), len(payload), digest,
+        )
+        section_table = b"".join(
+            _SECTION.pack(name.encode("ascii"), typecode.encode("ascii"), base + offset, length)
+            for name, typecode, offset, length in table
+        )
+
+        tmp_path = Path(f"{path}.tmp{os.getpid()}")
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.write(section_table)
+            f.write(b"\0" * (base - len(header) - len(section_table)))
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+
+class _SnapshotReader:
+    """Typed views over the sections of a memory-mapped snapshot file"""
+
+    def __init__(self, path: Union[str, Path]):
+        try:
+            with open(path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise SnapshotError(f"Cannot read snapshot {path}: {e}") from e
+
+        self._view = memoryview(self._map)
+        self.sections: Dict[str, memoryview] = {}
+        self._kept = set()
+        try:
+            self._parse()
+        except SnapshotError:
+            self.close()
+            raise
+
+    def _parse(self) -> None:
+        view = self._view
+        if len(view) < _HEADER.size:
+            raise SnapshotError("Truncated snapshot header")
+        magic, version, section_count, crc, payload_len, self.digest = _HEADER.unpack_from(view, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotError("Not an NPU-253 snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotError(f"Unsupported snapshot version {version}")
+
+        base = _HEADER.size + _SECTION.size * section_count
+        base += -base % _ALIGN
+        if len(view) != base + payload_len:
+            raise SnapshotError("Truncated snapshot payload")
+        payload = view[base:]
+        checksum = zlib.crc32(payload)
+        payload.release()
+        if checksum != crc:
+            raise SnapshotError("Snapshot checksum mismatch")
+
+        try:
+            for i in range(section_count):
+                name, typecode, offset, length = _SECTION.unpack_from(view, _HEADER.size + i * _SECTION.size)
+                data = view[offset:offset + length]
+                if sys.byteorder != "little" and typecode != b"B":
+                    swapped = array(typecode.decode("ascii"), data.tobytes())
+                    swapped.byteswap()
+                    data.release()
+                    data = memoryview(swapped.tobytes())
+                self.sections[name.rstrip(b"\0").decode("ascii")] = data.cast(typecode.decode("ascii"))
+
+            # Interned strings are decoded once; columns hold indexes into this table
+            blob = self.sections["str_data"].tobytes()
+            offsets = self.sections["str_ptr"].tolist()
+            self.string_table = [
+                blob[offsets[i]:offsets[i + 1]].decode("utf-8")
+                for i in range(len(offsets) - 1)
+            ]
+        except (struct.error, KeyError, TypeError, ValueError, UnicodeDecodeError) as e:
+            raise SnapshotError(f"Malformed snapshot section table: {e}") from e
+
+    def keep(self, name: str) -> memoryview:
+        """Section view that stays valid (and keeps the mapping open) after close()"""
+        self._kept.add(name)
+        return self.sections[name]
+
+    def close(self) -> None:
+        """Release every section not handed out by keep()"""
+        for name, section in self.sections.items():
+            if name not in self._kept:
+                section.release()
+        self.sections.clear()
+        self._view.release()
+        if not self._kept:
+            self._map.close()
+        self._map = None
+
+    def strings(self, name: str) -> List[str]:
+        table = self.string_table
+        return [table[i] for i in self.sections[name]]
+
+    def ragged(self, name: str) -> List[List[int]]:
+        values = self.sections[name].tolist()
+        offsets = self.sections[name + "_ptr"].tolist()
+        return [values[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+
+class _PostingsView(Mapping):
+    """
+    Read-only term -> {doc_id: positions} mapping over snapshot sections
+
+    Terms are decoded up front; each term's postings are decoded from the
+    mapped sections the first time a query touches the term.
+    """
+
+    def __init__(self, terms: List[str], docs, doc_ptr, positions, position_ptr):
+        self._rows = {term: row for row, term in enumerate(terms)}
+        self._docs = docs
+        self._doc_ptr = doc_ptr
+        self._positions = positions
+        self._position_ptr = position_ptr
+        self._decoded: Dict[str, Dict[int, List[int]]] = {}
+
+    def __getitem__(self, term: str) -> Dict[int, List[int]]:
+        postings = self._decoded.get(term)
+        if postings is None:
+            row = self._rows[term]
+            start, end = self._doc_ptr[row], self._doc_ptr[row + 1]
+            ptr = self._position_ptr
+            postings = {
+                self._docs[k]: self._positions[ptr[k]:ptr[k + 1]].tolist()
+                for k in range(start, end)
+            }
+            self._decoded[term] = postings
+        return postings
+
+    def __contains__(self, term) -> bool:
+        return term in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+def write_snapshot(path: Union[str, Path], patterns: Dict[int, PatternMetadata],
+                   archetypal_patterns: Dict[str, ArchetypalPattern],
+                   sequences: Dict[int, PatternSequence], text_index: TextIndex,
+                   name_index: NameIndex, graph: PatternGraph, digest: bytes = b"") -> None:
+    """Write device memory and its indexes to a snapshot file, recording the source digest"""
+    w = _SnapshotWriter()
+
+    # APL patterns
+    rows = list(patterns.values())
+    w.column("pat_id", "H", [p.pattern_id for p in rows])
+    w.column("pat_stars", "B", [p.asterisks for p in rows])
+    for field_name, section in _PATTERN_TEXT_FIELDS.items():
+        w.column(section, "I", [w.string(getattr(p, field_name)) for p in rows])
+    w.ragged("pat_prec", "H", [p.preceding_patterns for p in rows])
+    w.ragged("pat_foll", "H", [p.following_patterns for p in rows])
+    w.ragged("pat_seqs", "H", [p.sequence_memberships for p in rows])
+
+    # Archetypal patterns, with their renderings in DOMAINS order
+    rows = list(archetypal_patterns.values())
+    w.column("arc_id", "I", [w.string(p.pattern_id) for p in rows])
+    w.column("arc_name", "I", [w.string(p.name) for p in rows])
+    w.column("arc_text", "I", [w.string(p.archetypal_pattern) for p in rows])
+    w.column("arc_orig", "I", [w.string(p.original_template) for p in rows])
+    w.ragged("arc_ph", "I", [[w.string(ph) for ph in p.placeholders] for p in rows])
+    w.ragged("arc_map", "I", [
+        [w.string(s) for placeholder, values in p.domain_mappings.items()
+         for domain, value in values.items() for s in (placeholder, domain, value)]
+        for p in rows
+    ])
+    w.ragged("arc_rend", "I", [[w.string(p.transform_to_domain(d)) for d in DOMAINS] for p in rows])
+
+    # Sequences
+    rows = list(sequences.values())
+    w.column("seq_id", "H", [s.sequence_id for s in rows])
+    w.column("seq_name", "I", [w.string(s.name) for s in rows])
+    w.column("seq_desc", "I", [w.string(s.description) for s in rows])
+    w.column("seq_emerg", "I", [w.string(s.emergent_phenomena) for s in rows])
+    w.ragged("seq_pats", "H", [s.pattern_ids for s in rows])
+
+    # Text index: term -> docs, (term, doc) -> positions
+    terms = list(text_index.postings)
+    w.column("idx_term", "I", [w.string(t) for t in terms])
+    w.ragged("idx_doc", "H", [list(text_index.postings[t]) for t in terms])
+    w.ragged("idx_pos", "I", [pos for t in terms for pos in text_index.postings[t].values()])
+    w.column("idx_dlid", "H", list(text_index.doc_lengths))
+    w.column("idx_dlen", "I", list(text_index.doc_lengths.values()))
+
+    # Name index: exact names, trigram postings and per-pattern trigram counts
+    w.column("nm_name", "I", [w.string(name) for name in name_index.exact])
+    w.column("nm_id", "H", list(name_index.exact.values()))
+    grams = list(name_index.trigram_postings)
+    w.column("nm_gram", "I", [w.string(g) for g in grams])
+    w.ragged("nm_gids", "H", [sorted(name_index.trigram_postings[g]) for g in grams])
+    w.column("nm_cnt_id", "H", list(name_index.trigram_counts))
+    w.column("nm_cnt", "H", list(name_index.trigram_counts.values()))
+
+    # Graph: CSR arrays per direction and the prerequisite closures
+    for attr, prefix in _GRAPH_ARRAYS.items():
+        adjacency = getattr(graph, attr)
+        w.column(prefix + "_off", "I", adjacency.offsets)
+        w.column(prefix + "_tgt", "H", adjacency.targets)
+    closures, width = PackedBitsets.pack([graph.closure(n, "preceding") for n in range(len(graph))])
+    w.column("gr_prec", "B", closures)
+    w.column("gr_prec_w", "I", [width])
+
+    w.write(path, digest)
+
+
+def read_snapshot(path: Union[str, Path], text_index: TextIndex,
+                  digest: Optional[bytes] = None) -> dict:
+    """
+    Read device memory from a snapshot file.
+
+    Populates text_index in place and returns a dict with "patterns",
+    "archetypal_patterns", "sequences", "name_index" and "graph". The
+    graph arrays and text postings are views into the memory-mapped file.
+
+    Raises:
+        SnapshotError: if the file is unreadable, corrupt or of another
+            version, or was written from sources other than digest
+    """
+    r = _SnapshotReader(path)
+    if digest is not None and r.digest != digest:
+        r.close()
+        raise SnapshotError("Snapshot is stale")
+    try:
+        columns = {f: r.strings(section) for f, section in _PATTERN_TEXT_FIELDS.items()}
+        preceding = r.ragged("pat_prec")
+        following = r.ragged("pat_foll")
+        memberships = r.ragged("pat_seqs")
+        patterns = {}
+        for i, (pattern_id, asterisks) in enumerate(zip(r.sections["pat_id"], r.sections["pat_stars"])):
+            patterns[pattern_id] = PatternMetadata(
+                pattern_id=pattern_id,
+                asterisks=asterisks,
+                preceding_patterns=preceding[i],
+                following_patterns=following[i],
+                sequence_memberships=memberships[i],
+                **{f: columns[f][i] for f in _PATTERN_TEXT_FIELDS}
+            )
+
+        table = r.string_table
+        placeholders = r.ragged("arc_ph")
+        mappings = r.ragged("arc_map")
+        renderings = r.ragged("arc_rend")
+        archetypal_patterns = {}
+        for i, (pid, name, text, orig) in enumerate(zip(
+                r.strings("arc_id"), r.strings("arc_name"),
+                r.strings("arc_text"), r.strings("arc_orig"))):
+            domain_mappings: Dict[str, Dict[str, str]] = {}
+            triples = mappings[i]
+            for j in range(0, len(triples), 3):
+                placeholder, domain, value = triples[j], triples[j + 1], triples[j + 2]
+                domain_mappings.setdefault(table[placeholder], {})[table[domain]] = table[value]
+            pattern = archetypal_patterns[pid] = ArchetypalPattern(
+                pattern_id=pid,
+                name=name,
+                archetypal_pattern=text,
+                original_template=orig,
+                placeholders=[table[k] for k in placeholders[i]],
+                domain_mappings=domain_mappings,
+            )
+            # The template itself is compiled on the first render() call
+            pattern._renderings = {domain: table[k] for domain, k in zip(DOMAINS, renderings[i])}
+
+        sequence_patterns = r.ragged("seq_pats")
+        sequences = {}
+        for i, (sid, name, desc, emerg) in enumerate(zip(
+                r.sections["seq_id"], r.strings("seq_name"),
+                r.strings("seq_desc"), r.strings("seq_emerg"))):
+            sequences[sid] = PatternSequence(
+                sequence_id=sid,
+                name=name,
+                description=desc,
+                emergent_phenomena=emerg,
+                pattern_ids=sequence_patterns[i],
+            )
+
+        text_index.clear()
+        text_index.postings = _PostingsView(
+            r.strings("idx_term"), r.keep("idx_doc"), r.keep("idx_doc_ptr"),
+            r.keep("idx_pos"), r.keep("idx_pos_ptr"),
+        )
+        text_index.doc_lengths.update(zip(r.sections["idx_dlid"], r.sections["idx_dlen"]))
+        text_index.finalize()
+
+        name_index = NameIndex()
+        name_index.exact.update(zip(r.strings("nm_name"), r.sections["nm_id"]))
+        name_index.trigram_postings.update(zip(r.strings("nm_gram"), map(set, r.ragged("nm_gids"))))
+        name_index.trigram_counts.update(zip(r.sections["nm_cnt_id"], r.sections["nm_cnt"]))
+
+        graph = PatternGraph.from_arrays(
+            *(CSRAdjacency(r.keep(prefix + "_off"), r.keep(prefix + "_tgt")) for prefix in _GRAPH_ARRAYS.values()),
+            closures={"preceding": PackedBitsets(r.keep("gr_prec"), r.sections["gr_prec_w"][0])},
+        )
+    except (KeyError, IndexError, ValueError, UnicodeDecodeError) as e:
+        raise SnapshotError(f"Malformed snapshot: {e}") from e
+    finally:
+        r.close()
+
+    return {
+        "patterns": patterns,
+        "archetypal_patterns": archetypal_patterns,
+        "sequences": sequences,
+        "name_index": name_index,
+        "graph": graph,
+    }
@@ -5,9 +5,12 @@ Performance monitoring and configuration structures.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, List, Optional
+import threading
 import time
 
+from .histogram import LatencyHistogram, EWMARate
+
 
 @dataclass
 class NPUConfig:
@@ -19,6 +22,17 @@ class NPUConfig:
     pattern_data_path: str = "pattern_language_generated.json"
     archetypal_data_path: str = "archetypal_patterns.json"
     sequences_data_path: str = "pattern_sequences.json"
+    text_search_mode: str = "substring"  # "substring" or "bm25" (inverted index)
+    name_match_threshold: float = 0.5  # Minimum trigram similarity for fuzzy name lookup
+    snapshot_path: Optional[str] = None  # Binary snapshot used while the JSON sources are unchanged
+    ring_size: int = 256  # Entries per submission/completion ring
+    concurrent: bool = False  # Safe to share between threads without an external lock (not faster)
+    cache_stripes: int = 16  # Upper bound on pattern cache lock stripes in concurrent mode
+
+
+# Command kinds with their own latency histograms
+COMMAND_KINDS = ("id", "name", "text", "transform", "navigation")
+QUERY_KINDS = ("id", "name", "text")
 
 
 @dataclass
@@ -33,43 +47,131 @@ class NPUTelemetry:
     uptime_seconds: float = 0.0
     start_time: float = field(default_factory=time.time)
     
-    # Per-operation timing
-    query_times: list = field(default_factory=list)
-    transform_times: list = field(default_factory=list)
+    # Streaming latency histograms (microseconds) and throughput
+    query_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    command_latency: Dict[str, LatencyHistogram] = field(
+        default_factory=lambda: {kind: LatencyHistogram() for kind in COMMAND_KINDS}
+    )
+    throughput: EWMARate = field(default_factory=EWMARate)
     
     def update_uptime(self) -> None:
         """Update uptime calculation"""
         self.uptime_seconds = time.time() - self.start_time
     
-    def record_query_time(self, time_us: float) -> None:
-        """Record a query execution time"""
-        self.query_times.append(time_us)
+    def record_query_time(self, time_us: float, command: Optional[str] = None) -> None:
+        """Record a query execution time (command: "id", "name" or "text")"""
+        self.query_latency.record(time_us)
+        if command:
+            self.command_latency[command].record(time_us)
         self.total_queries += 1
-        
-        # Update rolling average
-        if len(self.query_times) > 1000:
-            self.query_times = self.query_times[-1000:]  # Keep last 1000
-        self.avg_query_time_us = sum(self.query_times) / len(self.query_times)
+        self.avg_query_time_us = self.query_latency.mean
+        self.throughput.mark()
     
     def record_transform_time(self, time_us: float) -> None:
         """Record a transformation execution time"""
-        self.transform_times.append(time_us)
+        self.command_latency["transform"].record(time_us)
         self.total_transformations += 1
+        self.throughput.mark()
+    
+    def record_navigation_time(self, time_us: float) -> None:
+        """Record a preceding/following navigation time"""
+        self.command_latency["navigation"].record(time_us)
+        self.total_navigations += 1
+        self.throughput.mark()
+    
+    def record_batch(self, commands: Dict[str, int], time_us: float) -> None:
+        """Record a batch of ring commands (counts per command kind) that together took time_us"""
+        total = sum(commands.values())
+        if total == 0:
+            return
+        per_command_us = time_us / total
         
-        # Keep rolling window
-        if len(self.transform_times) > 1000:
-            self.transform_times = self.transform_times[-1000:]
+        for kind, count in commands.items():
+            if count:
+                self.command_latency[kind].record(per_command_us, count)
+        
+        queries = sum(commands.get(kind, 0) for kind in QUERY_KINDS)
+        if queries:
+            self.query_latency.record(per_command_us, queries)
+            self.total_queries += queries
+            self.avg_query_time_us = self.query_latency.mean
+        self.total_transformations += commands.get("transform", 0)
+        self.total_navigations += commands.get("navigation", 0)
+        self.throughput.mark(total)
+    
+    def merge(self, other: "NPUTelemetry") -> None:
+        """Add another telemetry record's counters and histograms to this one"""
+        self.total_queries += other.total_queries
+        self.total_transformations += other.total_transformations
+        self.total_navigations += other.total_navigations
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+        
+        self.query_latency.merge(other.query_latency)
+        for kind, histogram in other.command_latency.items():
+            self.command_latency[kind].merge(histogram)
+        self.throughput.merge(other.throughput)
+        self.avg_query_time_us = self.query_latency.mean
     
     def to_dict(self) -> Dict:
         """Convert telemetry to dictionary"""
         self.update_uptime()
+        p50, p95, p99 = self.query_latency.percentiles([0.50, 0.95, 0.99])
         return {
             "total_queries": self.total_queries,
             "total_transformations": self.total_transformations,
             "total_navigations": self.total_navigations,
             "avg_query_time_us": round(self.avg_query_time_us, 2),
+            "p50_query_time_us": round(p50, 2),
+            "p95_query_time_us": round(p95, 2),
+            "p99_query_time_us": round(p99, 2),
+            "max_query_time_us": round(self.query_latency.max, 2),
+            "throughput_ops_per_s": round(self.throughput.rate(), 2),
             "cache_hits": self.cache_hits,
             "cache_misses": self.cache_misses,
             "cache_hit_rate": round(self.cache_hits / max(1, self.cache_hits + self.cache_misses), 4),
             "uptime_seconds": round(self.uptime_seconds, 2),
+            "commands": {
+                kind: histogram.summary()
+                for kind, histogram in self.command_latency.items()
+            },
         }
+
+
+class ShardedTelemetry:
+    """
+    Per-thread telemetry for the concurrent driver mode
+    
+    Each thread records into its own NPUTelemetry shard without locking;
+    readers merge all shards into a fresh NPUTelemetry.
+    """
+    
+    def __init__(self):
+        self.start_time = time.time()
+        self._rate_start = time.monotonic()
+        self._local = threading.local()
+        self._shards: List[NPUTelemetry] = []
+        self._lock = threading.Lock()
+    
+    def shard(self) -> NPUTelemetry:
+        """Telemetry shard owned by the calling thread"""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = NPUTelemetry(start_time=self.start_time)
+            shard.throughput = EWMARate(start_time=self._rate_start)
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+    
+    def merged(self) -> NPUTelemetry:
+        """Snapshot of all shards combined"""
+        merged = NPUTelemetry(start_time=self.start_time)
+        merged.throughput = EWMARate(start_time=self._rate_start)
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            merged.merge(shard)
+        merged.update_uptime()
+        return merged
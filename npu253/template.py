@@ -0,0 +1,11 @@
+"""
+NPU-253 Template Engine
+
+The shared {{placeholder}} template engine (pattern_template), re-exported
+for the archetypal patterns and existing npu253.template imports.
+"""
+
+from pattern_template import PLACEHOLDER_RE, CompiledTemplate, compile_template, render_domains
+
+
+__all__ = ["PLACEHOLDER_RE", "CompiledTemplate", "compile_template", "render_domains"]
@@ -0,0 +1,184 @@
+"""
+NPU-253 Text Index
+
+Tokenized inverted index with positional postings and BM25 ranking, used
+by the driver's full-text search.
+"""
+
+import math
+import re
+from bisect import bisect_left
+from typing import Dict, List, Mapping, Optional, Tuple
+
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric terms"""
+    return TOKEN_RE.findall(text.lower())
+
+
+class TextIndex:
+    """
+    Inverted index over pattern text
+
+    Postings map each term to the documents containing it and the term
+    positions within each document. Queries support bare terms, quoted
+    phrases ("south facing") and prefixes (garden*); every clause must
+    match and documents are ranked by BM25. An index loaded from a
+    snapshot has read-only postings; clear() it before adding documents.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Mapping[str, Dict[int, List[int]]] = {}
+        self.doc_lengths: Dict[int, int] = {}
+        self.avg_doc_length = 0.0
+        self._vocabulary: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def add(self, doc_id: int, text: str) -> None:
+        """Index a document (call finalize() once all documents are added)"""
+        terms = tokenize(text)
+        self.doc_lengths[doc_id] = len(terms)
+        for position, term in enumerate(terms):
+            self.postings.setdefault(term, {}).setdefault(doc_id, []).append(position)
+
+    def finalize(self) -> None:
+        """Compute corpus statistics and the sorted vocabulary for prefix lookup"""
+        self._vocabulary = sorted(self.postings)
+        if self.doc_lengths:
+            self.avg_doc_length = sum(self.doc_lengths.values()) / len(self.doc_lengths)
+
+    def clear(self) -> None:
+        """Drop all indexed documents"""
+        self.postings = {}
+        self.doc_lengths.clear()
+        self.avg_doc_length = 0.0
+        self._vocabulary = []
+
+    # === Query evaluation ===
+
+    def search(self, query: str, within: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        Evaluate a query against the index.
+
+        Args:
+            query: Query text
+            within: Optional bitset of doc_ids (bit n for doc n) to
+                restrict results to; corpus statistics are unaffected
+
+        Returns:
+            (doc_id, score) pairs ordered by descending BM25 score, ties
+            broken by ascending doc_id
+        """
+        clauses = self._parse(query)
+        if not clauses:
+            return []
+
+        scores: Dict[int, float] = {}
+        for i, clause in enumerate(clauses):
+            clause_scores = self._eval_clause(clause)
+            if i == 0:
+                scores = clause_scores
+                if within is not None:
+                    scores = {doc_id: score for doc_id, score in scores.items() if (within >> doc_id) & 1}
+            else:
+                scores = {
+                    doc_id: score + clause_scores[doc_id]
+                    for doc_id, score in scores.items()
+                    if doc_id in clause_scores
+                }
+            if not scores:
+                return []
+
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+    def _parse(self, query: str) -> List[Tuple[str, List[str]]]:
+        """Parse query text into ("term" | "phrase" | "prefix", terms) clauses"""
+        clauses = []
+        for phrase, word in QUERY_RE.findall(query):
+            if phrase:
+                terms = tokenize(phrase)
+                if terms:
+                    clauses.append(("phrase" if len(terms) > 1 else "term", terms))
+                continue
+
+            terms = tokenize(word)
+            if not terms:
+                continue
+            if word.endswith("*"):
+                if len(terms) > 1:
+                    clauses.append(("phrase", terms[:-1]))
+                clauses.append(("prefix", terms[-1:]))
+            elif len(terms) > 1:
+                # Hyphenated or punctuated words match as phrases
+                clauses.append(("phrase", terms))
+            else:
+                clauses.append(("term", terms))
+        return clauses
+
+    def _eval_clause(self, clause: Tuple[str, List[str]]) -> Dict[int, float]:
+        kind, terms = clause
+        if kind == "term":
+            return self._score_postings(self.postings.get(terms[0], {}))
+        if kind == "prefix":
+            scores: Dict[int, float] = {}
+            for term in self._expand_prefix(terms[0]):
+                for doc_id, score in self._score_postings(self.postings[term]).items():
+                    scores[doc_id] = scores.get(doc_id, 0.0) + score
+            return scores
+        return self._score_postings(self._phrase_postings(terms))
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        """Return all vocabulary terms starting with prefix"""
+        start = bisect_left(self._vocabulary, prefix)
+        matches = []
+        for term in self._vocabulary[start:]:
+            if not term.startswith(prefix):
+                break
+            matches.append(term)
+        return matches
+
+    def _phrase_postings(self, terms: List[str]) -> Dict[int, List[int]]:
+        """Positions at which the full phrase starts, per document"""
+        term_postings = [self.postings.get(term) for term in terms]
+        if not all(term_postings):
+            return {}
+
+        # Walk the rarest term's documents first
+        candidates = min(term_postings, key=len)
+        result: Dict[int, List[int]] = {}
+        for doc_id in candidates:
+            if not all(doc_id in postings for postings in term_postings):
+                continue
+            starts = set(term_postings[0][doc_id])
+            for offset, postings in enumerate(term_postings[1:], 1):
+                starts &= {pos - offset for pos in postings[doc_id]}
+                if not starts:
+                    break
+            if starts:
+                result[doc_id] = sorted(starts)
+        return result
+
+    def _score_postings(self, postings: Dict[int, List[int]]) -> Dict[int, float]:
+        """BM25 score for every document in a postings list"""
+        if not postings:
+            return {}
+
+        n_docs = len(self.doc_lengths)
+        df = len(postings)
+        idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+        avgdl = self.avg_doc_length or 1.0
+
+        scores = {}
+        for doc_id, positions in postings.items():
+            tf = len(positions)
+            norm = self.k1 * (1.0 - self.b + self.b * self.doc_lengths[doc_id] / avgdl)
+            scores[doc_id] = idf * tf * (self.k1 + 1.0) / (tf + norm)
+        return scores
@@ -11,15 +11,30 @@ Provides REST endpoints for:
 Implements Phase 6 of OPTIMAL_GRIP_ANALYSIS.md
 """
 
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
 from pydantic import BaseModel, Field
-from typing import List, Optional, Set, Dict, Any
+from typing import List, Optional, Set, Dict, Any, Tuple
+import argparse
+import asyncio
+import gzip
+import hashlib
 import json
+import os
+import tempfile
+import threading
 from pathlib import Path
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 # Import our pattern language modules
-from pattern_salience_engine import PatternSalienceEngine, PatternContext, SalienceScore
+from pattern_salience_engine import (PatternSalienceEngine, PatternContext, SalienceScore,
+                                     SalienceCache, feature_cache_path_for)
+from pattern_executor import EngineExecutor, EngineBusy
+from pattern_metrics import CONTENT_TYPE, MetricsMiddleware, RequestMetrics, format_family
 
 app = FastAPI(
     title="Pattern Language API",
@@ -27,19 +42,84 @@ app = FastAPI(
     version="0.1.0"
 )
 
+# Request latency, size and in-flight metrics, served at /metrics
+request_metrics = RequestMetrics()
+app.add_middleware(MetricsMiddleware, metrics=request_metrics, root_app=app)
+
+PATTERN_JSON = 'pattern_language_generated.json'
+FEATURE_CACHE = feature_cache_path_for(PATTERN_JSON)
+# Set by serve() for multi-worker runs: the engine state file workers attach to
+SHARED_STATE_ENV = 'PATTERN_API_SHARED_STATE'
+
+# Engine executor settings (see pattern_executor.py), also set by serve()
+ENGINE_THREADS_ENV = 'PATTERN_API_ENGINE_THREADS'
+PROCESS_WORKERS_ENV = 'PATTERN_API_PROCESS_WORKERS'
+ENGINE_QUEUE_ENV = 'PATTERN_API_ENGINE_QUEUE'
+ENGINE_TIMEOUT_ENV = 'PATTERN_API_ENGINE_TIMEOUT'
+
+# Pure-Python engine methods, run in the process pool when there is one
+PROCESS_METHODS = {'track_emergence'}
+
 # Global engine instance
 salience_engine = None
+engine_executor = None
 
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize engines on startup"""
-    global salience_engine
-    print("Initializing Pattern Salience Engine...")
-    salience_engine = PatternSalienceEngine('pattern_language_generated.json')
+    global salience_engine, engine_executor
+    shared_state = os.environ.get(SHARED_STATE_ENV)
+    if shared_state:
+        # Worker process: map the features the parent built
+        salience_engine = PatternSalienceEngine.attach_shared_state(shared_state)
+    else:
+        print("Initializing Pattern Salience Engine...")
+        salience_engine = PatternSalienceEngine(
+            PATTERN_JSON,
+            lazy=True,
+            feature_cache_path=FEATURE_CACHE
+        )
+    
+    # Serve requests straight away; /health reports when loading finishes
+    threading.Thread(target=_load_engine, name='pattern-api-load', daemon=True).start()
+    
+    timeout = float(os.environ.get(ENGINE_TIMEOUT_ENV, 30))
+    engine_executor = EngineExecutor(
+        salience_engine,
+        threads=int(os.environ.get(ENGINE_THREADS_ENV, 4)),
+        process_workers=int(os.environ.get(PROCESS_WORKERS_ENV, 0)),
+        shared_state=shared_state,
+        max_queue=int(os.environ.get(ENGINE_QUEUE_ENV, 64)),
+        timeout=timeout if timeout > 0 else None
+    )
     print("API ready!")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the engine executor pools"""
+    if engine_executor is not None:
+        engine_executor.shutdown()
+
+
+async def _run_engine(method: str, *args) -> Any:
+    """
+    Call a salience engine method off the event loop
+    
+    Raises 503 when the executor queue is full and 504 when the call
+    exceeds the executor timeout.
+    """
+    try:
+        if method in PROCESS_METHODS:
+            return await engine_executor.run_in_process(method, *args)
+        return await engine_executor.run(getattr(salience_engine, method), *args)
+    except EngineBusy as e:
+        raise HTTPException(status_code=503, detail=f"Engine busy: {e}")
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail=f"Engine call timed out: {method}")
+
+
 # Pydantic models for requests/responses
 class PatternResponse(BaseModel):
     """Pattern data response"""
@@ -61,6 +141,7 @@ class SalienceRequest(BaseModel):
     keywords: Set[str] = Field(default_factory=set)
     domain: Optional[str] = None
     limit: int = Field(default=20, ge=1, le=100)
+    explain: bool = True  # False leaves reasons empty
 
 
 class SalienceResponse(BaseModel):
@@ -82,6 +163,299 @@ class EmergenceRequest(BaseModel):
     pattern_sequence: List[str]
 
 
+# Precomputed read responses
+#
+# Pattern data does not change once the engine has loaded, so the read
+# endpoints serve JSON bytes serialized once, with strong ETags and
+# compressed variants, instead of rebuilding pydantic models per request.
+
+COMPRESS_MIN_BYTES = 1024  # Smaller bodies are always sent uncompressed
+PAGE_CACHE_SIZE = 512  # /patterns pages kept per store
+PATTERN_FIELDS = ('id', 'number', 'name', 'asterisks', 'problem', 'solution',
+                  'category', 'preceding_patterns', 'following_patterns')
+
+
+# Content codings every compressible body is stored in
+ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    """Body compressed with a content coding from ENCODINGS"""
+    if encoding == 'br':
+        return brotli.compress(body)
+    return gzip.compress(body, mtime=0)
+
+
+class CachedBody:
+    """
+    Serialized JSON response body with its ETag and compressed variants
+    
+    Every variant is compressed up front, so building a CachedBody is the
+    expensive step: do it on the loader thread or in the engine executor,
+    never on the event loop. Serving one is then a dictionary lookup.
+    """
+    
+    def __init__(self, body: bytes):
+        self.body = body
+        self.etag = '"%s"' % hashlib.sha256(body).hexdigest()[:32]
+        self.compressible = len(body) >= COMPRESS_MIN_BYTES
+        self._encoded: Dict[str, bytes] = (
+            {encoding: _compress(body, encoding) for encoding in ENCODINGS}
+            if self.compressible else {}
+        )
+    
+    def encoded(self, encoding: str) -> bytes:
+        """Body compressed with the given content coding"""
+        return self._encoded[encoding]
+    
+    def etag_for(self, encoding: Optional[str]) -> str:
+        """Strong ETag of the representation sent with the given coding"""
+        if encoding is None:
+            return self.etag
+        return self.etag[:-1] + '-' + encoding + '"'
+
+
+def _dump_json(content: Any) -> bytes:
+    """Serialize the way FastAPI's JSONResponse does"""
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(',', ':')
+    ).encode('utf-8')
+
+
+class PatternResponseStore:
+    """
+    Response bodies for the pattern read endpoints
+    
+    Holds one serialized PatternResponse per pattern, the /categories body
+    and the ordered pattern IDs of each category. /patterns pages are sliced
+    from those index lists, joined from the per-pattern bytes (or projected
+    rows when fields are selected) and kept in a bounded LRU. Building the
+    store and building a new page both compress bodies, so both run off the
+    event loop; cached_page() is the cheap lookup handlers do first.
+    """
+    
+    def __init__(self, engine: PatternSalienceEngine):
+        self.patterns = engine.patterns
+        self.category_map = engine.category_map
+        
+        self.pattern_rows: Dict[str, Dict[str, Any]] = {}
+        self.pattern_bodies: Dict[str, bytes] = {}
+        self.pattern_responses: Dict[str, CachedBody] = {}
+        # Ordered pattern IDs per category; None indexes every pattern
+        self.category_index: Dict[Optional[str], List[str]] = {None: []}
+        for pattern_id, pattern in self.patterns.items():
+            category = self.category_map.get(pattern_id)
+            row = {
+                'id': pattern['id'],
+                'number': pattern['number'],
+                'name': pattern['name'],
+                'asterisks': pattern.get('asterisks', 0),
+                'problem': pattern.get('problem', ''),
+                'solution': pattern.get('solution', ''),
+                'category': category,
+                'preceding_patterns': pattern.get('preceding_patterns', []),
+                'following_patterns': pattern.get('following_patterns', [])
+            }
+            body = _dump_json(row)
+            self.pattern_rows[pattern_id] = row
+            self.pattern_bodies[pattern_id] = body
+            self.pattern_responses[pattern_id] = CachedBody(body)
+            self.category_index[None].append(pattern_id)
+            if category is not None:
+                self.category_index.setdefault(category, []).append(pattern_id)
+        self._positions = {
+            category: {pattern_id: i for i, pattern_id in enumerate(pattern_ids)}
+            for category, pattern_ids in self.category_index.items()
+        }
+        
+        category_counts: Dict[str, int] = {}
+        for category in self.category_map.values():
+            category_counts[category] = category_counts.get(category, 0) + 1
+        self.categories = CachedBody(_dump_json({
+            'categories': [
+                {'name': cat, 'pattern_count': count}
+                for cat, count in sorted(category_counts.items())
+            ]
+        }))
+        
+        self._pages = SalienceCache(capacity=PAGE_CACHE_SIZE)
+        self._empty_page = CachedBody(b'[]')
+    
+    def is_current(self, engine: PatternSalienceEngine) -> bool:
+        """Whether the store was built from the engine's current data"""
+        return self.patterns is engine.patterns and self.category_map is engine.category_map
+    
+    def page(
+        self,
+        category: Optional[str],
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[CachedBody, Optional[str]]:
+        """
+        A /patterns page and the cursor of the page after it
+        
+        The cursor is the ID of the last pattern on the previous page; the
+        returned cursor is None on the last page. fields selects and orders
+        the keys of each pattern (None for all). Raises ValueError for a
+        cursor that is not in the category.
+        """
+        page = self.cached_page(category, limit, cursor, fields)
+        if page is None:
+            category = category or None
+            pattern_ids = self.category_index[category]
+            start = self._start(category, cursor)
+            page_ids = pattern_ids[start:start + limit]
+            if fields is None:
+                bodies = [self.pattern_bodies[pattern_id] for pattern_id in page_ids]
+            else:
+                bodies = [
+                    _dump_json({field: self.pattern_rows[pattern_id][field] for field in fields})
+                    for pattern_id in page_ids
+                ]
+            next_cursor = page_ids[-1] if start + limit < len(pattern_ids) else None
+            page = (CachedBody(b'[' + b','.join(bodies) + b']'), next_cursor)
+            self._pages.put((category, limit, start, fields), page)
+        return page
+    
+    def cached_page(
+        self,
+        category: Optional[str],
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Optional[Tuple[CachedBody, Optional[str]]]:
+        """Like page(), but None instead of building a page that is not cached yet"""
+        category = category or None
+        if category not in self.category_index:
+            # Unknown categories share one body rather than filling the cache
+            return self._empty_page, None
+        return self._pages.get((category, limit, self._start(category, cursor), fields))
+    
+    def _start(self, category: Optional[str], cursor: Optional[str]) -> int:
+        """Index of the first pattern after cursor; ValueError if it is not in the category"""
+        if cursor is None:
+            return 0
+        position = self._positions[category].get(cursor)
+        if position is None:
+            raise ValueError(f"Invalid cursor: {cursor}")
+        return position + 1
+
+
+_response_store: Optional[PatternResponseStore] = None
+_response_store_lock = threading.Lock()
+
+
+def _build_response_store() -> PatternResponseStore:
+    """Serialize the loaded engine's responses unless already current; blocks"""
+    global _response_store
+    with _response_store_lock:
+        store = _response_store
+        if store is None or not store.is_current(salience_engine):
+            store = _response_store = PatternResponseStore(salience_engine)
+    return store
+
+
+def _load_engine():
+    """Load the engine, then build the response store; runs in a daemon thread"""
+    try:
+        salience_engine.ensure_loaded()
+        _build_response_store()
+    except Exception as e:
+        salience_engine.load_error = f"{type(e).__name__}: {e}"
+
+
+async def _get_response_store() -> PatternResponseStore:
+    """
+    Response store for the loaded engine
+    
+    Normally built by _load_engine(). If a request arrives before that
+    finishes, or after a reload, it is built in the executor rather than
+    on the event loop.
+    """
+    store = _response_store
+    if store is not None and store.is_current(salience_engine):
+        return store
+    try:
+        return await engine_executor.run(_build_response_store)
+    except EngineBusy as e:
+        raise HTTPException(status_code=503, detail=f"Engine busy: {e}")
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Building pattern responses timed out")
+
+
+def _accepted_encoding(accept_encoding: str) -> Optional[str]:
+    """Preferred available content coding (br, then gzip) the client accepts"""
+    accepted = set()
+    for item in accept_encoding.split(','):
+        coding, _, params = item.strip().partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if quality > 0:
+            accepted.add(coding.strip().lower())
+    if brotli is not None and 'br' in accepted:
+        return 'br'
+    if 'gzip' in accepted:
+        return 'gzip'
+    return None
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match comparison (weak, as RFC 9110 requires for GET)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Validate a fields= projection, in PatternResponse field order"""
+    if not fields:
+        return None
+    requested = {field.strip() for field in fields.split(',') if field.strip()}
+    unknown = requested.difference(PATTERN_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    selected = tuple(field for field in PATTERN_FIELDS if field in requested)
+    return selected if selected and len(selected) < len(PATTERN_FIELDS) else None
+
+
+def _cached_response(
+    request: Request,
+    cached: CachedBody,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """Serve a precomputed body, answering 304 when the client's copy is current"""
+    encoding = None
+    if cached.compressible:
+        encoding = _accepted_encoding(request.headers.get('accept-encoding', ''))
+    
+    etag = cached.etag_for(encoding)
+    headers = dict(headers or {}, ETag=etag, Vary='Accept-Encoding')
+    if _etag_matches(request.headers.get('if-none-match'), etag):
+        return Response(status_code=304, headers=headers)
+    
+    if encoding is None:
+        return Response(cached.body, media_type='application/json', headers=headers)
+    headers['Content-Encoding'] = encoding
+    return Response(cached.encoded(encoding), media_type='application/json', headers=headers)
+
+
 # API Endpoints
 
 @app.get("/")
@@ -94,72 +468,67 @@ async def root():
             "patterns": "/patterns",
             "pattern_by_id": "/patterns/{pattern_id}",
             "salience": "/salience",
+            "salience_batch": "/salience/batch",
             "gestalt": "/gestalt",
             "emergence": "/emergence",
-            "categories": "/categories"
+            "categories": "/categories",
+            "metrics": "/metrics"
         }
     }
 
 
 @app.get("/patterns", response_model=List[PatternResponse])
 async def list_patterns(
+    request: Request,
     category: Optional[str] = Query(None, description="Filter by category"),
-    limit: int = Query(50, ge=1, le=253)
+    limit: int = Query(50, ge=1, le=253),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields, e.g. id,name,number")
 ):
-    """List patterns, optionally filtered by category"""
-    if not salience_engine:
-        raise HTTPException(status_code=503, detail="Engine not initialized")
-    
-    patterns = []
-    count = 0
-    
-    for pattern_id, pattern in salience_engine.patterns.items():
-        if category:
-            pattern_category = salience_engine.category_map.get(pattern_id)
-            if pattern_category != category:
-                continue
-        
-        patterns.append(PatternResponse(
-            id=pattern['id'],
-            number=pattern['number'],
-            name=pattern['name'],
-            asterisks=pattern.get('asterisks', 0),
-            problem=pattern.get('problem', ''),
-            solution=pattern.get('solution', ''),
-            category=salience_engine.category_map.get(pattern_id),
-            preceding_patterns=pattern.get('preceding_patterns', []),
-            following_patterns=pattern.get('following_patterns', [])
-        ))
-        
-        count += 1
-        if count >= limit:
-            break
+    """
+    List patterns, optionally filtered by category
+    
+    Pages are cursor-based: while more patterns remain, the response has an
+    X-Next-Cursor header (and a Link rel="next") to pass back as cursor.
+    """
+    if not salience_engine or not salience_engine.ready:
+        raise HTTPException(status_code=503, detail="Engine not ready")
     
-    return patterns
+    store = await _get_response_store()
+    fields = _parse_fields(fields)
+    try:
+        page = store.cached_page(category, limit, cursor, fields)
+        if page is None:
+            # New pages are joined and compressed in the executor
+            page = await engine_executor.run(store.page, category, limit, cursor, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except EngineBusy as e:
+        raise HTTPException(status_code=503, detail=f"Engine busy: {e}")
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Building the pattern page timed out")
+    page, next_cursor = page
+    
+    headers = {}
+    if next_cursor is not None:
+        next_url = request.url.include_query_params(cursor=next_cursor)
+        headers['X-Next-Cursor'] = next_cursor
+        headers['Link'] = f'<{next_url}>; rel="next"'
+    return _cached_response(request, page, headers)
 
 
 @app.get("/patterns/{pattern_id}", response_model=PatternResponse)
-async def get_pattern(pattern_id: str):
+async def get_pattern(pattern_id: str, request: Request):
     """Get a specific pattern by ID"""
-    if not salience_engine:
-        raise HTTPException(status_code=503, detail="Engine not initialized")
+    if not salience_engine or not salience_engine.ready:
+        raise HTTPException(status_code=503, detail="Engine not ready")
     
-    if pattern_id not in salience_engine.patterns:
+    store = await _get_response_store()
+    cached = store.pattern_responses.get(pattern_id)
+    if cached is None:
         raise HTTPException(status_code=404, detail=f"Pattern {pattern_id} not found")
     
-    pattern = salience_engine.patterns[pattern_id]
-    
-    return PatternResponse(
-        id=pattern['id'],
-        number=pattern['number'],
-        name=pattern['name'],
-        asterisks=pattern.get('asterisks', 0),
-        problem=pattern.get('problem', ''),
-        solution=pattern.get('solution', ''),
-        category=salience_engine.category_map.get(pattern_id),
-        preceding_patterns=pattern.get('preceding_patterns', []),
-        following_patterns=pattern.get('following_patterns', [])
-    )
+    return _cached_response(request, cached)
 
 
 @app.post("/salience", response_model=List[SalienceResponse])
@@ -169,21 +538,53 @@ async def compute_salience(request: SalienceRequest):
     
     Returns patterns ranked by relevance to the context.
     """
-    if not salience_engine:
-        raise HTTPException(status_code=503, detail="Engine not initialized")
+    if not salience_engine or not salience_engine.ready:
+        raise HTTPException(status_code=503, detail="Engine not ready")
     
-    # Create context
-    context = PatternContext(
+    # Rank patterns
+    scores = await _run_engine(
+        'rank_patterns_by_salience',
+        _salience_context(request),
+        request.limit,
+        request.explain
+    )
+    
+    return _salience_responses(scores)
+
+
+@app.post("/salience/batch", response_model=List[List[SalienceResponse]])
+async def compute_salience_batch(requests: List[SalienceRequest]):
+    """
+    Compute salience scores for many contexts in one call
+    
+    Returns one ranked list per request, in request order. All contexts
+    are scored together as a single contexts x patterns matrix.
+    """
+    if not salience_engine or not salience_engine.ready:
+        raise HTTPException(status_code=503, detail="Engine not ready")
+    
+    rankings = await _run_engine(
+        'rank_patterns_by_salience_batch',
+        [_salience_context(request) for request in requests],
+        [request.limit for request in requests],
+        [request.explain for request in requests]
+    )
+    
+    return [_salience_responses(scores) for scores in rankings]
+
+
+def _salience_context(request: SalienceRequest) -> PatternContext:
+    """Build the engine context for a salience request"""
+    return PatternContext(
         focus_patterns=request.focus_patterns,
         current_category=request.current_category,
         keywords=request.keywords,
         domain=request.domain
     )
-    
-    # Rank patterns
-    scores = salience_engine.rank_patterns_by_salience(context, limit=request.limit)
-    
-    # Convert to response format
+
+
+def _salience_responses(scores: List[SalienceScore]) -> List[SalienceResponse]:
+    """Convert salience scores to response format"""
     responses = []
     for score in scores:
         pattern = salience_engine.patterns.get(score.pattern_id)
@@ -205,8 +606,8 @@ async def detect_gestalt(request: GestaltRequest):
     
     Returns clusters of patterns that form coherent wholes.
     """
-    if not salience_engine:
-        raise HTTPException(status_code=503, detail="Engine not initialized")
+    if not salience_engine or not salience_engine.ready:
+        raise HTTPException(status_code=503, detail="Engine not ready")
     
     # Validate pattern IDs
     for pattern_id in request.pattern_ids:
@@ -214,9 +615,10 @@ async def detect_gestalt(request: GestaltRequest):
             raise HTTPException(status_code=400, detail=f"Unknown pattern: {pattern_id}")
     
     # Detect gestalts
-    gestalts = salience_engine.detect_gestalt_patterns(
+    gestalts = await _run_engine(
+        'detect_gestalt_patterns',
         request.pattern_ids,
-        threshold=request.threshold
+        request.threshold
     )
     
     # Enrich with pattern names
@@ -249,8 +651,8 @@ async def track_emergence(request: EmergenceRequest):
     
     Detects when patterns combine to create emergent properties.
     """
-    if not salience_engine:
-        raise HTTPException(status_code=503, detail="Engine not initialized")
+    if not salience_engine or not salience_engine.ready:
+        raise HTTPException(status_code=503, detail="Engine not ready")
     
     # Validate pattern IDs
     for pattern_id in request.pattern_sequence:
@@ -258,7 +660,7 @@ async def track_emergence(request: EmergenceRequest):
             raise HTTPException(status_code=400, detail=f"Unknown pattern: {pattern_id}")
     
     # Track emergence
-    emergence = salience_engine.track_emergence(request.pattern_sequence)
+    emergence = await _run_engine('track_emergence', request.pattern_sequence)
     
     # Enrich with pattern names
     sequence_info = []
@@ -280,34 +682,141 @@ async def track_emergence(request: EmergenceRequest):
 
 
 @app.get("/categories")
-async def list_categories():
+async def list_categories(request: Request):
     """List available pattern categories"""
-    if not salience_engine:
-        raise HTTPException(status_code=503, detail="Engine not initialized")
+    if not salience_engine or not salience_engine.ready:
+        raise HTTPException(status_code=503, detail="Engine not ready")
     
-    # Count patterns per category
-    category_counts = {}
-    for pattern_id, category in salience_engine.category_map.items():
-        category_counts[category] = category_counts.get(category, 0) + 1
-    
-    return {
-        'categories': [
-            {'name': cat, 'pattern_count': count}
-            for cat, count in sorted(category_counts.items())
-        ]
-    }
+    store = await _get_response_store()
+    return _cached_response(request, store.categories)
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
+    ready = salience_engine is not None and salience_engine.ready
+    if ready:
+        status = "healthy"
+    elif salience_engine is not None and salience_engine.load_error:
+        status = "error"
+    else:
+        status = "loading"
+    
     return {
-        "status": "healthy",
-        "engine_loaded": salience_engine is not None,
-        "pattern_count": len(salience_engine.patterns) if salience_engine else 0
+        "status": status,
+        "engine_loaded": ready,
+        "load_error": salience_engine.load_error if salience_engine else None,
+        "pattern_count": len(salience_engine.patterns) if ready else 0,
+        "salience_cache": salience_engine.salience_cache.stats() if salience_engine else None,
+        "executor": engine_executor.stats() if engine_executor else None
     }
 
 
-if __name__ == '__main__':
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Request and engine metrics in the Prometheus text format"""
+    lines = request_metrics.render()
+    
+    ready = salience_engine is not None and salience_engine.ready
+    lines += format_family('pattern_api_engine_ready', 'gauge',
+                           'Whether the salience engine has loaded', [((), int(ready))])
+    
+    caches = []
+    if salience_engine is not None:
+        caches.append(('salience', salience_engine.salience_cache.stats()))
+    if ready and _response_store is not None:
+        caches.append(('patterns_page', _response_store._pages.stats()))
+    for stat, kind, help_text in (
+        ('hits', 'counter', 'Cache lookups that found an entry'),
+        ('misses', 'counter', 'Cache lookups that found no entry'),
+        ('evictions', 'counter', 'Entries evicted to stay within capacity'),
+        ('expirations', 'counter', 'Entries dropped after their TTL'),
+        ('size', 'gauge', 'Entries currently cached'),
+        ('hit_rate', 'gauge', 'Hits as a fraction of lookups'),
+    ):
+        suffix = '_total' if kind == 'counter' else ''
+        lines += format_family(f'pattern_api_cache_{stat}{suffix}', kind, help_text,
+                               [((('cache', name),), stats[stat]) for name, stats in caches])
+    
+    if engine_executor is not None:
+        executor_stats = engine_executor.stats()
+        pools = [(name, executor_stats[name]) for name in ('threads', 'processes')
+                 if executor_stats[name]]
+        for stat, help_text in (
+            ('workers', 'Engine calls that can run at once'),
+            ('running', 'Engine calls running'),
+            ('queued', 'Engine calls waiting for a worker'),
+            ('max_queued', 'Most engine calls seen waiting at once'),
+        ):
+            lines += format_family(f'pattern_api_executor_{stat}', 'gauge', help_text,
+                                   [((('pool', name),), stats[stat]) for name, stats in pools])
+        lines += format_family(
+            'pattern_api_executor_calls_total', 'counter', 'Engine calls, by outcome',
+            [((('pool', name), ('outcome', outcome)), stats[outcome])
+             for name, stats in pools
+             for outcome in ('completed', 'failed', 'timeouts', 'rejected')]
+        )
+    
+    return PlainTextResponse('\n'.join(lines) + '\n', media_type=CONTENT_TYPE)
+
+
+def serve(
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    workers: int = 1,
+    engine_threads: int = 4,
+    process_workers: int = 0,
+    engine_queue: int = 64,
+    engine_timeout: float = 30.0
+):
+    """
+    Run the API with uvicorn
+    
+    With several workers (or a process pool) the engine is built once,
+    here, and written to a state file (in /dev/shm where available) that
+    every worker maps read-only, so workers start instantly and share one
+    copy of the arrays.
+    """
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    
+    os.environ[ENGINE_THREADS_ENV] = str(engine_threads)
+    os.environ[PROCESS_WORKERS_ENV] = str(process_workers)
+    os.environ[ENGINE_QUEUE_ENV] = str(engine_queue)
+    os.environ[ENGINE_TIMEOUT_ENV] = str(engine_timeout)
+    
+    if workers <= 1 and process_workers <= 0:
+        uvicorn.run(app, host=host, port=port)
+        return
+    
+    engine = PatternSalienceEngine(PATTERN_JSON, feature_cache_path=FEATURE_CACHE)
+    fd, state_path = tempfile.mkstemp(
+        prefix='pattern_api.', suffix='.state',
+        dir='/dev/shm' if os.path.isdir('/dev/shm') else None
+    )
+    os.close(fd)
+    try:
+        engine.save_shared_state(state_path)
+        del engine
+        os.environ[SHARED_STATE_ENV] = state_path
+        uvicorn.run('pattern_api:app', host=host, port=port, workers=workers)
+    finally:
+        os.unlink(state_path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Pattern Language API server")
+    parser.add_argument('--host', default="0.0.0.0")
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=1,
+                        help="worker processes sharing one engine state")
+    parser.add_argument('--engine-threads', type=int, default=4,
+                        help="threads per worker for salience and gestalt calls")
+    parser.add_argument('--process-workers', type=int, default=0,
+                        help="processes per worker for emergence tracking (0 uses threads)")
+    parser.add_argument('--engine-queue', type=int, default=64,
+                        help="engine calls allowed to wait before returning 503")
+    parser.add_argument('--engine-timeout', type=float, default=30.0,
+                        help="seconds before an engine call returns 504 (0 disables)")
+    args = parser.parse_args()
+    serve(args.host, args.port, args.workers, args.engine_threads,
+          args.process_workers, args.engine_queue, args.engine_timeout)
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Pattern Network Centrality
+
+Graph centrality measures over the pattern language network, shared by
+the salience engine and the Datalog query system:
+- PageRank (sparse power iteration over the dependency graph)
+- Betweenness (Brandes' algorithm on the dependency graph)
+- Eigenvector centrality (power iteration over the undirected graph)
+
+The dependency graph has an edge from each pattern to every pattern that
+follows it, and from every preceding pattern to it. Results are cached in a
+JSON file next to the pattern JSON and reused while the graph is unchanged.
+"""
+
+import hashlib
+import json
+import os
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+MEASURES = ('pagerank', 'betweenness', 'eigenvector')
+
+
+def build_edges(patterns: Dict[str, dict]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Dependency graph of the patterns as edge arrays
+
+    Returns (node_ids, sources, targets), with edges given as indices
+    into node_ids. Duplicate edges and links to unknown patterns are dropped.
+    """
+    node_ids = list(patterns.keys())
+    index_by_number = {pattern.get('number'): i for i, pattern in enumerate(patterns.values())}
+
+    edges = set()
+    for i, pattern in enumerate(patterns.values()):
+        for number in pattern.get('following_patterns', []):
+            if number in index_by_number:
+                edges.add((i, index_by_number[number]))
+        for number in pattern.get('preceding_patterns', []):
+            if number in index_by_number:
+                edges.add((index_by_number[number], i))
+
+    edges = sorted(edges)
+    sources = np.array([s for s, _ in edges], dtype=np.intp)
+    targets = np.array([t for _, t in edges], dtype=np.intp)
+    return node_ids, sources, targets
+
+
+def pagerank(n: int, sources: np.ndarray, targets: np.ndarray,
+             damping: float = 0.85, tol: float = 1e-10, max_iter: int = 200) -> np.ndarray:
+    """PageRank by power iteration; dangling nodes spread their rank uniformly"""
+    if n == 0:
+        return np.zeros(0)
+    out_degree = np.bincount(sources, minlength=n).astype(float)
+    dangling = out_degree == 0
+    edge_weight = 1.0 / out_degree[sources]
+
+    rank = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        spread = np.bincount(targets, weights=rank[sources] * edge_weight, minlength=n)
+        new_rank = (1.0 - damping) / n + damping * (spread + rank[dangling].sum() / n)
+        if np.abs(new_rank - rank).sum() < tol:
+            return new_rank
+        rank = new_rank
+    return rank
+
+
+def eigenvector_centrality(n: int, sources: np.ndarray, targets: np.ndarray,
+                           tol: float = 1e-10, max_iter: int = 1000) -> np.ndarray:
+    """
+    Eigenvector centrality of the undirected graph by power iteration
+
+    Iterates x <- x + Ax (the shift keeps bipartite components from
+    oscillating) and normalizes to unit length.
+    """
+    if n == 0:
+        return np.zeros(0)
+    both_sources = np.concatenate([sources, targets])
+    both_targets = np.concatenate([targets, sources])
+
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        new_x = x + np.bincount(both_targets, weights=x[both_sources], minlength=n)
+        norm = np.linalg.norm(new_x)
+        if norm == 0:
+            return new_x
+        new_x /= norm
+        if np.abs(new_x - x).sum() < tol:
+            return new_x
+        x = new_x
+    return x
+
+
+def betweenness(n: int, sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Betweenness of the directed graph (Brandes), normalized by (n-1)(n-2)"""
+    successors: List[List[int]] = [[] for _ in range(n)]
+    for s, t in zip(sources.tolist(), targets.tolist()):
+        successors[s].append(t)
+
+    centrality = np.zeros(n)
+    for source in range(n):
+        # Breadth-first search counting shortest paths
+        order = []
+        predecessors: List[List[int]] = [[] for _ in range(n)]
+        paths = [0] * n
+        paths[source] = 1
+        distance = [-1] * n
+        distance[source] = 0
+        queue = deque([source])
+        while queue:
+            v = queue.popleft()
+            order.append(v)
+            for w in successors[v]:
+                if distance[w] < 0:
+                    distance[w] = distance[v] + 1
+                    queue.append(w)
+                if distance[w] == distance[v] + 1:
+                    paths[w] += paths[v]
+                    predecessors[w].append(v)
+
+        # Accumulate dependencies in reverse BFS order
+        dependency = [0.0] * n
+        for w in reversed(order):
+            for v in predecessors[w]:
+                dependency[v] += paths[v] / paths[w] * (1.0 + dependency[w])
+            if w != source:
+                centrality[w] += dependency[w]
+
+    if n > 2:
+        centrality /= (n - 1) * (n - 2)
+    return centrality
+
+
+def compute_centrality(patterns: Dict[str, dict]) -> Dict[str, Dict[str, float]]:
+    """Compute every measure for every pattern: {pattern_id: {measure: value}}"""
+    node_ids, sources, targets = build_edges(patterns)
+    n = len(node_ids)
+    values = {
+        'pagerank': pagerank(n, sources, targets),
+        'betweenness': betweenness(n, sources, targets),
+        'eigenvector': eigenvector_centrality(n, sources, targets),
+    }
+    return {
+        pattern_id: {measure: float(values[measure][i]) for measure in MEASURES}
+        for i, pattern_id in enumerate(node_ids)
+    }
+
+
+def network_centrality(centrality: Dict[str, Dict[str, float]]) -> Dict[str, float]:
+    """
+    Single 0-1 centrality per pattern
+
+    The mean of the three measures, each first scaled so that its most
+    central pattern scores 1.
+    """
+    peaks = {
+        measure: max((scores[measure] for scores in centrality.values()), default=0.0)
+        for measure in MEASURES
+    }
+    return {
+        pattern_id: sum(scores[m] / peaks[m] for m in MEASURES if peaks[m] > 0) / len(MEASURES)
+        for pattern_id, scores in centrality.items()
+    }
+
+
+def cache_path_for(pattern_json_path: str) -> Path:
+    """Centrality cache file stored next to the pattern JSON"""
+    path = Path(pattern_json_path)
+    return path.with_name(path.stem + '.centrality.json')
+
+
+def _graph_digest(patterns: Dict[str, dict]) -> str:
+    """Fingerprint of the pattern graph the cache was computed from"""
+    node_ids, sources, targets = build_edges(patterns)
+    h = hashlib.sha256()
+    h.update(json.dumps(node_ids).encode())
+    h.update(sources.astype(np.int64).tobytes())
+    h.update(targets.astype(np.int64).tobytes())
+    return h.hexdigest()
+
+
+def load_centrality(
+    pattern_json_path: str,
+    patterns: Dict[str, dict],
+    cache_path: Optional[str] = None
+) -> Dict[str, Dict[str, float]]:
+    """
+    Centrality for the given patterns, from the disk cache when it matches
+
+    The cache is recomputed and rewritten when missing, unreadable or
+    computed from a different graph. Failing to write it is not an error.
+    """
+    path = Path(cache_path) if cache_path else cache_path_for(pattern_json_path)
+    digest = _graph_digest(patterns)
+
+    try:
+        with open(path, 'r') as f:
+            cached = json.load(f)
+        if cached.get('graph_digest') == digest:
+            return cached['centrality']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    centrality = compute_centrality(patterns)
+    try:
+        # Readers never see a partly written cache
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        with open(tmp_path, 'w') as f:
+            json.dump({'graph_digest': digest, 'centrality': centrality}, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+    return centrality
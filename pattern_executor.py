@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Pattern Engine Executor
+
+Runs CPU-bound salience engine calls off the asyncio event loop, so one
+large request cannot stall every other client of pattern_api.py:
+- A thread pool for NumPy paths (NumPy releases the GIL in its kernels)
+- An optional process pool for pure-Python paths, whose workers attach to
+  the engine state written by PatternSalienceEngine.save_shared_state()
+- Bounded concurrency: each pool runs at most as many calls as it has
+  workers, at most max_queue calls wait, and further calls are rejected
+- Per-call timeouts, and queue-depth counters for monitoring
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+class EngineBusy(Exception):
+    """Raised when a call arrives while the wait queue is full"""
+
+
+# Engine of a process pool worker, attached by _attach_process_engine()
+_process_engine = None
+
+
+def _attach_process_engine(shared_state: str):
+    global _process_engine
+    from pattern_salience_engine import PatternSalienceEngine
+    _process_engine = PatternSalienceEngine.attach_shared_state(shared_state, verbose=False)
+
+
+def _call_process_engine(method: str, args: tuple) -> Any:
+    return getattr(_process_engine, method)(*args)
+
+
+class _Pool:
+    """An executor with its concurrency limit and counters"""
+
+    def __init__(self, executor, workers: int):
+        self.executor = executor
+        self.workers = workers
+        self.slots = asyncio.Semaphore(workers)
+        self.running = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.rejected = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'workers': self.workers,
+            'running': self.running,
+            'queued': self.queued,
+            'max_queued': self.max_queued,
+            'completed': self.completed,
+            'failed': self.failed,
+            'timeouts': self.timeouts,
+            'rejected': self.rejected,
+        }
+
+
+class EngineExecutor:
+    """
+    Thread and process pools for engine calls, with bounded queues
+
+    Create it from a running event loop. Counters are only updated on the
+    loop thread, so they need no locking.
+    """
+
+    def __init__(
+        self,
+        engine,
+        threads: int = 4,
+        process_workers: int = 0,
+        shared_state: Optional[str] = None,
+        max_queue: int = 64,
+        timeout: Optional[float] = 30.0
+    ):
+        """
+        Calls wait at most timeout seconds (None waits forever). The
+        process pool is only started when process_workers > 0 and a
+        shared_state file is given; otherwise run_in_process() uses threads.
+        """
+        self.engine = engine
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.threads = _Pool(
+            ThreadPoolExecutor(threads, thread_name_prefix='salience-engine'), threads
+        )
+        self.processes: Optional[_Pool] = None
+        if process_workers > 0 and shared_state:
+            self.processes = _Pool(
+                ProcessPoolExecutor(
+                    process_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_attach_process_engine,
+                    initargs=(shared_state,)
+                ),
+                process_workers
+            )
+
+    async def run(self, fn: Callable, *args, timeout: Optional[float] = None) -> Any:
+        """Run fn(*args) in the thread pool"""
+        return await self._submit(self.threads, fn, args, timeout)
+
+    async def run_in_process(self, method: str, *args, timeout: Optional[float] = None) -> Any:
+        """Run engine.method(*args) in the process pool, or a thread without one"""
+        if self.processes is None:
+            return await self._submit(self.threads, getattr(self.engine, method), args, timeout)
+        return await self._submit(self.processes, _call_process_engine, (method, args), timeout)
+
+    async def _submit(self, pool: _Pool, fn: Callable, args: tuple, timeout: Optional[float]) -> Any:
+        waiting = pool.slots.locked()
+        if waiting:
+            if pool.queued >= self.max_queue:
+                pool.rejected += 1
+                raise EngineBusy(f"{pool.queued} engine calls already waiting")
+            pool.queued += 1
+            pool.max_queued = max(pool.max_queued, pool.queued)
+        try:
+            await pool.slots.acquire()
+        finally:
+            if waiting:
+                pool.queued -= 1
+
+        # The slot is held until the call really finishes, even after a
+        # timeout, since a running thread cannot be interrupted
+        pool.running += 1
+        future = asyncio.get_running_loop().run_in_executor(pool.executor, fn, *args)
+
+        def release(done: asyncio.Future):
+            pool.running -= 1
+            pool.slots.release()
+            if done.cancelled() or done.exception() is not None:
+                pool.failed += 1
+            else:
+                pool.completed += 1
+
+        future.add_done_callback(release)
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(future), timeout if timeout is not None else self.timeout
+            )
+        except asyncio.TimeoutError:
+            pool.timeouts += 1
+            raise
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'max_queue': self.max_queue,
+            'timeout': self.timeout,
+            'threads': self.threads.stats(),
+            'processes': self.processes.stats() if self.processes else None,
+        }
+
+    def shutdown(self):
+        """Stop the pools without waiting for calls in progress"""
+        self.threads.executor.shutdown(wait=False, cancel_futures=True)
+        if self.processes is not None:
+            self.processes.executor.shutdown(wait=False, cancel_futures=True)
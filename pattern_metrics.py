@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Pattern API Metrics
+
+Request-level metrics for pattern_api.py, kept in process and exposed in
+the Prometheus text format, so no metrics service is needed:
+- Per-route latency histograms (p99 via histogram_quantile, or by eye)
+- Requests in flight
+- Request and response payload size histograms
+- Request counts by route and status
+
+MetricsMiddleware is a plain ASGI middleware: it counts body bytes as they
+are sent rather than buffering responses. Each process keeps its own
+metrics; with several workers every worker reports separately.
+"""
+
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Tuple
+
+from starlette.routing import Match
+
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Fixed-bucket histogram; counts are cumulated when rendered"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # The last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ''
+    escaped = (
+        (name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in labels
+    )
+    return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def format_family(name: str, kind: str, help_text: str,
+                  samples: Iterable[Tuple[Labels, float]]) -> List[str]:
+    """Lines for one counter or gauge family"""
+    lines = [f'# HELP {name} {help_text}', f'# TYPE {name} {kind}']
+    for labels, value in samples:
+        lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+    return lines
+
+
+def format_histograms(name: str, help_text: str,
+                      histograms: Dict[Labels, Histogram]) -> List[str]:
+    """Lines for a histogram family"""
+    lines = [f'# HELP {name} {help_text}', f'# TYPE {name} histogram']
+    for labels, histogram in sorted(histograms.items()):
+        cumulative = 0
+        for bound, count in zip(histogram.buckets + (float('inf'),), histogram.counts):
+            cumulative += count
+            bucket_labels = labels + (('le', _format_value(float(bound))),)
+            lines.append(f'{name}_bucket{_format_labels(bucket_labels)} {cumulative}')
+        lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}')
+        lines.append(f'{name}_count{_format_labels(labels)} {histogram.count}')
+    return lines
+
+
+class RequestMetrics:
+    """
+    In-process request metrics, labelled by method and route template
+
+    Routes are the matched path templates (e.g. /patterns/{pattern_id}),
+    or "unmatched", so label cardinality stays bounded. Updated only on the
+    event loop thread, so no locking is needed.
+    """
+
+    def __init__(self, prefix: str = 'pattern_api'):
+        self.prefix = prefix
+        self.in_flight = 0
+        self.requests: Dict[Labels, int] = {}
+        self.latency: Dict[Labels, Histogram] = {}
+        self.request_size: Dict[Labels, Histogram] = {}
+        self.response_size: Dict[Labels, Histogram] = {}
+
+    def observe(self, method: str, route: str, status: int, duration: float,
+                request_bytes: int, response_bytes: int):
+        labels = (('method', method), ('route', route))
+        status_labels = labels + (('status', str(status)),)
+        self.requests[status_labels] = self.requests.get(status_labels, 0) + 1
+        for histograms, buckets, value in (
+            (self.latency, LATENCY_BUCKETS, duration),
+            (self.request_size, SIZE_BUCKETS, request_bytes),
+            (self.response_size, SIZE_BUCKETS, response_bytes),
+        ):
+            histogram = histograms.get(labels)
+            if histogram is None:
+                histogram = histograms[labels] = Histogram(buckets)
+            histogram.observe(value)
+
+    def render(self) -> List[str]:
+        """Prometheus text lines for the request metrics"""
+        p = self.prefix
+        lines = format_family(f'{p}_requests_in_flight', 'gauge',
+                              'Requests currently being handled', [((), self.in_flight)])
+        lines += format_family(f'{p}_requests_total', 'counter',
+                               'Requests handled, by route and status',
+                               sorted(self.requests.items()))
+        lines += format_histograms(f'{p}_request_duration_seconds',
+                                   'Request latency, by route', self.latency)
+        lines += format_histograms(f'{p}_request_size_bytes',
+                                   'Request body size, by route', self.request_size)
+        lines += format_histograms(f'{p}_response_size_bytes',
+                                   'Response body size as sent, by route', self.response_size)
+        return lines
+
+
+def _route_template(app, scope) -> str:
+    """Path template of the route that handled the request"""
+    route = scope.get('route')
+    if route is None:
+        # Older Starlette does not record the route in the scope
+        for candidate in getattr(getattr(app, 'router', None), 'routes', ()):
+            match, _ = candidate.matches(scope)
+            if match == Match.FULL:
+                route = candidate
+                break
+    return getattr(route, 'path', None) or 'unmatched'
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording every HTTP request in a RequestMetrics"""
+
+    def __init__(self, app, metrics: RequestMetrics, root_app=None):
+        self.app = app
+        self.metrics = metrics
+        self.root_app = root_app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        metrics = self.metrics
+        status = 500
+        request_bytes = 0
+        response_bytes = 0
+
+        async def counting_receive():
+            nonlocal request_bytes
+            message = await receive()
+            if message['type'] == 'http.request':
+                request_bytes += len(message.get('body', b''))
+            return message
+
+        async def counting_send(message):
+            nonlocal status, response_bytes
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            elif message['type'] == 'http.response.body':
+                response_bytes += len(message.get('body', b''))
+            await send(message)
+
+        metrics.in_flight += 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, counting_receive, counting_send)
+        finally:
+            metrics.in_flight -= 1
+            metrics.observe(
+                scope['method'],
+                _route_template(self.root_app or self.app, scope),
+                status,
+                time.perf_counter() - start,
+                request_bytes,
+                response_bytes
+            )
@@ -9,16 +9,65 @@ Implements cognitive "optimal grip" through:
 - Multi-scale perception
 
 This provides the cognitive enhancement layer described in OPTIMAL_GRIP_ANALYSIS.md Phase 4.
+
+Importing this module is cheap: numpy is only imported when an engine
+first loads, and PatternSalienceEngine(lazy=True) defers all loading.
 """
 
+from __future__ import annotations
+
+import hashlib
+import io
 import json
-import numpy as np
-from typing import List, Dict, Set, Tuple, Optional
+import os
+import pickle
+import struct
+import threading
+import time
+from typing import (List, Dict, Set, Tuple, Optional, Any, Hashable, Sequence, Union,
+                    Iterable, Iterator, AsyncIterable, AsyncIterator)
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import defaultdict, OrderedDict, Counter, deque
 import re
 
 
+np = None  # numpy, imported by _import_numpy() when an engine first loads
+
+
+def _import_numpy():
+    """Import numpy for the engine; raises ImportError if it is not installed"""
+    global np
+    if np is None:
+        import numpy
+        np = numpy
+    return np
+
+CATEGORY_FILES = [
+    ('category_towns.json', 'Towns'),
+    ('category_buildings.json', 'Buildings'),
+    ('category_construction.json', 'Construction')
+]
+
+FEATURE_CACHE_VERSION = 3
+
+# Engine attributes built from the pattern data, saved in the feature cache
+_FEATURE_ATTRS = (
+    'patterns', 'category_map', 'pattern_features', 'pattern_order', 'pattern_index',
+    '_centrality', '_asterisks', '_category_masks', 'keyword_index', '_keyword_weights',
+    '_adjacency', '_focus_neighbors', 'similarity_matrix',
+)
+
+# Shared state file: magic, header length, pickled header, aligned array data
+SHARED_STATE_MAGIC = b'PSESTATE'
+_SHARED_STATE_ALIGN = 64
+
+
+def feature_cache_path_for(pattern_json_path: str) -> str:
+    """Feature cache file stored next to the pattern JSON"""
+    head, tail = os.path.split(pattern_json_path)
+    return os.path.join(head, os.path.splitext(tail)[0] + '.features.pkl')
+
+
 @dataclass
 class PatternContext:
     """Context for salience computation"""
@@ -28,6 +77,17 @@ class PatternContext:
     keywords: Set[str] = field(default_factory=set)
     domain: Optional[str] = None  # physical, social, conceptual, individual
     scale: Optional[str] = None  # town, building, construction
+    
+    def cache_key(self) -> Tuple:
+        """Canonical hashable form: equal contexts give equal keys"""
+        return (
+            tuple(sorted(self.focus_patterns)),
+            self.current_category,
+            self.current_sequence,
+            tuple(sorted(self.keywords)),
+            self.domain,
+            self.scale,
+        )
 
 
 @dataclass
@@ -41,6 +101,187 @@ class SalienceScore:
         return self.score < other.score
 
 
+def _freeze_scores(scores: Sequence[SalienceScore]) -> tuple:
+    """Immutable copy of a ranking, for the salience cache"""
+    return tuple((s.pattern_id, s.score, tuple(s.reasons)) for s in scores)
+
+
+def _thaw_scores(frozen: tuple) -> List[SalienceScore]:
+    """Fresh SalienceScore objects from a cached ranking"""
+    return [SalienceScore(pattern_id, score, list(reasons)) for pattern_id, score, reasons in frozen]
+
+
+@dataclass
+class EmergenceEvent:
+    """Emergence starting or ending in a stream of patterns"""
+    step: int  # Index of the pattern that crossed the threshold
+    kind: str  # "start" or "end"
+    emergence_score: float
+    sequence_coherence: float
+    categories_involved: List[str]
+    window: List[str]  # Patterns in the window at that step
+    interpretation: str
+
+
+KEYWORD_RE = re.compile(r'\b\w{4,}\b')  # Words 4+ chars
+
+
+def normalize_keyword(word: str) -> str:
+    """Lowercase a keyword and lightly stem plural endings"""
+    word = word.strip().lower()
+    if len(word) > 4 and word.endswith('ies'):
+        return word[:-3] + 'y'
+    if word.endswith('sses'):
+        return word[:-2]
+    if len(word) > 3 and word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+        return word[:-1]
+    return word
+
+
+def extract_keywords(text: str, stem: bool = False) -> Set[str]:
+    """Lowercase keywords of a text, stemmed with normalize_keyword if stem is set"""
+    words = KEYWORD_RE.findall(text.lower())
+    return {normalize_keyword(word) for word in words} if stem else set(words)
+
+
+class KeywordIndex:
+    """
+    Inverted keyword -> pattern rows index
+    
+    Keywords are interned as integer token IDs; postings[token] holds the
+    rows containing it and idf[token] its inverse document frequency.
+    With stem set, looked-up keywords are normalized as the documents were.
+    """
+    
+    def __init__(self, documents: Sequence[Set[str]], stem: bool = False):
+        """Index one set of keywords per row"""
+        self.stem = stem
+        self.token_ids: Dict[str, int] = {}
+        rows: List[List[int]] = []
+        for row, keywords in enumerate(documents):
+            for keyword in keywords:
+                token = self.token_ids.setdefault(keyword, len(rows))
+                if token == len(rows):
+                    rows.append([])
+                rows[token].append(row)
+        
+        self.postings = [np.array(r, dtype=np.intp) for r in rows]
+        doc_freq = np.array([len(r) for r in rows], dtype=float)
+        self.idf = np.log(1.0 + (len(documents) - doc_freq + 0.5) / (doc_freq + 0.5))
+    
+    def __len__(self) -> int:
+        return len(self.postings)
+    
+    def lookup(self, keywords) -> List[int]:
+        """Sorted token IDs of the indexed keywords among the given ones"""
+        if self.stem:
+            keywords = map(normalize_keyword, keywords)
+        return sorted({self.token_ids[k] for k in keywords if k in self.token_ids})
+
+
+class SalienceCache:
+    """
+    Bounded LRU cache of salience rankings with optional expiry
+    
+    Entries older than ttl seconds are treated as misses. A capacity of 0
+    disables caching.
+    """
+    
+    def __init__(self, capacity: int = 1024, ttl: Optional[float] = None):
+        self.capacity = capacity
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()  # key -> (stored_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value (marking it most recent) or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and \
+               time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """Insert or replace a value, evicting the oldest entry if full"""
+        if self.capacity < 1:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'capacity': self.capacity,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+        }
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _SHARED_STATE_ALIGN) * _SHARED_STATE_ALIGN
+
+
+class _SharedStatePickler(pickle.Pickler):
+    """Pickler that lays numeric arrays out flat instead of embedding them"""
+    
+    def __init__(self, file):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.arrays: List[Tuple[int, Any]] = []  # (offset, array)
+        self.size = 0
+    
+    def persistent_id(self, obj):
+        if isinstance(obj, np.ndarray) and not obj.dtype.hasobject:
+            offset = _align(self.size)
+            self.arrays.append((offset, obj))
+            self.size = offset + obj.nbytes
+            return ('ndarray', offset, obj.dtype.str, obj.shape)
+        return None
+
+
+class _SharedStateUnpickler(pickle.Unpickler):
+    """Unpickler that views arrays in a (memory-mapped) buffer"""
+    
+    def __init__(self, file, buffer):
+        super().__init__(file)
+        self.buffer = buffer
+    
+    def persistent_load(self, pid):
+        kind, offset, dtype, shape = pid
+        if kind != 'ndarray':
+            raise pickle.UnpicklingError(f"Unknown persistent object: {kind}")
+        if self.buffer is None or 0 in shape:
+            return np.empty(shape, dtype=np.dtype(dtype))
+        return np.ndarray(shape, dtype=np.dtype(dtype), buffer=self.buffer, offset=offset)
+
+
 class PatternSalienceEngine:
     """
     Cognitive salience engine for pattern language
@@ -49,35 +290,265 @@ class PatternSalienceEngine:
     the gestalt salience landscape.
     """
     
-    def __init__(self, pattern_json_path: str):
-        """Initialize salience engine"""
-        self.load_patterns(pattern_json_path)
-        self.load_categories()
-        self._compute_pattern_features()
+    def __init__(
+        self,
+        pattern_json_path: str,
+        cache_size: int = 1024,
+        cache_ttl: Optional[float] = None,
+        keyword_weighting: str = 'count',
+        stem_keywords: bool = False,
+        lazy: bool = False,
+        feature_cache_path: Optional[str] = None,
+        verbose: bool = True
+    ):
+        """
+        Initialize salience engine
+        
+        Rankings are cached per context in an LRU of cache_size entries
+        (0 disables it) that expire after cache_ttl seconds if given.
+        keyword_weighting is 'count' (each matching keyword scores 2.0) or
+        'idf' (each scores 2.0 x its inverse document frequency). With
+        stem_keywords=True, pattern and context keywords are lowercased and
+        plural endings stemmed, so 'Cities' matches 'city'; by default
+        context keywords must equal a lowercase word of the pattern.
+        
+        With lazy=True nothing is loaded until ensure_loaded() or
+        load_in_background() is called, or a scoring method is first used;
+        the pattern tables are only set once loaded. If feature_cache_path
+        is given (see feature_cache_path_for()), the built features are
+        pickled there and reused while the SHA-256 digest of the pattern
+        and category JSON files is unchanged.
+        """
+        if keyword_weighting not in ('count', 'idf'):
+            raise ValueError(f"Unknown keyword weighting: {keyword_weighting}")
+        self.keyword_weighting = keyword_weighting
+        self.stem_keywords = stem_keywords
+        self.salience_cache = SalienceCache(cache_size, cache_ttl)
+        self.pattern_json_path = pattern_json_path
+        self.feature_cache_path = feature_cache_path
+        self.verbose = verbose
+        self.load_error: Optional[str] = None
+        self._load_lock = threading.Lock()
+        self._ready = False
+        if not lazy:
+            self.ensure_loaded()
+    
+    @property
+    def ready(self) -> bool:
+        """True once patterns are loaded and features are built"""
+        return self._ready
+    
+    def ensure_loaded(self):
+        """Load patterns and build features (or read them from the cache) if not done yet"""
+        if self._ready:
+            return
+        with self._load_lock:
+            if self._ready:
+                return
+            _import_numpy()
+            # Taken before any JSON is read, so the cache never records the
+            # digest of newer sources than the features were built from
+            digest = self._source_digest()
+            if not self._load_feature_cache(digest):
+                self.load_patterns(self.pattern_json_path)
+                self.load_categories()
+                self._compute_pattern_features()
+                self._save_feature_cache(digest)
+            self._ready = True
+    
+    def load_in_background(self) -> threading.Thread:
+        """Start loading in a daemon thread; failures are kept in load_error"""
+        def load():
+            try:
+                self.ensure_loaded()
+            except Exception as e:
+                self.load_error = f"{type(e).__name__}: {e}"
+        
+        thread = threading.Thread(target=load, name='salience-engine-load', daemon=True)
+        thread.start()
+        return thread
+    
+    def reload(self, pattern_json_path: str):
+        """Reload patterns and categories, rebuilding features and clearing the cache"""
+        with self._load_lock:
+            _import_numpy()
+            self.pattern_json_path = pattern_json_path
+            digest = self._source_digest()
+            self.load_patterns(pattern_json_path)
+            self.load_categories()
+            self._compute_pattern_features()
+            self._save_feature_cache(digest)
+            self._ready = True
+    
+    def _feature_sources(self) -> List[str]:
+        """Files the features are derived from"""
+        return [self.pattern_json_path] + [file for file, _ in CATEGORY_FILES]
+    
+    def _source_digest(self) -> str:
+        """SHA-256 over the contents of the feature sources (missing files count too)"""
+        h = hashlib.sha256()
+        for source in self._feature_sources():
+            try:
+                with open(source, 'rb') as f:
+                    data = f.read()
+            except OSError:
+                h.update(b'\xff' * 8)
+                continue
+            h.update(struct.pack('<Q', len(data)))
+            h.update(data)
+        return h.hexdigest()
+    
+    def _load_feature_cache(self, digest: Optional[str] = None) -> bool:
+        """Restore features from the feature cache if it was built from the current sources"""
+        path = self.feature_cache_path
+        if not path:
+            return False
+        try:
+            with open(path, 'rb') as f:
+                cached = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return False
+        
+        if digest is None:
+            digest = self._source_digest()
+        if cached.get('version') != FEATURE_CACHE_VERSION or \
+           cached.get('source_digest') != digest or \
+           cached.get('keyword_weighting') != self.keyword_weighting or \
+           cached.get('stem_keywords') != self.stem_keywords or \
+           cached.get('pattern_json_path') != self.pattern_json_path:
+            return False
+        for name in _FEATURE_ATTRS:
+            setattr(self, name, cached['features'][name])
+        self.salience_cache.clear()
+        
+        if self.verbose:
+            print(f"Loaded {len(self.patterns)} patterns from feature cache {path}")
+        return True
+    
+    def _save_feature_cache(self, digest: Optional[str] = None):
+        """Write features to the feature cache, if configured; failures are ignored"""
+        path = self.feature_cache_path
+        if not path:
+            return
+        cached = {
+            'version': FEATURE_CACHE_VERSION,
+            'source_digest': digest if digest is not None else self._source_digest(),
+            'keyword_weighting': self.keyword_weighting,
+            'stem_keywords': self.stem_keywords,
+            'pattern_json_path': self.pattern_json_path,
+            'features': {name: getattr(self, name) for name in _FEATURE_ATTRS},
+        }
+        try:
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+    
+    def save_shared_state(self, path: str):
+        """
+        Write the built features to path for attach_shared_state()
+        
+        Numeric arrays (similarity matrix, masks, keyword postings, ...) are
+        stored flat after a pickled header, so every process that attaches
+        maps the same pages instead of holding its own copy. The rest (pattern
+        dicts, per-pattern features, the keyword token table and category
+        maps) is in the header and unpickled by each process.
+        """
+        self.ensure_loaded()
+        header = io.BytesIO()
+        pickler = _SharedStatePickler(header)
+        pickler.dump({
+            'version': FEATURE_CACHE_VERSION,
+            'keyword_weighting': self.keyword_weighting,
+            'stem_keywords': self.stem_keywords,
+            'pattern_json_path': self.pattern_json_path,
+            'features': {name: getattr(self, name) for name in _FEATURE_ATTRS},
+        })
+        header = header.getvalue()
+        data_start = _align(len(SHARED_STATE_MAGIC) + 8 + len(header))
+        
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(SHARED_STATE_MAGIC)
+            f.write(struct.pack('<Q', len(header)))
+            f.write(header)
+            for offset, array in pickler.arrays:
+                f.seek(data_start + offset)
+                f.write(np.ascontiguousarray(array).tobytes())
+            f.truncate(data_start + pickler.size)
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def attach_shared_state(
+        cls,
+        path: str,
+        cache_size: int = 1024,
+        cache_ttl: Optional[float] = None,
+        verbose: bool = True
+    ) -> PatternSalienceEngine:
+        """
+        Engine over features written by save_shared_state()
+        
+        Arrays are memory-mapped read-only rather than copied, and nothing
+        is rebuilt, so attaching takes milliseconds. The pattern dicts,
+        features, keyword token table and category maps are still ordinary
+        Python objects private to each process: for the 253 patterns about
+        1.9 MB of Python heap per attached process, against 2.8 MB when the
+        engine is built there, while the 1.2 MB of arrays is shared.
+        """
+        _import_numpy()
+        with open(path, 'rb') as f:
+            if f.read(len(SHARED_STATE_MAGIC)) != SHARED_STATE_MAGIC:
+                raise ValueError(f"Not a salience engine state file: {path}")
+            (header_size,) = struct.unpack('<Q', f.read(8))
+            header = f.read(header_size)
+        data_start = _align(len(SHARED_STATE_MAGIC) + 8 + header_size)
+        data_size = os.path.getsize(path) - data_start
+        buffer = None
+        if data_size > 0:
+            buffer = np.memmap(path, dtype=np.uint8, mode='r', offset=data_start, shape=(data_size,))
+        
+        state = _SharedStateUnpickler(io.BytesIO(header), buffer).load()
+        if state.get('version') != FEATURE_CACHE_VERSION:
+            raise ValueError(f"Incompatible salience engine state file: {path}")
+        
+        engine = cls(
+            state['pattern_json_path'],
+            cache_size=cache_size,
+            cache_ttl=cache_ttl,
+            keyword_weighting=state['keyword_weighting'],
+            stem_keywords=state['stem_keywords'],
+            lazy=True,
+            verbose=verbose
+        )
+        for name in _FEATURE_ATTRS:
+            setattr(engine, name, state['features'][name])
+        engine._ready = True
+        if verbose:
+            print(f"Attached to {len(engine.patterns)} patterns in {path}")
+        return engine
     
     def load_patterns(self, json_path: str):
         """Load pattern data"""
         with open(json_path, 'r') as f:
             data = json.load(f)
         
+        self.pattern_json_path = json_path
         self.patterns = {}
         if 'patterns' in data:
             for pattern in data['patterns']:
                 self.patterns[pattern['id']] = pattern
         
-        print(f"Loaded {len(self.patterns)} patterns")
+        if self.verbose:
+            print(f"Loaded {len(self.patterns)} patterns")
     
     def load_categories(self):
         """Load category information"""
         self.category_map = {}
         
-        category_files = [
-            ('category_towns.json', 'Towns'),
-            ('category_buildings.json', 'Buildings'),
-            ('category_construction.json', 'Construction')
-        ]
-        
-        for file, cat_name in category_files:
+        for file, cat_name in CATEGORY_FILES:
             try:
                 with open(file, 'r') as f:
                     cat_data = json.load(f)
@@ -109,21 +580,31 @@ class PatternSalienceEngine:
             # Extract keywords from problem and solution
             text = (pattern.get('problem', '') + ' ' + 
                    pattern.get('solution', '') + ' ' +
-                   pattern.get('name', '')).lower()
-            keywords = set(re.findall(r'\b\w{4,}\b', text))  # Words 4+ chars
-            features['keywords'] = keywords
+                   pattern.get('name', ''))
+            features['keywords'] = extract_keywords(text, self.stem_keywords)
             
             self.pattern_features[pattern_id] = features
         
         # Compute centrality scores
         self._compute_centrality()
+        self._build_score_arrays()
+        self._build_similarity_matrix()
+        
+        # Cached rankings were computed from the previous features
+        self.salience_cache.clear()
     
     def _compute_centrality(self):
         """Compute pattern centrality in the network"""
-        # Simple centrality based on connections
+        from pattern_centrality import load_centrality, network_centrality
+        
+        # PageRank, betweenness and eigenvector centrality, cached on disk
+        measures = load_centrality(self.pattern_json_path, self.patterns)
+        network = network_centrality(measures)
+        
         for pattern_id, features in self.pattern_features.items():
-            # Patterns with more connections are more central
-            centrality = (features['num_preceding'] + features['num_following']) / 10.0
+            features.update(measures[pattern_id])
+            # Patterns central to the network are more central
+            centrality = network[pattern_id] * 2.5
             # Patterns with more asterisks are more important
             centrality += features['asterisks'] * 0.5
             # Earlier patterns tend to be more fundamental
@@ -131,87 +612,329 @@ class PatternSalienceEngine:
             
             features['centrality'] = min(centrality, 5.0)  # Cap at 5.0
     
+    def _build_score_arrays(self):
+        """Pre-compute per-pattern arrays for scoring all patterns at once"""
+        self.pattern_order = list(self.pattern_features.keys())
+        self.pattern_index = {pid: i for i, pid in enumerate(self.pattern_order)}
+        n = len(self.pattern_order)
+        features = [self.pattern_features[pid] for pid in self.pattern_order]
+        
+        self._centrality = np.array([f['centrality'] for f in features], dtype=float)
+        self._asterisks = np.array([f['asterisks'] for f in features], dtype=float)
+        
+        # Category -> boolean row mask
+        self._category_masks = {}
+        for i, f in enumerate(features):
+            mask = self._category_masks.setdefault(f['category'], np.zeros(n, dtype=bool))
+            mask[i] = True
+        
+        # Sparse pattern x keyword matrix, stored as keyword -> pattern rows
+        self.keyword_index = KeywordIndex([f['keywords'] for f in features], self.stem_keywords)
+        for f in features:
+            f['keyword_ids'] = frozenset(self.keyword_index.token_ids[k] for k in f['keywords'])
+        if self.keyword_weighting == 'idf':
+            self._keyword_weights = self.keyword_index.idf.tolist()
+        else:
+            self._keyword_weights = [1.0] * len(self.keyword_index)
+        
+        # adjacency[f, p] is the network proximity boost pattern p gets when
+        # pattern f is in focus: 3.0 if p follows f, plus 2.0 if p precedes f
+        rows_by_number = defaultdict(list)
+        for i, f in enumerate(features):
+            rows_by_number[f['number']].append(i)
+        self._adjacency = np.zeros((n, n))
+        for i, pid in enumerate(self.pattern_order):
+            pattern = self.patterns[pid]
+            for number in set(pattern.get('following_patterns', [])):
+                self._adjacency[i, rows_by_number.get(number, [])] += 3.0
+            for number in set(pattern.get('preceding_patterns', [])):
+                self._adjacency[i, rows_by_number.get(number, [])] += 2.0
+        
+        # Rows whose score changes when each pattern enters or leaves focus
+        self._focus_neighbors = [np.flatnonzero(row) for row in self._adjacency]
+    
+    def _build_similarity_matrix(self):
+        """Pre-compute pairwise similarity of all patterns (see _compute_pattern_similarity)"""
+        n = len(self.pattern_order)
+        
+        # Shared keyword counts as a product of the binary pattern x keyword matrix
+        keyword_matrix = np.zeros((n, len(self.keyword_index)), dtype=np.float32)
+        for column, rows in enumerate(self.keyword_index.postings):
+            keyword_matrix[rows, column] = 1.0
+        common_keywords = (keyword_matrix @ keyword_matrix.T).astype(float)
+        
+        categories = np.array([self.pattern_features[pid]['category'] for pid in self.pattern_order])
+        same_category = categories[:, None] == categories[None, :]
+        
+        # Terms are added in the same order as the scalar formula did
+        similarity = np.where(same_category, 0.3, 0.0)
+        similarity += np.minimum(common_keywords / 10.0, 0.4)
+        similarity += np.where(self._adjacency > 0, 0.3, 0.0)
+        self.similarity_matrix = np.minimum(similarity, 1.0)
+    
+    def compute_salience_vector(self, context: PatternContext) -> np.ndarray:
+        """
+        Compute salience scores for every pattern at once
+        
+        Returns an array aligned with self.pattern_order whose values equal
+        compute_salience(pattern_id, context).score.
+        """
+        self.ensure_loaded()
+        return self._finish_scores(self._context_boost(context) + self._keyword_scores(context))
+    
+    def _context_boost(self, context: PatternContext) -> np.ndarray:
+        """
+        Focus, category and network parts of every score (components 1-3)
+        
+        These components are whole numbers, so summing them in any order
+        is exact.
+        """
+        n = len(self.pattern_order)
+        boost = np.zeros(n)
+        focus_rows = [self.pattern_index[pid] for pid in context.focus_patterns
+                      if pid in self.pattern_index]
+        
+        if focus_rows:
+            boost[focus_rows] += 10.0
+        if context.current_category and context.current_category in self._category_masks:
+            boost[self._category_masks[context.current_category]] += 5.0
+        if focus_rows:
+            boost += self._adjacency[focus_rows].sum(axis=0)
+        return boost
+    
+    def _keyword_scores(self, context: PatternContext) -> np.ndarray:
+        """
+        Keyword part of every score (component 4)
+        
+        Walks the postings of the context's keywords only. Weights are
+        accumulated in token order, as compute_salience does.
+        """
+        rows, weights = self._keyword_postings(context.keywords)
+        return np.bincount(rows, weights=weights, minlength=len(self.pattern_order)) * 2.0
+    
+    def _keyword_postings(self, keywords) -> Tuple[np.ndarray, np.ndarray]:
+        """Concatenated postings of the given keywords and each row's weight"""
+        tokens = self.keyword_index.lookup(keywords)
+        if not tokens:
+            return np.zeros(0, dtype=np.intp), np.zeros(0)
+        postings = [self.keyword_index.postings[t] for t in tokens]
+        weights = [np.full(len(rows), self._keyword_weights[t]) for t, rows in zip(tokens, postings)]
+        return np.concatenate(postings), np.concatenate(weights)
+    
+    def _finish_scores(self, boost: np.ndarray, rows=slice(None)) -> np.ndarray:
+        """
+        Add centrality and importance to context and keyword boosts
+        
+        Terms are added in the same order as compute_salience so the floats
+        match bit for bit.
+        """
+        return (boost + self._centrality[rows] * 0.5) + self._asterisks[rows] * 1.5
+    
+    def _top_rows(self, scores: np.ndarray, limit: int) -> np.ndarray:
+        """Rows with positive scores, best first, ties in pattern order"""
+        candidates = np.flatnonzero(scores > 0)
+        if 0 < limit < len(candidates):
+            # Keep everything tied with the k-th best so ties break correctly
+            kth = np.partition(scores[candidates], len(candidates) - limit)[len(candidates) - limit]
+            candidates = candidates[scores[candidates] >= kth]
+        order = np.lexsort((candidates, -scores[candidates]))
+        return candidates[order][:limit]
+    
     def compute_salience(
         self,
         pattern_id: str,
-        context: PatternContext
+        context: PatternContext,
+        explain: bool = True
     ) -> SalienceScore:
         """
         Compute salience score for a pattern given context
         
         Higher scores indicate higher relevance in the current context.
+        With explain=False the reasons list is left empty.
         """
+        self.ensure_loaded()
         if pattern_id not in self.pattern_features:
             return SalienceScore(pattern_id, 0.0, ["Pattern not found"])
         
         features = self.pattern_features[pattern_id]
         score = 0.0
-        reasons = []
         
         # 1. Focus proximity: Is this pattern directly in focus?
         if pattern_id in context.focus_patterns:
             score += 10.0
-            reasons.append("In focus set")
         
         # 2. Category match
         if context.current_category and features['category'] == context.current_category:
             score += 5.0
+        
+        # 3. Network proximity: Connected to focus patterns?
+        pattern = self.patterns[pattern_id]
+        for focus_id in context.focus_patterns:
+            if focus_id in self.patterns:
+                focus_pattern = self.patterns[focus_id]
+                # Check if connected
+                if pattern['number'] in focus_pattern.get('following_patterns', []):
+                    score += 3.0
+                if pattern['number'] in focus_pattern.get('preceding_patterns', []):
+                    score += 2.0
+        
+        # 4. Keyword overlap
+        if context.keywords:
+            matched = [self._keyword_weights[t] for t in self.keyword_index.lookup(context.keywords)
+                       if t in features['keyword_ids']]
+            score += sum(matched) * 2.0
+        
+        # 5. Centrality: More central patterns get slight boost
+        score += features['centrality'] * 0.5
+        
+        # 6. Importance (asterisks)
+        score += features['asterisks'] * 1.5
+        
+        reasons = self.explain_salience(pattern_id, context) if explain else []
+        return SalienceScore(pattern_id, score, reasons)
+    
+    def explain_salience(self, pattern_id: str, context: PatternContext) -> List[str]:
+        """Reasons behind a pattern's salience score, one per contributing factor"""
+        self.ensure_loaded()
+        if pattern_id not in self.pattern_features:
+            return ["Pattern not found"]
+        
+        features = self.pattern_features[pattern_id]
+        reasons = []
+        
+        if pattern_id in context.focus_patterns:
+            reasons.append("In focus set")
+        
+        if context.current_category and features['category'] == context.current_category:
             reasons.append(f"Matches category: {context.current_category}")
         
-        # 3. Keyword overlap
         if context.keywords:
-            overlap = features['keywords'].intersection(context.keywords)
-            keyword_score = len(overlap) * 2.0
-            if keyword_score > 0:
-                score += keyword_score
+            overlap = features['keyword_ids'].intersection(self.keyword_index.lookup(context.keywords))
+            if overlap:
                 reasons.append(f"Keyword overlap: {len(overlap)} matches")
         
-        # 4. Network proximity: Connected to focus patterns?
         pattern = self.patterns[pattern_id]
         for focus_id in context.focus_patterns:
             if focus_id in self.patterns:
                 focus_pattern = self.patterns[focus_id]
-                # Check if connected
                 if pattern['number'] in focus_pattern.get('following_patterns', []):
-                    score += 3.0
                     reasons.append(f"Follows focus pattern {focus_id}")
                 if pattern['number'] in focus_pattern.get('preceding_patterns', []):
-                    score += 2.0
                     reasons.append(f"Precedes focus pattern {focus_id}")
         
-        # 5. Centrality: More central patterns get slight boost
-        centrality_boost = features['centrality'] * 0.5
-        score += centrality_boost
-        if centrality_boost > 1.0:
+        if features['centrality'] * 0.5 > 1.0:
             reasons.append(f"High centrality: {features['centrality']:.2f}")
         
-        # 6. Importance (asterisks)
-        importance_boost = features['asterisks'] * 1.5
-        score += importance_boost
-        if importance_boost > 0:
+        if features['asterisks'] * 1.5 > 0:
             reasons.append(f"Importance: {features['asterisks']} asterisks")
         
-        return SalienceScore(pattern_id, score, reasons)
+        return reasons
     
     def rank_patterns_by_salience(
         self,
         context: PatternContext,
-        limit: int = 20
+        limit: int = 20,
+        explain: bool = True
     ) -> List[SalienceScore]:
         """
         Rank all patterns by salience in given context
         
-        Returns top N patterns most relevant to context.
+        Returns top N patterns most relevant to context. Reasons are only
+        generated for the returned patterns, and not at all with
+        explain=False. Rankings are served from the salience cache when the
+        same context was ranked before; the cache keeps immutable copies, so
+        callers may modify the returned scores.
         """
-        scores = []
-        for pattern_id in self.patterns.keys():
-            salience = self.compute_salience(pattern_id, context)
-            if salience.score > 0:
-                scores.append(salience)
+        self.ensure_loaded()
+        key = (context.cache_key(), limit, explain)
+        cached = self.salience_cache.get(key)
+        if cached is not None:
+            return _thaw_scores(cached)
         
-        # Sort by score descending
-        scores.sort(reverse=True)
-        return scores[:limit]
+        results = self._ranked(context, self.compute_salience_vector(context), limit, explain)
+        self.salience_cache.put(key, _freeze_scores(results))
+        return results
+    
+    def rank_patterns_by_salience_batch(
+        self,
+        contexts: Sequence[PatternContext],
+        limit: Union[int, Sequence[int]] = 20,
+        explain: Union[bool, Sequence[bool]] = True
+    ) -> List[List[SalienceScore]]:
+        """
+        Rank all patterns for many contexts at once
+        
+        limit and explain apply to every context or give one value per
+        context. Contexts missing from the salience cache are scored
+        together by compute_salience_matrix. Results match
+        rank_patterns_by_salience for each context.
+        """
+        self.ensure_loaded()
+        limits = [limit] * len(contexts) if isinstance(limit, int) else list(limit)
+        explains = [explain] * len(contexts) if isinstance(explain, bool) else list(explain)
+        
+        results: List[Optional[List[SalienceScore]]] = []
+        keys = []
+        misses = []
+        for i, context in enumerate(contexts):
+            key = (context.cache_key(), limits[i], explains[i])
+            cached = self.salience_cache.get(key)
+            results.append(_thaw_scores(cached) if cached is not None else None)
+            keys.append(key)
+            if cached is None:
+                misses.append(i)
+        
+        if misses:
+            scores = self.compute_salience_matrix([contexts[i] for i in misses])
+            for row, i in zip(scores, misses):
+                results[i] = self._ranked(contexts[i], row, limits[i], explains[i])
+                self.salience_cache.put(keys[i], _freeze_scores(results[i]))
+        return results
+    
+    def compute_salience_matrix(self, contexts: Sequence[PatternContext]) -> np.ndarray:
+        """
+        Compute salience scores for many contexts at once
+        
+        Returns a contexts x patterns array whose rows equal
+        compute_salience_vector for each context.
+        """
+        self.ensure_loaded()
+        m, n = len(contexts), len(self.pattern_order)
+        focus = np.zeros((m, n))
+        category_boost = np.zeros((m, n))
+        keyword_rows = []
+        keyword_weights = []
+        for i, context in enumerate(contexts):
+            focus[i, [self.pattern_index[pid] for pid in context.focus_patterns
+                      if pid in self.pattern_index]] = 1.0
+            if context.current_category and context.current_category in self._category_masks:
+                category_boost[i, self._category_masks[context.current_category]] = 5.0
+            rows, weights = self._keyword_postings(context.keywords)
+            keyword_rows.append(rows + i * n)
+            keyword_weights.append(weights)
+        
+        # Every focus, category and network boost is a whole number, so the
+        # matrix product is exact
+        boost = focus * 10.0 + category_boost + focus @ self._adjacency
+        keyword_scores = np.bincount(
+            np.concatenate(keyword_rows), weights=np.concatenate(keyword_weights), minlength=m * n
+        ).reshape(m, n) * 2.0
+        return self._finish_scores(boost + keyword_scores)
+    
+    def _ranked(
+        self,
+        context: PatternContext,
+        scores: np.ndarray,
+        limit: int,
+        explain: bool
+    ) -> List[SalienceScore]:
+        """Top patterns of a score vector as SalienceScores"""
+        results = []
+        for row in self._top_rows(scores, limit):
+            pattern_id = self.pattern_order[row]
+            reasons = self.explain_salience(pattern_id, context) if explain else []
+            results.append(SalienceScore(pattern_id, float(scores[row]), reasons))
+        return results
     
     def detect_gestalt_patterns(
         self,
@@ -221,77 +944,82 @@ class PatternSalienceEngine:
         """
         Detect gestalt (emergent) groupings in a set of patterns
         
-        Identifies clusters of patterns that form coherent wholes.
+        Identifies clusters of patterns that form coherent wholes using
+        average-linkage agglomerative clustering: the two clusters with the
+        highest mean pairwise similarity are merged until no pair of
+        clusters reaches the threshold.
         """
+        self.ensure_loaded()
         if len(pattern_ids) < 2:
             return []
         
-        # Compute similarity matrix
+        similarity = self._similarity_submatrix(pattern_ids)
         n = len(pattern_ids)
-        similarity = np.zeros((n, n))
         
-        for i, pid1 in enumerate(pattern_ids):
-            for j, pid2 in enumerate(pattern_ids):
-                if i == j:
-                    similarity[i, j] = 1.0
-                else:
-                    similarity[i, j] = self._compute_pattern_similarity(pid1, pid2)
-        
-        # Find clusters using simple threshold-based grouping
-        clusters = []
-        visited = set()
+        # pair_sums[a, b] is the total symmetric similarity between the
+        # members of clusters a and b; linkage[a, b] is its mean
+        pair_sums = (similarity + similarity.T) / 2.0
+        linkage = pair_sums.copy()
+        np.fill_diagonal(linkage, -np.inf)
+        sizes = np.ones(n)
+        active = np.ones(n, dtype=bool)
+        members = [[i] for i in range(n)]
         
-        for i, pattern_id in enumerate(pattern_ids):
-            if pattern_id in visited:
-                continue
-            
-            # Start new cluster
-            cluster = [pattern_id]
-            visited.add(pattern_id)
-            
-            # Find similar patterns
-            for j, other_id in enumerate(pattern_ids):
-                if other_id not in visited and similarity[i, j] >= threshold:
-                    cluster.append(other_id)
-                    visited.add(other_id)
+        while True:
+            a, b = np.unravel_index(np.argmax(linkage), linkage.shape)
+            if linkage[a, b] < threshold:
+                break
+            a, b = min(a, b), max(a, b)
             
+            # Merge cluster b into cluster a
+            members[a].extend(members[b])
+            members[b] = []
+            sizes[a] += sizes[b]
+            active[b] = False
+            pair_sums[a] += pair_sums[b]
+            pair_sums[:, a] = pair_sums[a]
+            linkage[a] = np.where(active, pair_sums[a] / (sizes[a] * sizes), -np.inf)
+            linkage[a, a] = -np.inf
+            linkage[:, a] = linkage[a]
+            linkage[b] = -np.inf
+            linkage[:, b] = -np.inf
+        
+        clusters = []
+        for cluster in members:
             if len(cluster) > 1:
+                cluster.sort()
+                block = similarity[np.ix_(cluster, cluster)]
+                off_diagonal = block.sum() - np.trace(block)
                 clusters.append({
-                    'patterns': cluster,
+                    'patterns': [pattern_ids[i] for i in cluster],
                     'size': len(cluster),
-                    'coherence': float(np.mean([similarity[pattern_ids.index(p1), pattern_ids.index(p2)]
-                                               for p1 in cluster for p2 in cluster if p1 != p2]))
+                    'coherence': float(off_diagonal / (len(cluster) * (len(cluster) - 1)))
                 })
         
         return sorted(clusters, key=lambda c: c['size'], reverse=True)
     
-    def _compute_pattern_similarity(self, pid1: str, pid2: str) -> float:
-        """Compute similarity between two patterns"""
-        if pid1 not in self.pattern_features or pid2 not in self.pattern_features:
-            return 0.0
-        
-        f1 = self.pattern_features[pid1]
-        f2 = self.pattern_features[pid2]
-        
-        similarity = 0.0
-        
-        # Same category
-        if f1['category'] == f2['category']:
-            similarity += 0.3
+    def _similarity_submatrix(self, pattern_ids: List[str]) -> np.ndarray:
+        """Similarity matrix for the given patterns, with 1.0 on the diagonal"""
+        n = len(pattern_ids)
+        rows = np.array([self.pattern_index.get(pid, -1) for pid in pattern_ids], dtype=np.intp)
+        known = np.flatnonzero(rows >= 0)
         
-        # Keyword overlap
-        common_keywords = f1['keywords'].intersection(f2['keywords'])
-        if common_keywords:
-            similarity += min(len(common_keywords) / 10.0, 0.4)
+        similarity = np.zeros((n, n))
+        similarity[np.ix_(known, known)] = self.similarity_matrix[np.ix_(rows[known], rows[known])]
+        np.fill_diagonal(similarity, 1.0)
+        return similarity
+    
+    def _compute_pattern_similarity(self, pid1: str, pid2: str) -> float:
+        """
+        Compute similarity between two patterns
         
-        # Connected in pattern network
-        p1 = self.patterns[pid1]
-        p2 = self.patterns[pid2]
-        if p2['number'] in p1.get('following_patterns', []) or \
-           p2['number'] in p1.get('preceding_patterns', []):
-            similarity += 0.3
+        0.3 for the same category, up to 0.4 for shared keywords (0.1 each)
+        and 0.3 if pid2 precedes or follows pid1 in the pattern network.
+        """
+        if pid1 not in self.pattern_index or pid2 not in self.pattern_index:
+            return 0.0
         
-        return min(similarity, 1.0)
+        return float(self.similarity_matrix[self.pattern_index[pid1], self.pattern_index[pid2]])
     
     def track_emergence(
         self,
@@ -302,6 +1030,7 @@ class PatternSalienceEngine:
         
         Detects when patterns combine to create emergent properties.
         """
+        self.ensure_loaded()
         if len(pattern_sequence) < 2:
             return {'emergence_detected': False}
         
@@ -325,7 +1054,7 @@ class PatternSalienceEngine:
         if len(unique_categories) > 1:
             emergence_score *= 1.5  # Boost for cross-category integration
         
-        emergence_detected = emergence_score > 0.5
+        emergence_detected = bool(emergence_score > 0.5)
         
         return {
             'emergence_detected': emergence_detected,
@@ -349,6 +1078,239 @@ class PatternSalienceEngine:
             return f"Very high emergence: Strong synergistic gestalt{cross_cat}"
 
 
+class SalienceSession:
+    """
+    Stateful salience ranking for a context that changes one step at a time
+    
+    Keeps the per-pattern score vector for the session's context. Adding or
+    removing a focus pattern, keyword or category only updates the scores
+    of the patterns that change, and each step returns the new top-k.
+    Call refresh() after the engine reloads its patterns.
+    """
+    
+    def __init__(
+        self,
+        engine: PatternSalienceEngine,
+        context: Optional[PatternContext] = None,
+        limit: int = 20,
+        explain: bool = True
+    ):
+        self.engine = engine
+        self.limit = limit
+        self.explain = explain
+        context = context or PatternContext()
+        self.context = PatternContext(
+            focus_patterns=set(context.focus_patterns),
+            current_category=context.current_category,
+            current_sequence=context.current_sequence,
+            keywords=set(context.keywords),
+            domain=context.domain,
+            scale=context.scale,
+        )
+        self.refresh()
+    
+    def refresh(self):
+        """Recompute every score from the session context"""
+        self.engine.ensure_loaded()
+        self._boost = self.engine._context_boost(self.context)
+        self._keywords = self.engine._keyword_scores(self.context)
+        rows, _ = self.engine._keyword_postings(self.context.keywords)
+        self._keyword_hits = np.bincount(rows, minlength=len(self._keywords))
+        self.scores = self.engine._finish_scores(self._boost + self._keywords)
+    
+    def _apply(self, rows, delta):
+        """Add delta (a scalar or one value per row) to the given rows' boosts and rescore them"""
+        if len(rows) == 0:
+            return
+        self._boost[rows] += delta
+        self._rescore(rows)
+    
+    def _rescore(self, rows):
+        self.scores[rows] = self.engine._finish_scores(self._boost[rows] + self._keywords[rows], rows)
+    
+    def add_focus(self, pattern_id: str) -> List[SalienceScore]:
+        """Bring a pattern into focus and return the updated top-k"""
+        if pattern_id not in self.context.focus_patterns:
+            self.context.focus_patterns.add(pattern_id)
+            self._shift_focus(pattern_id, 1.0)
+        return self.top()
+    
+    def remove_focus(self, pattern_id: str) -> List[SalienceScore]:
+        """Take a pattern out of focus and return the updated top-k"""
+        if pattern_id in self.context.focus_patterns:
+            self.context.focus_patterns.discard(pattern_id)
+            self._shift_focus(pattern_id, -1.0)
+        return self.top()
+    
+    def _shift_focus(self, pattern_id: str, sign: float):
+        """Apply (sign=1) or retract (sign=-1) a focus pattern's boosts"""
+        row = self.engine.pattern_index.get(pattern_id)
+        if row is None:
+            return
+        self._apply([row], sign * 10.0)
+        neighbors = self.engine._focus_neighbors[row]
+        self._apply(neighbors, sign * self.engine._adjacency[row, neighbors])
+    
+    def add_keyword(self, keyword: str) -> List[SalienceScore]:
+        """Add a context keyword and return the updated top-k"""
+        if keyword not in self.context.keywords:
+            self.context.keywords.add(keyword)
+            self._shift_keyword(keyword)
+        return self.top()
+    
+    def remove_keyword(self, keyword: str) -> List[SalienceScore]:
+        """Remove a context keyword and return the updated top-k"""
+        if keyword in self.context.keywords:
+            self.context.keywords.discard(keyword)
+            self._shift_keyword(keyword)
+        return self.top()
+    
+    def _shift_keyword(self, keyword: str):
+        """Rescore the patterns containing a keyword that was added or removed"""
+        rows, weights = self.engine._keyword_postings([keyword])
+        if len(rows):
+            sign = 1 if keyword in self.context.keywords else -1
+            np.add.at(self._keywords, rows, sign * 2.0 * weights)
+            np.add.at(self._keyword_hits, rows, sign)
+            # IDF weights may not cancel exactly, so clear rows no keyword matches
+            self._keywords[rows[self._keyword_hits[rows] == 0]] = 0.0
+            self._rescore(rows)
+    
+    def set_category(self, category: Optional[str]) -> List[SalienceScore]:
+        """Change the current category (None to clear) and return the updated top-k"""
+        masks = self.engine._category_masks
+        if category != self.context.current_category:
+            if self.context.current_category in masks:
+                self._apply(np.flatnonzero(masks[self.context.current_category]), -5.0)
+            if category in masks:
+                self._apply(np.flatnonzero(masks[category]), 5.0)
+            self.context.current_category = category
+        return self.top()
+    
+    def top(self, limit: Optional[int] = None) -> List[SalienceScore]:
+        """Current top-k patterns, as rank_patterns_by_salience would return them"""
+        limit = self.limit if limit is None else limit
+        return self.engine._ranked(self.context, self.scores, limit, self.explain)
+
+
+class EmergenceTracker:
+    """
+    Streaming emergence tracking over a sliding window of patterns
+    
+    Scores the last `window` patterns as track_emergence would, updating
+    the window's coherence sum and category counts in O(1) per pattern,
+    and emits an EmergenceEvent whenever the score crosses the threshold
+    in either direction. Only the window is kept in memory, so streams of
+    any length can be tracked.
+    """
+    
+    def __init__(
+        self,
+        engine: PatternSalienceEngine,
+        window: int = 8,
+        threshold: float = 0.5
+    ):
+        if window < 2:
+            raise ValueError(f"Emergence window must hold at least 2 patterns: {window}")
+        engine.ensure_loaded()
+        self.engine = engine
+        self.window = window
+        self.threshold = threshold
+        self.steps = 0
+        self.events = 0
+        self.emerging = False
+        self._patterns: deque = deque()
+        self._coherences: deque = deque()  # Similarity of each adjacent pair in the window
+        self._coherence_sum = 0.0
+        self._categories: Counter = Counter()
+        self._stream_coherence_sum = 0.0
+    
+    def step(self, pattern_id: str) -> Optional[EmergenceEvent]:
+        """Add the next pattern; returns an event if the threshold was crossed"""
+        engine = self.engine
+        if self._patterns:
+            coherence = engine._compute_pattern_similarity(self._patterns[-1], pattern_id)
+            self._coherences.append(coherence)
+            self._coherence_sum += coherence
+            self._stream_coherence_sum += coherence
+        self._patterns.append(pattern_id)
+        self._categories[engine.category_map.get(pattern_id, 'Unknown')] += 1
+        
+        if len(self._patterns) > self.window:
+            oldest = self._patterns.popleft()
+            self._coherence_sum -= self._coherences.popleft()
+            category = engine.category_map.get(oldest, 'Unknown')
+            self._categories[category] -= 1
+            if not self._categories[category]:
+                del self._categories[category]
+        
+        self.steps += 1
+        if self.steps % self.window == 0:
+            # Resynchronize the running sum so rounding errors cannot build up
+            self._coherence_sum = sum(self._coherences)
+        
+        if len(self._patterns) < 2:
+            return None
+        emerging = self.emergence_score > self.threshold
+        if emerging == self.emerging:
+            return None
+        self.emerging = emerging
+        self.events += 1
+        return self._event("start" if emerging else "end")
+    
+    @property
+    def sequence_coherence(self) -> float:
+        """Mean similarity of adjacent patterns in the window"""
+        return self._coherence_sum / len(self._coherences) if self._coherences else 0.0
+    
+    @property
+    def emergence_score(self) -> float:
+        """Window coherence, boosted 1.5x when it spans several categories"""
+        score = self.sequence_coherence
+        if len(self._categories) > 1:
+            score *= 1.5
+        return score
+    
+    def _event(self, kind: str) -> EmergenceEvent:
+        score = self.emergence_score
+        categories = set(self._categories)
+        return EmergenceEvent(
+            step=self.steps - 1,
+            kind=kind,
+            emergence_score=score,
+            sequence_coherence=self.sequence_coherence,
+            categories_involved=sorted(categories),
+            window=list(self._patterns),
+            interpretation=self.engine._interpret_emergence(score, categories)
+        )
+    
+    def stats(self) -> Dict[str, Any]:
+        """Summary of the stream so far"""
+        return {
+            'steps': self.steps,
+            'events': self.events,
+            'emerging': self.emerging,
+            'emergence_score': self.emergence_score,
+            'window_coherence': self.sequence_coherence,
+            'window_categories': sorted(self._categories),
+            'stream_coherence': self._stream_coherence_sum / max(1, self.steps - 1),
+        }
+    
+    def process(self, pattern_ids: Iterable[str]) -> Iterator[EmergenceEvent]:
+        """Consume a stream of pattern IDs, yielding events as they occur"""
+        for pattern_id in pattern_ids:
+            event = self.step(pattern_id)
+            if event is not None:
+                yield event
+    
+    async def aprocess(self, pattern_ids: AsyncIterable[str]) -> AsyncIterator[EmergenceEvent]:
+        """Consume an async stream of pattern IDs, yielding events as they occur"""
+        async for pattern_id in pattern_ids:
+            event = self.step(pattern_id)
+            if event is not None:
+                yield event
+
+
 def demo_salience_engine():
     """Demonstrate salience engine capabilities"""
     print("="*70)
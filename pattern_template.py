@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Pattern Templates
+
+Compiled {{placeholder}} templates rendered in a single pass, shared by
+the NPU-253 archetypal patterns and skill_framework's DomainTransformer.
+A template is split once into literal text and placeholder slots, so
+rendering is a single join rather than one str.replace per placeholder.
+"""
+
+import re
+from typing import Dict, Iterable, List, Mapping, Optional
+
+
+PLACEHOLDER_RE = re.compile(r"\{\{([^{}]+)\}\}")
+
+
+class CompiledTemplate:
+    """
+    Template split into literal text and placeholder slots
+
+    segments alternates literal text (even positions) and placeholder
+    names (odd positions), so rendering is one join over the list instead
+    of one full-text str.replace per placeholder.
+    """
+
+    __slots__ = ("text", "segments")
+
+    def __init__(self, text: str, names: Optional[Iterable[str]] = None):
+        """
+        Compile a template.
+
+        Args:
+            text: Template text containing {{name}} placeholders
+            names: Placeholders to treat as slots; any others are kept as
+                literal text. All placeholders are slots if omitted.
+        """
+        self.text = text
+        allowed = None if names is None else set(names)
+
+        parts = PLACEHOLDER_RE.split(text)
+        segments = [parts[0]]
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            if allowed is None or name in allowed:
+                segments.append(name)
+                segments.append(parts[i + 1])
+            else:
+                segments[-1] += f"{{{{{name}}}}}" + parts[i + 1]
+        self.segments: List[str] = segments
+
+    @property
+    def slots(self) -> List[str]:
+        """Placeholder names in template order (with repeats)"""
+        return self.segments[1::2]
+
+    def render(self, values: Mapping[str, str], default: Optional[str] = None) -> str:
+        """
+        Fill every slot from values.
+
+        Slots missing from values render as default, or as the original
+        {{name}} text when default is None.
+        """
+        out = self.segments[:]
+        for i in range(1, len(out), 2):
+            name = out[i]
+            value = values.get(name)
+            if value is None:
+                value = f"{{{{{name}}}}}" if default is None else default
+            out[i] = value
+        return "".join(out)
+
+    def render_domain(
+        self,
+        domain_mappings: Mapping[str, Mapping[str, str]],
+        domain: str,
+        default: Optional[str] = None
+    ) -> str:
+        """Fill slots from placeholder -> {domain: value} mappings"""
+        out = self.segments[:]
+        for i in range(1, len(out), 2):
+            name = out[i]
+            value = domain_mappings.get(name, {}).get(domain)
+            if value is None:
+                value = f"{{{{{name}}}}}" if default is None else default
+            out[i] = value
+        return "".join(out)
+
+
+def compile_template(text: str, names: Optional[Iterable[str]] = None) -> CompiledTemplate:
+    """Compile a {{placeholder}} template"""
+    return CompiledTemplate(text, names)
+
+
+def render_domains(
+    template: CompiledTemplate,
+    domain_mappings: Mapping[str, Mapping[str, str]],
+    domains: Iterable[str],
+    default: Optional[str] = None
+) -> Dict[str, str]:
+    """Render a compiled template once per domain"""
+    return {domain: template.render_domain(domain_mappings, domain, default) for domain in domains}
@@ -13,6 +13,8 @@ from typing import Dict, Any, Optional, List
 import json
 from pathlib import Path
 
+from pattern_template import CompiledTemplate
+
 
 class Domain(Enum):
     """Supported domains for pattern transformation"""
@@ -39,6 +41,7 @@ class DomainTransformer:
         """
         self.archetypal_patterns = {}
         self.placeholder_mappings = {}
+        self._templates: Dict[str, CompiledTemplate] = {}
         
         if archetypal_patterns_path:
             self.load_patterns(archetypal_patterns_path)
@@ -87,15 +90,11 @@ class DomainTransformer:
         archetypal = pattern.get('archetypal_pattern', '')
         domain_mappings = pattern.get('domain_mappings', {})
         
-        # Apply placeholder substitutions
-        transformed_text = archetypal
-        for placeholder, mappings in domain_mappings.items():
-            if domain_str in mappings:
-                placeholder_pattern = f"{{{{{placeholder}}}}}"
-                transformed_text = transformed_text.replace(
-                    placeholder_pattern,
-                    mappings[domain_str]
-                )
+        # Apply placeholder substitutions in one pass over the compiled template
+        template = self._templates.get(archetypal)
+        if template is None:
+            template = self._templates[archetypal] = CompiledTemplate(archetypal)
+        transformed_text = template.render_domain(domain_mappings, domain_str)
         
         return {
             'pattern_id': pattern_id,
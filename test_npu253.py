@@ -5,7 +5,10 @@ NPU-253 Test Suite
 Comprehensive tests for the Pattern Coprocessor Driver.
 """
 
+import os
 import sys
+import tempfile
+import threading
 import unittest
 from pathlib import Path
 
@@ -17,16 +20,31 @@ from npu253 import (
     NPUConfig,
     PatternMetadata,
     ArchetypalPattern,
+    LatencyHistogram,
+    CompiledTemplate,
+    bitset_ids,
     CMD_RESET,
     CMD_LOAD_PATTERNS,
     CMD_SELF_TEST,
+    CMD_QUERY_BY_ID,
+    CMD_QUERY_BY_NAME,
+    CMD_QUERY_BY_TEXT,
+    CMD_TRANSFORM,
+    CMD_GET_FOLLOWING,
+    CMD_GET_CATEGORY,
+    CMD_PROCESS_RING,
+    CMD_GET_NEIGHBORHOOD,
+    CMD_SHORTEST_PATH,
+    CMD_GET_PREREQUISITES,
     STATUS_IDLE,
     STATUS_PATTERNS_LOADED,
     STATUS_SELF_TEST_OK,
     ERR_NONE,
+    ERR_INVALID_CMD,
     ERR_PATTERN_NOT_FOUND,
     ERR_INVALID_DOMAIN,
     ERR_NOT_LOADED,
+    ERR_RING_FULL,
 )
 
 
@@ -96,6 +114,97 @@ class TestNPU253Loading(unittest.TestCase):
         self.assertTrue(status & STATUS_SELF_TEST_OK)
 
 
+class TestNPU253Snapshot(unittest.TestCase):
+    """Test binary snapshot loading"""
+    
+    def setUp(self):
+        """Set up test fixture"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.snapshot_path = os.path.join(self.tmpdir.name, "patterns.npusnap")
+        self.config = NPUConfig(verbose=False, snapshot_path=self.snapshot_path)
+    
+    def tearDown(self):
+        """Remove snapshot files"""
+        self.tmpdir.cleanup()
+    
+    def test_snapshot_written_and_reused(self):
+        """Test that a JSON load writes a snapshot the next load uses"""
+        reference = PatternCoprocessorDriver(self.config)
+        self.assertTrue(reference.load())
+        self.assertTrue(os.path.exists(self.snapshot_path))
+        
+        npu = PatternCoprocessorDriver(self.config)
+        self.assertTrue(npu._load_snapshot())
+        self.assertTrue(npu.load())
+        self.assertEqual(npu.patterns, reference.patterns)
+        self.assertEqual(npu.archetypal_patterns, reference.archetypal_patterns)
+        self.assertEqual(npu.sequences, reference.sequences)
+        self.assertEqual(npu.text_index.postings, reference.text_index.postings)
+        self.assertEqual(
+            [p.pattern_id for p in npu.query_by_text("garden")],
+            [p.pattern_id for p in reference.query_by_text("garden")]
+        )
+    
+    def test_snapshot_carries_indexes(self):
+        """Test that indexes loaded from a snapshot match freshly built ones"""
+        reference = PatternCoprocessorDriver(self.config)
+        self.assertTrue(reference.load())
+        npu = PatternCoprocessorDriver(self.config)
+        self.assertTrue(npu._load_snapshot())
+        self.assertTrue(npu.load())
+        
+        self.assertEqual(npu.name_index.exact, reference.name_index.exact)
+        self.assertEqual(npu.name_index.trigram_postings, reference.name_index.trigram_postings)
+        self.assertEqual(npu.query_by_name("sacred sitez").pattern_id, reference.query_by_name("sacred sitez").pattern_id)
+        
+        for pid in reference.patterns:
+            self.assertEqual(list(npu.graph.forward.neighbors(pid)), list(reference.graph.forward.neighbors(pid)))
+            self.assertEqual(list(npu.graph.undirected.neighbors(pid)), list(reference.graph.undirected.neighbors(pid)))
+            self.assertEqual(npu.graph.closure(pid), reference.graph.closure(pid))
+        self.assertEqual(npu.graph.neighborhood(1, 2, "both"), reference.graph.neighborhood(1, 2, "both"))
+        
+        for query in ('"south facing"', "garden*", "light window"):
+            self.assertEqual(npu.text_index.search(query), reference.text_index.search(query))
+        for pattern_id, pattern in reference.archetypal_patterns.items():
+            for domain in ("physical", "social", "conceptual", "individual"):
+                self.assertEqual(npu.transform_pattern(pattern_id, domain), pattern.transform_to_domain(domain))
+                self.assertEqual(npu.archetypal_patterns[pattern_id].render(domain), pattern.render(domain))
+    
+    def test_stale_snapshot_ignored(self):
+        """Test that a snapshot is used only while its sources are unchanged"""
+        pattern_copy = os.path.join(self.tmpdir.name, "patterns.json")
+        with open(self.config.pattern_data_path, "rb") as f:
+            source = f.read()
+        with open(pattern_copy, "wb") as f:
+            f.write(source)
+        self.config.pattern_data_path = pattern_copy
+        PatternCoprocessorDriver(self.config).load()
+        
+        # A newer mtime alone does not make the snapshot stale
+        snapshot_mtime = os.stat(self.snapshot_path).st_mtime_ns
+        os.utime(pattern_copy, ns=(snapshot_mtime + 10**9, snapshot_mtime + 10**9))
+        self.assertTrue(PatternCoprocessorDriver(self.config)._load_snapshot())
+        
+        with open(pattern_copy, "ab") as f:
+            f.write(b"\n")
+        self.assertFalse(PatternCoprocessorDriver(self.config)._load_snapshot())
+    
+    def test_corrupt_snapshot_falls_back(self):
+        """Test that a checksum mismatch falls back to JSON"""
+        PatternCoprocessorDriver(self.config).load()
+        with open(self.snapshot_path, "r+b") as f:
+            f.seek(-1, os.SEEK_END)
+            last = f.read(1)
+            f.seek(-1, os.SEEK_END)
+            f.write(bytes([last[0] ^ 0xFF]))
+        
+        npu = PatternCoprocessorDriver(self.config)
+        self.assertFalse(npu._load_snapshot())
+        self.assertTrue(npu.load())
+        self.assertEqual(npu.read_reg32(0x0C), len(npu.patterns))
+        self.assertGreater(len(npu.patterns), 0)
+
+
 class TestNPU253Queries(unittest.TestCase):
     """Test pattern query operations"""
     
@@ -138,6 +247,25 @@ class TestNPU253Queries(unittest.TestCase):
         error = self.npu.read_reg32(0x34)
         self.assertEqual(error, ERR_PATTERN_NOT_FOUND)
     
+    def test_query_by_name_normalized(self):
+        """Test name lookup ignores case, punctuation and number prefixes"""
+        pattern = self.npu.query_by_name("independent regions!", fuzzy=False)
+        self.assertIsNotNone(pattern)
+        self.assertEqual(pattern.pattern_id, 1)
+        
+        pattern = self.npu.query_by_name("Sacred Sites", fuzzy=False)
+        self.assertIsNotNone(pattern)
+        self.assertEqual(pattern.pattern_id, 24)
+    
+    def test_query_by_name_fuzzy(self):
+        """Test fuzzy fallback for near-miss names"""
+        self.assertIsNone(self.npu.query_by_name("bike paths & racks", fuzzy=False))
+        
+        pattern = self.npu.query_by_name("bike paths & racks")
+        self.assertIsNotNone(pattern)
+        self.assertEqual(pattern.name, "BIKE PATHS AND RACKS")
+        self.assertEqual(self.npu.read_reg32(0x24), 1)
+    
     def test_query_by_text(self):
         """Test full-text search"""
         results = self.npu.query_by_text("community")
@@ -150,6 +278,95 @@ class TestNPU253Queries(unittest.TestCase):
         self.assertEqual(count, len(results))
 
 
+class TestNPU253TextSearch(unittest.TestCase):
+    """Test inverted-index text search"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixture once for all tests"""
+        config = NPUConfig(verbose=False, text_search_mode="bm25")
+        cls.npu = PatternCoprocessorDriver(config)
+        cls.npu.load()
+    
+    def test_index_built_on_load(self):
+        """Test that every pattern is indexed at load time"""
+        self.assertEqual(len(self.npu.text_index), len(self.npu.patterns))
+        self.assertIn("community", self.npu.text_index.postings)
+    
+    def test_bm25_ranking(self):
+        """Test that BM25 results contain the term and are ranked"""
+        results = self.npu.query_by_text("garden")
+        self.assertGreater(len(results), 0)
+        
+        ranked = self.npu.text_index.search("garden")
+        self.assertEqual([p.pattern_id for p in results], [pid for pid, _ in ranked])
+        scores = [score for _, score in ranked]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+    
+    def test_bm25_all_terms_required(self):
+        """Test that every query term must match"""
+        both = {p.pattern_id for p in self.npu.query_by_text("garden light")}
+        garden = {p.pattern_id for p in self.npu.query_by_text("garden")}
+        light = {p.pattern_id for p in self.npu.query_by_text("light")}
+        self.assertEqual(both, garden & light)
+    
+    def test_bitset_prefilter(self):
+        """Test restricting text search to a pattern bitset"""
+        buildings = self.npu.pattern_bitset(category="buildings")
+        for mode in ("bm25", "substring"):
+            everything = self.npu.query_by_text("garden", mode=mode)
+            filtered = self.npu.query_by_text("garden", mode=mode, within=buildings)
+            self.assertEqual(filtered, [p for p in everything if 95 <= p.pattern_id <= 204])
+        self.assertEqual(self.npu.query_by_text("garden", within=0), [])
+    
+    def test_phrase_query(self):
+        """Test quoted phrase matching"""
+        results = self.npu.query_by_text('"independent regions"')
+        self.assertIn(1, [p.pattern_id for p in results])
+        for p in results:
+            self.assertIn("independent regions", self.npu._search_text[p.pattern_id])
+    
+    def test_prefix_query(self):
+        """Test prefix matching"""
+        prefix = {p.pattern_id for p in self.npu.query_by_text("garden*")}
+        exact = {p.pattern_id for p in self.npu.query_by_text("garden")}
+        self.assertTrue(exact <= prefix)
+        self.assertGreater(len(prefix), len(exact))
+    
+    def test_limit(self):
+        """Test result limit and result count register"""
+        results = self.npu.query_by_text("community", limit=3)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(self.npu.read_reg32(0x24), 3)
+    
+    def test_substring_mode(self):
+        """Test substring compatibility mode"""
+        results = self.npu.query_by_text("ommunit", mode="substring")
+        self.assertGreater(len(results), 0)
+        self.assertEqual(self.npu.query_by_text("ommunit"), [])
+        
+        expected = [
+            p for p in self.npu.patterns.values()
+            if "ommunit" in (p.name + " " + p.context + " " +
+                             p.problem_summary + " " + p.solution).lower()
+        ]
+        self.assertEqual(results, expected)
+    
+    def test_default_mode_is_substring(self):
+        """Test that the default config keeps substring search"""
+        npu = PatternCoprocessorDriver(NPUConfig(verbose=False))
+        npu.load()
+        self.assertEqual(npu.config.text_search_mode, "substring")
+        self.assertEqual(npu.query_by_text("light"), npu.query_by_text("light", mode="substring"))
+        self.assertEqual(len(npu.query_by_text("light")), 29)
+    
+    def test_invalid_mode(self):
+        """Test unknown search mode"""
+        results = self.npu.query_by_text("community", mode="regex")
+        self.assertEqual(results, [])
+        self.assertEqual(self.npu.read_reg32(0x34), ERR_INVALID_CMD)
+
+
 class TestNPU253Navigation(unittest.TestCase):
     """Test pattern relationship navigation"""
     
@@ -181,6 +398,67 @@ class TestNPU253Navigation(unittest.TestCase):
         
         error = self.npu.read_reg32(0x34)
         self.assertEqual(error, ERR_PATTERN_NOT_FOUND)
+    
+    def test_one_hop_matches_source_lists(self):
+        """Test that CSR neighbors reproduce the pattern link lists"""
+        for pattern_id, pattern in self.npu.patterns.items():
+            following = [p.pattern_id for p in self.npu.get_following_patterns(pattern_id)]
+            preceding = [p.pattern_id for p in self.npu.get_preceding_patterns(pattern_id)]
+            self.assertEqual(following, [pid for pid in pattern.following_patterns if pid in self.npu.patterns])
+            self.assertEqual(preceding, [pid for pid in pattern.preceding_patterns if pid in self.npu.patterns])
+    
+    def test_neighborhood(self):
+        """Test k-hop neighborhoods"""
+        one_hop = self.npu.get_neighborhood(1, hops=1)
+        self.assertEqual(one_hop, self.npu.get_following_patterns(1))
+        
+        two_hop = [p.pattern_id for p in self.npu.get_neighborhood(1, hops=2)]
+        self.assertNotIn(1, two_hop)
+        self.assertEqual(len(two_hop), len(set(two_hop)))
+        self.assertTrue(set(p.pattern_id for p in one_hop) <= set(two_hop))
+        self.assertEqual(self.npu.read_reg32(0x24), len(two_hop))
+        
+        self.assertEqual(self.npu.get_neighborhood(1, hops=2, direction="sideways"), [])
+        self.assertEqual(self.npu.read_reg32(0x34), ERR_INVALID_CMD)
+    
+    def test_find_path(self):
+        """Test shortest paths follow existing links"""
+        path = [p.pattern_id for p in self.npu.find_path(1, 253)]
+        self.assertEqual(path[0], 1)
+        self.assertEqual(path[-1], 253)
+        for a, b in zip(path, path[1:]):
+            self.assertIn(b, self.npu.patterns[a].following_patterns)
+        
+        self.assertEqual(self.npu.find_path(5, 5)[0].pattern_id, 5)
+        self.assertEqual(self.npu.find_path(1, 9999), [])
+        self.assertEqual(self.npu.read_reg32(0x34), ERR_PATTERN_NOT_FOUND)
+    
+    def test_prerequisites(self):
+        """Test transitive closure of preceding patterns"""
+        prerequisites = {p.pattern_id for p in self.npu.get_prerequisites(100)}
+        
+        # Compare with a plain breadth-first walk of the preceding lists
+        expected, stack = set(), [100]
+        while stack:
+            for pid in self.npu.patterns[stack.pop()].preceding_patterns:
+                if pid in self.npu.patterns and pid not in expected:
+                    expected.add(pid)
+                    stack.append(pid)
+        expected.discard(100)
+        self.assertEqual(prerequisites, expected)
+    
+    def test_navigation_ring_commands(self):
+        """Test navigation commands through the rings"""
+        completions = self.npu.execute_batch([
+            (CMD_GET_NEIGHBORHOOD, 1, 2),
+            (CMD_SHORTEST_PATH, 1, 253),
+            (CMD_GET_PREREQUISITES, 100),
+            (CMD_GET_PREREQUISITES, 9999),
+        ])
+        self.assertEqual(completions[0].result, self.npu.get_neighborhood(1, 2))
+        self.assertEqual(completions[1].result, self.npu.find_path(1, 253))
+        self.assertEqual(completions[2].result, self.npu.get_prerequisites(100))
+        self.assertEqual(completions[3].error, ERR_PATTERN_NOT_FOUND)
 
 
 class TestNPU253Categories(unittest.TestCase):
@@ -230,6 +508,39 @@ class TestNPU253Categories(unittest.TestCase):
         """Test getting invalid category"""
         results = self.npu.get_category("invalid_category")
         self.assertEqual(len(results), 0)
+    
+    def test_category_bitsets(self):
+        """Test category membership bitsets and member tuples"""
+        for name, category in self.npu.categories.items():
+            self.assertEqual(bitset_ids(category.bitset), category.pattern_ids)
+            self.assertEqual([p.pattern_id for p in category.patterns], category.pattern_ids)
+        
+        # Categories are derived from ID ranges; source metadata is left as loaded
+        self.assertEqual(self.npu.patterns[100].category, "")
+    
+    def test_get_category_returns_copy(self):
+        """Test that get_category() results are fresh lists of the members"""
+        results = self.npu.get_category("towns")
+        self.assertEqual([p.pattern_id for p in results], self.npu.categories["towns"].pattern_ids)
+        results.clear()
+        self.assertEqual(len(self.npu.get_category("towns")), len(self.npu.categories["towns"].pattern_ids))
+    
+    def test_filter_patterns(self):
+        """Test combined sequence, category and asterisk filters"""
+        results = self.npu.filter_patterns(sequence=12, category="towns", min_asterisks=1)
+        expected = [
+            pid for pid in sorted(self.npu.sequences[12].pattern_ids)
+            if 1 <= pid <= 94 and self.npu.patterns[pid].asterisks >= 1
+        ]
+        self.assertEqual([p.pattern_id for p in results], expected)
+        self.assertEqual(self.npu.read_reg32(0x24), len(expected))
+        
+        starred = self.npu.filter_patterns(category="buildings", min_asterisks=2)
+        self.assertTrue(all(p.asterisks == 2 and 95 <= p.pattern_id <= 204 for p in starred))
+        self.assertEqual(len(self.npu.filter_patterns()), len(self.npu.patterns))
+        
+        self.assertEqual(self.npu.filter_patterns(sequence=9999), [])
+        self.assertEqual(self.npu.read_reg32(0x34), ERR_PATTERN_NOT_FOUND)
 
 
 class TestNPU253Sequences(unittest.TestCase):
@@ -248,11 +559,25 @@ class TestNPU253Sequences(unittest.TestCase):
         self.assertIsInstance(results, list)
         # Sequences should have patterns
         self.assertGreater(len(results), 0)
+        expected = [pid for pid in self.npu.sequences[1].pattern_ids if pid in self.npu.patterns]
+        self.assertEqual([p.pattern_id for p in results], expected)
+        results.clear()
+        self.assertEqual(len(self.npu.get_sequence(1)), len(expected))
     
     def test_get_sequence_invalid(self):
         """Test getting invalid sequence"""
         results = self.npu.get_sequence(9999)
         self.assertEqual(len(results), 0)
+    
+    def test_sequence_memberships(self):
+        """Test that sequence bitsets and pattern memberships agree"""
+        for sequence_id, sequence in self.npu.sequences.items():
+            self.assertEqual(set(bitset_ids(sequence.bitset)), set(sequence.pattern_ids))
+            for pid in sequence.pattern_ids:
+                self.assertIn(sequence_id, self.npu.patterns[pid].sequence_memberships)
+        
+        memberships = sum(len(p.sequence_memberships) for p in self.npu.patterns.values())
+        self.assertEqual(memberships, sum(len(s.pattern_ids) for s in self.npu.sequences.values()))
 
 
 class TestNPU253Transformation(unittest.TestCase):
@@ -298,6 +623,53 @@ class TestNPU253Transformation(unittest.TestCase):
         
         error = self.npu.read_reg32(0x34)
         self.assertEqual(error, ERR_PATTERN_NOT_FOUND)
+    
+    def test_transform_cached(self):
+        """Test that renderings are computed once and reused"""
+        if not self.npu.archetypal_patterns:
+            self.skipTest("No archetypal patterns loaded")
+        
+        pattern_id = list(self.npu.archetypal_patterns.keys())[0]
+        first = self.npu.transform_pattern(pattern_id, "social")
+        second = self.npu.transform_pattern(pattern_id, "social")
+        self.assertIs(first, second)
+        self.assertNotIn("{{", first)
+    
+    def test_compiled_template(self):
+        """Test that compiled rendering matches the uncompiled str.replace render"""
+        def replace_render(pattern, domain):
+            result = pattern.archetypal_pattern
+            for placeholder in pattern.placeholders:
+                if placeholder in pattern.domain_mappings:
+                    value = pattern.domain_mappings[placeholder].get(domain, "{placeholder}")
+                    result = result.replace(f"{{{{{placeholder}}}}}", value)
+            return result
+        
+        pattern = ArchetypalPattern(
+            pattern_id="test",
+            name="Test",
+            archetypal_pattern="{{a}} within {{b}} near {{c}}, {{b}} again",
+            placeholders=["a", "b"],
+            domain_mappings={"a": {"physical": "rooms"}, "b": {"physical": "houses", "social": "families"}},
+        )
+        patterns = [pattern] + list(self.npu.archetypal_patterns.values())
+        for candidate in patterns:
+            for domain in ["physical", "social", "conceptual", "individual"]:
+                self.assertEqual(candidate.transform_to_domain(domain), replace_render(candidate, domain))
+        with self.assertRaises(ValueError):
+            pattern.transform_to_domain("invalid_domain")
+    
+    def test_template_engine(self):
+        """Test the shared single-pass template renderer"""
+        template = CompiledTemplate("{{x}} and {{y}}, then {{x}} again")
+        self.assertEqual(template.slots, ["x", "y", "x"])
+        self.assertEqual(template.render({"x": "A", "y": "B"}), "A and B, then A again")
+        self.assertEqual(template.render({"x": "A"}), "A and {{y}}, then A again")
+        self.assertEqual(template.render({"x": "A"}, default="?"), "A and ?, then A again")
+        self.assertEqual(
+            template.render_domain({"x": {"social": "S"}, "y": {"physical": "P"}}, "social"),
+            "S and {{y}}, then S again"
+        )
 
 
 class TestNPU253Cache(unittest.TestCase):
@@ -379,6 +751,46 @@ class TestNPU253Telemetry(unittest.TestCase):
         self.assertIsInstance(diag, str)
         self.assertGreater(len(diag), 0)
         self.assertIn("NPU-253", diag)
+        self.assertIn("p99_query_time_us", diag)
+        self.assertIn("=== Command Latency (us) ===", diag)
+    
+    def test_command_breakdown(self):
+        """Test per-command latency histograms"""
+        self.npu.query_by_id(1)
+        self.npu.query_by_name("Sacred Sites")
+        self.npu.query_by_text("garden")
+        self.npu.get_following_patterns(1)
+        self.npu.execute_batch([(CMD_QUERY_BY_ID, 2), (CMD_GET_FOLLOWING, 2)])
+        
+        stats = self.npu.telemetry.to_dict()
+        commands = stats["commands"]
+        self.assertEqual(commands["id"]["count"], 2)
+        self.assertEqual(commands["name"]["count"], 1)
+        self.assertEqual(commands["text"]["count"], 1)
+        self.assertEqual(commands["navigation"]["count"], 2)
+        self.assertEqual(stats["total_navigations"], 2)
+        self.assertLessEqual(stats["p50_query_time_us"], stats["p99_query_time_us"])
+        self.assertLessEqual(stats["p99_query_time_us"], stats["max_query_time_us"])
+        self.assertGreater(stats["throughput_ops_per_s"], 0)
+    
+    def test_latency_histogram(self):
+        """Test histogram percentiles stay within bucket precision"""
+        histogram = LatencyHistogram()
+        for value in range(1, 10001):
+            histogram.record(float(value))
+        
+        self.assertEqual(histogram.count, 10000)
+        self.assertAlmostEqual(histogram.mean, 5000.5)
+        self.assertEqual(histogram.max, 10000.0)
+        for quantile in (0.5, 0.95, 0.99):
+            expected = quantile * 10000
+            self.assertAlmostEqual(histogram.percentile(quantile), expected, delta=expected * 0.035)
+        
+        other = LatencyHistogram()
+        other.record(20000.0, count=100)
+        histogram.merge(other)
+        self.assertEqual(histogram.count, 10100)
+        self.assertEqual(histogram.percentile(1.0), 20000.0)
 
 
 class TestNPU253SelfTest(unittest.TestCase):
@@ -438,6 +850,207 @@ class TestNPU253Commands(unittest.TestCase):
         self.assertTrue(result)
 
 
+class TestNPU253CommandRing(unittest.TestCase):
+    """Test batched submission/completion rings"""
+    
+    def setUp(self):
+        """Set up test fixture"""
+        config = NPUConfig(verbose=False, ring_size=8)
+        self.npu = PatternCoprocessorDriver(config)
+        self.npu.load()
+    
+    def test_submit_process_reap(self):
+        """Test the doorbell flow through send_command"""
+        tags = [self.npu.submit(CMD_QUERY_BY_ID, i) for i in (1, 2, 3)]
+        self.assertEqual(self.npu.read_reg32(0x48), 3)
+        
+        self.assertTrue(self.npu.send_command(CMD_PROCESS_RING))
+        self.assertEqual(self.npu.read_reg32(0x24), 3)
+        self.assertEqual(self.npu.read_reg32(0x44), 3)
+        
+        completions = self.npu.reap_completions()
+        self.assertEqual([c.tag for c in completions], tags)
+        self.assertEqual([c.result.pattern_id for c in completions], [1, 2, 3])
+        self.assertEqual(self.npu.read_reg32(0x4C), 3)
+    
+    def test_ring_full(self):
+        """Test submission ring overflow"""
+        for i in range(8):
+            self.assertIsNotNone(self.npu.submit(CMD_QUERY_BY_ID, 1))
+        self.assertIsNone(self.npu.submit(CMD_QUERY_BY_ID, 1))
+        self.assertEqual(self.npu.read_reg32(0x34), ERR_RING_FULL)
+    
+    def test_mixed_batch_matches_single_calls(self):
+        """Test that batched results match the high-level methods"""
+        if not self.npu.archetypal_patterns:
+            self.skipTest("No archetypal patterns loaded")
+        arc_id = list(self.npu.archetypal_patterns.keys())[0]
+        
+        commands = [(CMD_QUERY_BY_ID, i) for i in range(1, 21)] + [
+            (CMD_QUERY_BY_NAME, "bike paths & racks"),
+            (CMD_QUERY_BY_TEXT, "garden"),
+            (CMD_TRANSFORM, arc_id, "social"),
+            (CMD_GET_FOLLOWING, 1),
+            (CMD_GET_CATEGORY, "towns"),
+        ]
+        completions = self.npu.execute_batch(commands)
+        
+        self.assertEqual(len(completions), len(commands))
+        self.assertTrue(all(c.ok for c in completions))
+        self.assertEqual([c.result.pattern_id for c in completions[:20]], list(range(1, 21)))
+        self.assertEqual(completions[20].result, self.npu.query_by_name("bike paths & racks"))
+        self.assertEqual(completions[21].result, self.npu.query_by_text("garden"))
+        self.assertEqual(completions[22].result, self.npu.transform_pattern(arc_id, "social"))
+        self.assertEqual(completions[23].result, self.npu.get_following_patterns(1))
+        self.assertEqual(completions[24].result, self.npu.get_category("towns"))
+    
+    def test_batch_errors_and_telemetry(self):
+        """Test per-command errors and batched telemetry counters"""
+        initial_queries = self.npu.telemetry.total_queries
+        completions = self.npu.execute_batch([
+            (CMD_QUERY_BY_ID, 9999),
+            (CMD_TRANSFORM, "invalid_id_9999", "physical"),
+            (CMD_QUERY_BY_ID, 1),
+            (0x7F,),
+        ])
+        
+        self.assertEqual(
+            [c.error for c in completions],
+            [ERR_PATTERN_NOT_FOUND, ERR_PATTERN_NOT_FOUND, ERR_NONE, ERR_INVALID_CMD]
+        )
+        self.assertEqual(self.npu.telemetry.total_queries, initial_queries + 2)
+        self.assertEqual(self.npu.read_reg32(0x38), self.npu.telemetry.total_queries)
+    
+    def test_batch_requires_load(self):
+        """Test that ring processing needs loaded patterns"""
+        npu = PatternCoprocessorDriver(NPUConfig(verbose=False))
+        self.assertEqual(npu.execute_batch([(CMD_QUERY_BY_ID, 1)]), [])
+        self.assertEqual(npu.read_reg32(0x34), ERR_NOT_LOADED)
+
+
+class TestNPU253Concurrency(unittest.TestCase):
+    """Test the thread-safe concurrent mode"""
+    
+    def setUp(self):
+        """Set up test fixture"""
+        config = NPUConfig(verbose=False, concurrent=True, cache_size=32, cache_stripes=4)
+        self.npu = PatternCoprocessorDriver(config)
+        self.npu.load()
+    
+    def _run_threads(self, target, n_threads=8):
+        errors = []
+        
+        def worker(index):
+            try:
+                target(index)
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(n_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+    
+    def test_matches_default_mode(self):
+        """Test that concurrent mode returns the same results as the default driver"""
+        reference = PatternCoprocessorDriver(NPUConfig(verbose=False))
+        reference.load()
+        for pattern_id in (1, 42, 253):
+            self.assertEqual(self.npu.query_by_id(pattern_id), reference.query_by_id(pattern_id))
+        self.assertEqual(
+            [p.pattern_id for p in self.npu.query_by_text("garden")],
+            [p.pattern_id for p in reference.query_by_text("garden")]
+        )
+        self.assertEqual(self.npu.query_by_name("sacred sites"), reference.query_by_name("sacred sites"))
+        self.assertEqual(self.npu.get_telemetry().total_queries, reference.get_telemetry().total_queries)
+    
+    def test_loaded_tables_read_only(self):
+        """Test that published tables cannot be mutated"""
+        with self.assertRaises(TypeError):
+            self.npu.patterns[1] = None
+        self.assertEqual(len(self.npu.patterns), 253)
+    
+    def test_parallel_queries(self):
+        """Test concurrent queries return correct results"""
+        terms = ["garden", "light", "community", "street"]
+        expected = {term: len(self.npu.query_by_text(term)) for term in terms}
+        
+        def work(index):
+            for pattern_id in range(1, 254):
+                pattern = self.npu.query_by_id(pattern_id)
+                assert pattern.pattern_id == pattern_id
+            for _ in range(50):
+                term = terms[index % len(terms)]
+                self.npu.query_by_text(term)
+                assert self.npu.read_reg32(0x24) == expected[term]
+        
+        self._run_threads(work)
+        self.assertLessEqual(len(self.npu.cache), 32)
+    
+    def test_merged_telemetry(self):
+        """Test per-thread telemetry merges into exact totals"""
+        def work(index):
+            for pattern_id in range(1, 101):
+                self.npu.query_by_id(pattern_id)
+            self.npu.get_following_patterns(1)
+        
+        self._run_threads(work)
+        telemetry = self.npu.get_telemetry()
+        self.assertEqual(telemetry.total_queries, 800)
+        self.assertEqual(telemetry.total_navigations, 8)
+        self.assertEqual(telemetry.cache_hits + telemetry.cache_misses, 800)
+        self.assertEqual(self.npu.read_reg32(0x38), 800)
+    
+    def test_cache_stripes_sized_from_capacity(self):
+        """Test that small caches are not split into tiny stripes"""
+        from npu253.cache import StripedLRUCache, MIN_STRIPE_CAPACITY
+        self.assertEqual(len(self.npu.cache._stripes), 1)
+        self.assertEqual(len(StripedLRUCache(4 * MIN_STRIPE_CAPACITY, 16)._stripes), 4)
+        self.assertEqual(len(StripedLRUCache(1024 * MIN_STRIPE_CAPACITY, 16)._stripes), 16)
+        
+        # A single stripe evicts exactly like one LRU of the same size
+        cache = StripedLRUCache(MIN_STRIPE_CAPACITY, 16)
+        for key in range(MIN_STRIPE_CAPACITY + 1):
+            cache.put(key, key)
+        self.assertNotIn(0, cache)
+        self.assertEqual(len(cache), MIN_STRIPE_CAPACITY)
+    
+    def test_per_thread_error_register(self):
+        """Test that errors are visible only to the failing thread"""
+        self.npu.query_by_id(9999)
+        self.assertEqual(self.npu.read_reg32(0x34), ERR_PATTERN_NOT_FOUND)
+        
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(self.npu.read_reg32(0x34)))
+        thread.start()
+        thread.join()
+        self.assertEqual(seen, [ERR_NONE])
+    
+    def test_parallel_batches(self):
+        """Test that ring batches from several threads stay consistent"""
+        def work(index):
+            commands = [(CMD_QUERY_BY_ID, i) for i in range(1, 101)]
+            completions = self.npu.execute_batch(commands)
+            assert [c.result.pattern_id for c in completions] == list(range(1, 101))
+        
+        self._run_threads(work)
+        self.assertEqual(self.npu.telemetry.total_queries, 800)
+    
+    def test_reload_while_reading(self):
+        """Test that readers never observe a partially loaded device"""
+        def work(index):
+            if index == 0:
+                for _ in range(3):
+                    self.npu.load()
+            else:
+                for _ in range(200):
+                    assert self.npu.query_by_id(42) is not None
+        
+        self._run_threads(work, n_threads=4)
+
+
 def run_tests():
     """Run all tests"""
     # Create test suite
@@ -447,7 +1060,9 @@ def run_tests():
     # Add all test classes
     suite.addTests(loader.loadTestsFromTestCase(TestNPU253Registers))
     suite.addTests(loader.loadTestsFromTestCase(TestNPU253Loading))
+    suite.addTests(loader.loadTestsFromTestCase(TestNPU253Snapshot))
     suite.addTests(loader.loadTestsFromTestCase(TestNPU253Queries))
+    suite.addTests(loader.loadTestsFromTestCase(TestNPU253TextSearch))
     suite.addTests(loader.loadTestsFromTestCase(TestNPU253Navigation))
     suite.addTests(loader.loadTestsFromTestCase(TestNPU253Categories))
     suite.addTests(loader.loadTestsFromTestCase(TestNPU253Sequences))
@@ -456,6 +1071,8 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestNPU253Telemetry))
     suite.addTests(loader.loadTestsFromTestCase(TestNPU253SelfTest))
     suite.addTests(loader.loadTestsFromTestCase(TestNPU253Commands))
+    suite.addTests(loader.loadTestsFromTestCase(TestNPU253CommandRing))
+    suite.addTests(loader.loadTestsFromTestCase(TestNPU253Concurrency))
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
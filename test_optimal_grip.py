@@ -12,6 +12,533 @@ Tests all components working together:
 import json
 import sys
 
+def _reference_ranking(engine, context, limit):
+    """Rank by calling compute_salience on every pattern"""
+    scores = [engine.compute_salience(pid, context) for pid in engine.patterns]
+    scores = [s for s in scores if s.score > 0]
+    scores.sort(reverse=True)
+    return scores[:limit]
+
+
+def test_vectorized_salience():
+    """Test vectorized ranking against per-pattern scoring"""
+    print("Testing Vectorized Salience Ranking...")
+    from pattern_salience_engine import PatternSalienceEngine, PatternContext
+    
+    engine = PatternSalienceEngine('pattern_language_generated.json')
+    contexts = [
+        PatternContext(),
+        PatternContext(focus_patterns={'apl1', 'apl2'}, current_category='Towns'),
+        PatternContext(keywords={'region', 'city', 'light', 'garden', 'nosuchword'}),
+        PatternContext(focus_patterns={'apl12', 'apl95', 'missing'},
+                       current_category='Buildings', keywords={'community', 'house'}),
+    ]
+    
+    for context in contexts:
+        for limit in (1, 7, 20, 253):
+            expected = _reference_ranking(engine, context, limit)
+            actual = engine.rank_patterns_by_salience(context, limit=limit)
+            assert [(s.pattern_id, s.score, s.reasons) for s in actual] == \
+                   [(s.pattern_id, s.score, s.reasons) for s in expected], \
+                   f"Ranking mismatch for {context} (limit {limit})"
+        
+        quiet = engine.rank_patterns_by_salience(context, limit=20, explain=False)
+        assert [(s.pattern_id, s.score) for s in quiet] == \
+               [(s.pattern_id, s.score) for s in expected[:20]]
+        assert all(s.reasons == [] for s in quiet), "explain=False should skip reasons"
+        
+        vector = engine.compute_salience_vector(context)
+        for pid, score in zip(engine.pattern_order, vector):
+            assert score == engine.compute_salience(pid, context).score
+    
+    print(f"  ✓ Vectorized ranking matches for {len(contexts)} contexts")
+
+
+def test_gestalt_clustering():
+    """Test precomputed similarity and agglomerative gestalt clustering"""
+    print("Testing Gestalt Clustering...")
+    import time
+    from pattern_salience_engine import PatternSalienceEngine
+    
+    engine = PatternSalienceEngine('pattern_language_generated.json')
+    
+    # Spot-check the similarity matrix against the pairwise definition
+    for pid1, pid2 in [('apl1', 'apl2'), ('apl2', 'apl1'), ('apl12', 'apl95'), ('apl51', 'apl52')]:
+        f1, f2 = engine.pattern_features[pid1], engine.pattern_features[pid2]
+        p1, p2 = engine.patterns[pid1], engine.patterns[pid2]
+        expected = 0.3 if f1['category'] == f2['category'] else 0.0
+        common = f1['keywords'] & f2['keywords']
+        if common:
+            expected += min(len(common) / 10.0, 0.4)
+        if p2['number'] in p1['following_patterns'] + p1['preceding_patterns']:
+            expected += 0.3
+        assert engine._compute_pattern_similarity(pid1, pid2) == min(expected, 1.0)
+    
+    pattern_ids = list(engine.patterns)
+    start = time.time()
+    gestalts = engine.detect_gestalt_patterns(pattern_ids, threshold=0.6)
+    elapsed = time.time() - start
+    
+    clustered = [pid for g in gestalts for pid in g['patterns']]
+    assert len(clustered) == len(set(clustered)), "Clusters should be disjoint"
+    assert all(g['size'] == len(g['patterns']) > 1 for g in gestalts)
+    assert all(g['coherence'] >= 0.6 - 1e-9 for g in gestalts), "Clusters should be coherent"
+    assert engine.detect_gestalt_patterns(['apl1', 'unknown'], threshold=0.5) == []
+    
+    print(f"  ✓ Clustered {len(pattern_ids)} patterns into {len(gestalts)} gestalts "
+          f"in {elapsed * 1000:.1f} ms")
+
+
+def test_salience_cache():
+    """Test context-keyed caching of salience rankings"""
+    print("Testing Salience Cache...")
+    import time
+    from pattern_salience_engine import PatternSalienceEngine, PatternContext
+    
+    engine = PatternSalienceEngine('pattern_language_generated.json', cache_size=2)
+    context = PatternContext(focus_patterns={'apl1', 'apl2'}, keywords={'city', 'region'})
+    same = PatternContext(focus_patterns={'apl2', 'apl1'}, keywords={'region', 'city'})
+    
+    first = engine.rank_patterns_by_salience(context, limit=5)
+    second = engine.rank_patterns_by_salience(same, limit=5)
+    assert first == second
+    assert engine.salience_cache.stats()['hits'] == 1
+    
+    # Limit and explain are part of the key
+    engine.rank_patterns_by_salience(context, limit=6)
+    engine.rank_patterns_by_salience(context, limit=5, explain=False)
+    stats = engine.salience_cache.stats()
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (1, 3, 1)
+    
+    engine.reload('pattern_language_generated.json')
+    assert len(engine.salience_cache) == 0, "Reload should invalidate the cache"
+    
+    engine = PatternSalienceEngine('pattern_language_generated.json', cache_ttl=0.01)
+    engine.rank_patterns_by_salience(context)
+    time.sleep(0.02)
+    engine.rank_patterns_by_salience(context)
+    assert engine.salience_cache.stats()['expirations'] == 1
+    
+    # Changing returned scores must not change later cached rankings
+    engine = PatternSalienceEngine('pattern_language_generated.json')
+    expected = [(s.pattern_id, s.score, list(s.reasons)) for s in engine.rank_patterns_by_salience(context, limit=5)]
+    for ranking in (engine.rank_patterns_by_salience(context, limit=5),
+                    engine.rank_patterns_by_salience_batch([context], limit=5)[0]):
+        ranking[0].score = -1.0
+        ranking[0].reasons.append('poisoned')
+        ranking.pop()
+    again = engine.rank_patterns_by_salience(context, limit=5)
+    assert [(s.pattern_id, s.score, s.reasons) for s in again] == expected, "Cached ranking was modified"
+    
+    print(f"  ✓ Cache hits, eviction, expiry, reload invalidation and copies work")
+
+
+def test_salience_session():
+    """Test incremental salience updates against full re-ranking"""
+    print("Testing Salience Session...")
+    import random
+    import time
+    from pattern_salience_engine import PatternSalienceEngine, PatternContext, SalienceSession
+    
+    keywords = ['city', 'region', 'house', 'light', 'garden', 'community', 'nosuchword']
+    
+    for weighting in ('count', 'idf'):
+        engine = PatternSalienceEngine('pattern_language_generated.json', cache_size=0,
+                                       keyword_weighting=weighting)
+        session = SalienceSession(engine, PatternContext(focus_patterns={'apl1'}), limit=10)
+        rng = random.Random(253)
+        pattern_ids = list(engine.patterns)
+        
+        elapsed = 0.0
+        for step in range(200):
+            action = rng.choice(['add_focus', 'remove_focus', 'add_keyword',
+                                 'remove_keyword', 'set_category'])
+            start = time.perf_counter()
+            if action == 'add_focus':
+                top = session.add_focus(rng.choice(pattern_ids))
+            elif action == 'remove_focus':
+                top = session.remove_focus(rng.choice(sorted(session.context.focus_patterns) or ['apl1']))
+            elif action == 'add_keyword':
+                top = session.add_keyword(rng.choice(keywords))
+            elif action == 'remove_keyword':
+                top = session.remove_keyword(rng.choice(keywords))
+            else:
+                top = session.set_category(rng.choice(['Towns', 'Buildings', 'Construction', None]))
+            elapsed += time.perf_counter() - start
+            
+            expected = engine.rank_patterns_by_salience(session.context, limit=10)
+            if weighting == 'count':
+                # Whole-number weights: incremental updates are exact
+                assert [(s.pattern_id, s.score, s.reasons) for s in top] == \
+                       [(s.pattern_id, s.score, s.reasons) for s in expected], f"Mismatch at step {step}"
+            else:
+                # IDF weights are summed in a different order, so allow rounding
+                assert [s.pattern_id for s in top] == [s.pattern_id for s in expected], \
+                       f"IDF mismatch at step {step}"
+                assert all(abs(a.score - b.score) < 1e-9 for a, b in zip(top, expected))
+    
+    print(f"  ✓ 200 incremental updates match full ranking, count and IDF "
+          f"({elapsed / 200 * 1e6:.0f} µs per step)")
+
+
+def test_centrality():
+    """Test shared network centrality and its disk cache"""
+    print("Testing Network Centrality...")
+    import os
+    import tempfile
+    from pattern_centrality import compute_centrality, load_centrality
+    
+    # A chain 1 -> 2 -> 3: only the middle pattern lies between others
+    chain = {
+        'p1': {'number': 1, 'following_patterns': [2], 'preceding_patterns': []},
+        'p2': {'number': 2, 'following_patterns': [3], 'preceding_patterns': [1]},
+        'p3': {'number': 3, 'following_patterns': [], 'preceding_patterns': [2]},
+    }
+    scores = compute_centrality(chain)
+    assert [scores[p]['betweenness'] for p in chain] == [0.0, 0.5, 0.0]
+    assert abs(sum(s['pagerank'] for s in scores.values()) - 1.0) < 1e-9
+    assert scores['p3']['pagerank'] > scores['p2']['pagerank'] > scores['p1']['pagerank']
+    assert scores['p2']['eigenvector'] > scores['p1']['eigenvector']
+    
+    with open('pattern_language_generated.json', 'r') as f:
+        patterns = {p['id']: p for p in json.load(f)['patterns']}
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = os.path.join(tmp, 'centrality.json')
+        computed = load_centrality('pattern_language_generated.json', patterns, cache)
+        assert os.path.exists(cache), "Centrality should be cached to disk"
+        assert os.listdir(tmp) == ['centrality.json'], "Cache should be written via a renamed temp file"
+        assert load_centrality('pattern_language_generated.json', patterns, cache) == computed
+        
+        # A changed graph must not reuse the cache
+        del patterns['apl253']
+        assert 'apl253' not in load_centrality('pattern_language_generated.json', patterns, cache)
+    
+    print(f"  ✓ PageRank, betweenness and eigenvector centrality for {len(computed)} patterns")
+
+
+def test_salience_batch():
+    """Test batch ranking against one-at-a-time ranking"""
+    print("Testing Batch Salience...")
+    import random
+    from pattern_salience_engine import PatternSalienceEngine, PatternContext
+    
+    engine = PatternSalienceEngine('pattern_language_generated.json', cache_size=0)
+    rng = random.Random(17)
+    pattern_ids = list(engine.patterns)
+    keywords = ['city', 'region', 'house', 'light', 'garden', 'community', 'nosuchword']
+    contexts = [
+        PatternContext(
+            focus_patterns=set(rng.sample(pattern_ids, rng.randint(0, 4))),
+            current_category=rng.choice(['Towns', 'Buildings', 'Construction', None]),
+            keywords=set(rng.sample(keywords, rng.randint(0, 3)))
+        )
+        for _ in range(50)
+    ]
+    limits = [rng.randint(1, 30) for _ in contexts]
+    
+    batch = engine.rank_patterns_by_salience_batch(contexts, limit=limits)
+    assert len(batch) == len(contexts)
+    for context, limit, ranking in zip(contexts, limits, batch):
+        expected = engine.rank_patterns_by_salience(context, limit=limit)
+        assert [(s.pattern_id, s.score, s.reasons) for s in ranking] == \
+               [(s.pattern_id, s.score, s.reasons) for s in expected]
+    
+    matrix = engine.compute_salience_matrix(contexts)
+    for context, row in zip(contexts, matrix):
+        assert (row == engine.compute_salience_vector(context)).all()
+    
+    print(f"  ✓ Batch ranking matches for {len(contexts)} contexts")
+
+
+def test_keyword_index():
+    """Test normalized, interned keyword postings and IDF weighting"""
+    print("Testing Keyword Index...")
+    from pattern_salience_engine import (PatternSalienceEngine, PatternContext,
+                                         SalienceSession, normalize_keyword)
+    
+    assert [normalize_keyword(w) for w in ['Cities', 'houses', 'glass', 'process', 'city']] == \
+           ['city', 'house', 'glass', 'process', 'city']
+    
+    # By default keywords match the lowercase words of each pattern exactly
+    import re
+    engine = PatternSalienceEngine('pattern_language_generated.json', cache_size=0)
+    context = PatternContext(keywords={'city', 'cities', 'houses', 'Light', 'garden'})
+    for pid, row in engine.pattern_index.items():
+        pattern = engine.patterns[pid]
+        words = set(re.findall(r'\b\w{4,}\b', (pattern.get('problem', '') + ' ' +
+                                               pattern.get('solution', '') + ' ' +
+                                               pattern.get('name', '')).lower()))
+        assert engine.pattern_features[pid]['keywords'] == words
+        assert engine._keyword_scores(context)[row] == len(words & context.keywords) * 2.0
+    
+    engine = PatternSalienceEngine('pattern_language_generated.json', cache_size=0,
+                                   stem_keywords=True)
+    plural = engine.compute_salience_vector(PatternContext(keywords={'Cities', 'HOUSES'}))
+    singular = engine.compute_salience_vector(PatternContext(keywords={'city', 'house'}))
+    assert (plural == singular).all(), "Keywords should match after normalization"
+    
+    index = engine.keyword_index
+    token = index.token_ids['city']
+    assert all('city' in engine.pattern_features[engine.pattern_order[row]]['keywords']
+               for row in index.postings[token])
+    commonest = max(range(len(index)), key=lambda t: len(index.postings[t]))
+    assert index.idf[token] > index.idf[commonest], "Rarer words should weigh more"
+    
+    engine = PatternSalienceEngine('pattern_language_generated.json', cache_size=0,
+                                   keyword_weighting='idf')
+    contexts = [
+        PatternContext(keywords={'city', 'light', 'garden', 'region'}),
+        PatternContext(focus_patterns={'apl12'}, current_category='Towns',
+                       keywords={'community', 'streets', 'house'}),
+    ]
+    matrix = engine.compute_salience_matrix(contexts)
+    for context, row in zip(contexts, matrix):
+        vector = engine.compute_salience_vector(context)
+        assert (row == vector).all()
+        for pid, score in zip(engine.pattern_order, vector):
+            assert score == engine.compute_salience(pid, context).score
+    
+    session = SalienceSession(engine, limit=10)
+    for keyword in ['city', 'light', 'garden', 'region']:
+        top = session.add_keyword(keyword)
+    session.remove_keyword('light')
+    top = session.add_keyword('light')
+    expected = engine.rank_patterns_by_salience(contexts[0], limit=10)
+    assert [(s.pattern_id, s.score) for s in top] == [(s.pattern_id, s.score) for s in expected]
+    
+    print(f"  ✓ {len(index)} interned keywords; IDF scoring consistent across paths")
+
+
+def test_emergence_tracker():
+    """Test streaming emergence tracking against track_emergence"""
+    print("Testing Emergence Tracker...")
+    import asyncio
+    import random
+    from pattern_salience_engine import PatternSalienceEngine, EmergenceTracker
+    
+    engine = PatternSalienceEngine('pattern_language_generated.json')
+    rng = random.Random(19)
+    pattern_ids = list(engine.patterns)
+    
+    def stream(length):
+        # Wander along the network, with occasional jumps
+        current = rng.choice(pattern_ids)
+        for _ in range(length):
+            yield current
+            following = engine.patterns[current]['following_patterns']
+            if following and rng.random() < 0.8:
+                current = f"apl{rng.choice(following)}"
+            else:
+                current = rng.choice(pattern_ids)
+    
+    sequence = list(stream(2000))
+    tracker = EmergenceTracker(engine, window=6, threshold=0.5)
+    events = []
+    for i, pattern_id in enumerate(sequence):
+        event = tracker.step(pattern_id)
+        if i >= 1:
+            window = sequence[max(0, i - 5):i + 1]
+            expected = engine.track_emergence(window)
+            assert abs(tracker.emergence_score - expected['emergence_score']) < 1e-9
+        if event:
+            events.append(event)
+    
+    assert events, "A wandering stream should cross the threshold"
+    assert [e.kind for e in events] == ['start', 'end'] * (len(events) // 2) + ['start'] * (len(events) % 2)
+    assert tracker.stats()['steps'] == len(sequence)
+    
+    async def replay():
+        async def source():
+            for pattern_id in sequence:
+                yield pattern_id
+        tracker = EmergenceTracker(engine, window=6, threshold=0.5)
+        return [e async for e in tracker.aprocess(source())]
+    
+    replayed = asyncio.run(replay())
+    assert [(e.step, e.kind) for e in replayed] == [(e.step, e.kind) for e in events]
+    
+    print(f"  ✓ {len(events)} emergence events over {len(sequence)} streamed patterns")
+
+
+def test_lazy_startup():
+    """Test lazy loading, background loading and the feature cache"""
+    print("Testing Lazy Start-up...")
+    import os
+    import shutil
+    import subprocess
+    import tempfile
+    from pattern_salience_engine import PatternSalienceEngine, PatternContext, feature_cache_path_for
+    
+    # Importing the engine must not import numpy, and a missing numpy
+    # must surface as ImportError when the engine loads
+    probe = subprocess.run(
+        [sys.executable, '-c',
+         'import sys, pattern_salience_engine; '
+         'print("numpy" in sys.modules); '
+         'sys.modules["numpy"] = None\n'
+         'try:\n'
+         '    pattern_salience_engine.PatternSalienceEngine("pattern_language_generated.json")\n'
+         'except ImportError:\n'
+         '    print("ImportError")'],
+        capture_output=True, text=True, check=True
+    )
+    assert probe.stdout.split() == ['False', 'ImportError'], probe.stdout
+    
+    engine = PatternSalienceEngine('pattern_language_generated.json', lazy=True, verbose=False)
+    assert not engine.ready
+    assert not hasattr(engine, 'patterns') and not engine.ready, "Attributes should not load"
+    engine.rank_patterns_by_salience(PatternContext(keywords={'city'}))
+    assert len(engine.patterns) == 253 and engine.ready, "First use should load"
+    
+    engine = PatternSalienceEngine('pattern_language_generated.json', lazy=True, verbose=False)
+    engine.load_in_background().join()
+    assert engine.ready and engine.load_error is None
+    
+    context = PatternContext(focus_patterns={'apl1'}, keywords={'city'})
+    expected = engine.rank_patterns_by_salience(context)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'patterns.json')
+        cache = os.path.join(tmp, 'features.pkl')
+        shutil.copy('pattern_language_generated.json', source)
+        
+        built = PatternSalienceEngine(source, feature_cache_path=cache, verbose=False)
+        assert os.path.exists(cache), "Features should be cached"
+        cached = PatternSalienceEngine(source, feature_cache_path=cache, verbose=False)
+        assert cached._load_feature_cache(), "A fresh cache should be reused"
+        assert cached.rank_patterns_by_salience(context) == expected
+        assert (cached.similarity_matrix == built.similarity_matrix).all()
+        
+        # Only a change to the source contents invalidates the cache
+        os.utime(source, ns=(os.stat(cache).st_mtime_ns + 10**9,) * 2)
+        assert cached._load_feature_cache(), "A newer mtime alone should not invalidate the cache"
+        with open(source, 'a') as f:
+            f.write('\n')
+        assert not cached._load_feature_cache()
+    
+    assert feature_cache_path_for(os.path.join('data', 'patterns.json')) == os.path.join('data', 'patterns.features.pkl')
+    
+    print(f"  ✓ Lazy, background and cached start-up give identical rankings")
+
+
+def test_shared_state():
+    """Test attaching an engine to memory-mapped shared features"""
+    print("Testing Shared Engine State...")
+    import os
+    import subprocess
+    import tempfile
+    from pattern_salience_engine import PatternSalienceEngine, PatternContext
+    
+    engine = PatternSalienceEngine('pattern_language_generated.json', verbose=False)
+    contexts = [
+        PatternContext(focus_patterns={'apl1', 'apl30'}, current_category='Towns',
+                       keywords={'city', 'light'}),
+        PatternContext(current_category='Buildings', keywords={'garden'}),
+        PatternContext(),
+    ]
+    pattern_ids = list(engine.patterns)[:60]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'engine.state')
+        engine.save_shared_state(path)
+        attached = PatternSalienceEngine.attach_shared_state(path, verbose=False)
+        
+        assert attached.ready
+        assert not attached.similarity_matrix.flags.writeable, "Arrays should be mapped read-only"
+        assert (attached.similarity_matrix == engine.similarity_matrix).all()
+        assert attached.rank_patterns_by_salience_batch(contexts) == \
+               engine.rank_patterns_by_salience_batch(contexts)
+        assert attached.detect_gestalt_patterns(pattern_ids) == \
+               engine.detect_gestalt_patterns(pattern_ids)
+        
+        # Another process attaches to the same file
+        probe = subprocess.run(
+            [sys.executable, '-c',
+             'import sys; from pattern_salience_engine import *; '
+             'e = PatternSalienceEngine.attach_shared_state(sys.argv[1], verbose=False); '
+             'print(e.rank_patterns_by_salience(PatternContext(keywords={"city"}), limit=1)[0].pattern_id)',
+             path],
+            capture_output=True, text=True, check=True
+        )
+        expected = engine.rank_patterns_by_salience(PatternContext(keywords={'city'}), limit=1)
+        assert probe.stdout.strip() == expected[0].pattern_id
+        
+        # Per-process memory: mapped arrays are shared, the pickled
+        # header (patterns, features, keyword table) is private
+        import tracemalloc
+        tracemalloc.start()
+        measured = PatternSalienceEngine.attach_shared_state(path, verbose=False)
+        attached_heap = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        tracemalloc.start()
+        measured = PatternSalienceEngine('pattern_language_generated.json', verbose=False)
+        built_heap = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        with open(path, 'rb') as f:
+            f.seek(8)
+            header_size = int.from_bytes(f.read(8), 'little')
+        mapped = os.path.getsize(path) - header_size
+        assert attached_heap < built_heap
+    
+    print(f"  ✓ Attached engine ranks identically ({os.path.basename(path)} mapped read-only); "
+          f"per process {attached_heap / 1e6:.1f} MB private vs {built_heap / 1e6:.1f} MB built, "
+          f"{mapped / 1e6:.1f} MB shared")
+
+
+def test_engine_executor():
+    """Test off-loop engine calls, timeouts, queue limits and the process pool"""
+    print("Testing Engine Executor...")
+    import asyncio
+    import os
+    import tempfile
+    import time
+    from pattern_executor import EngineExecutor, EngineBusy
+    from pattern_salience_engine import PatternSalienceEngine, PatternContext
+    
+    engine = PatternSalienceEngine('pattern_language_generated.json', verbose=False)
+    context = PatternContext(focus_patterns={'apl1'}, keywords={'city'})
+    sequence = ['apl1', 'apl2', 'apl3', 'apl12', 'apl51']
+    
+    async def exercise(state_path):
+        executor = EngineExecutor(engine, threads=1, process_workers=1,
+                                  shared_state=state_path, max_queue=1, timeout=0.2)
+        try:
+            assert await executor.run(engine.rank_patterns_by_salience, context) == \
+                   engine.rank_patterns_by_salience(context)
+            assert await executor.run_in_process('track_emergence', sequence, timeout=60) == \
+                   engine.track_emergence(sequence)
+            
+            try:
+                await executor.run(time.sleep, 0.5)
+                assert False, "A slow call should time out"
+            except asyncio.TimeoutError:
+                pass
+            
+            # The timed-out call still holds the only thread: one call
+            # may wait, the next is rejected
+            waiting = asyncio.ensure_future(executor.run(time.sleep, 0, timeout=5))
+            await asyncio.sleep(0)
+            try:
+                await executor.run(time.sleep, 0)
+                assert False, "A full queue should reject calls"
+            except EngineBusy:
+                pass
+            await waiting
+            return executor.stats()
+        finally:
+            executor.shutdown()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        state_path = os.path.join(tmp, 'engine.state')
+        engine.save_shared_state(state_path)
+        stats = asyncio.run(exercise(state_path))
+    
+    threads = stats['threads']
+    assert (threads['timeouts'], threads['rejected'], threads['max_queued']) == (1, 1, 1)
+    assert stats['processes']['completed'] == 1
+    
+    print(f"  ✓ Thread and process pools, timeouts and queue limits work")
+
+
 def test_datalog():
     """Test Datalog query system"""
     print("Testing Datalog Query System...")
@@ -29,6 +556,9 @@ def test_datalog():
         )
         
         assert len(system.patterns) == 253, "Should load 253 patterns"
+        centrality = system.compute_pattern_centrality()
+        centrality.clear()
+        assert len(system.compute_pattern_centrality()) == 253, "Centrality cache was modified"
         print(f"  ✓ Loaded {len(system.patterns)} patterns")
         print(f"  ✓ Datalog system initialized successfully")
         return True
@@ -80,6 +610,168 @@ def test_salience_engine():
         return False
 
 
+def test_api_response_store():
+    """Test precomputed read responses, ETags and compressed variants"""
+    print("Testing API Response Store...")
+    import gzip
+    import json
+    from starlette.requests import Request
+    from pattern_api import (PatternResponseStore, PatternResponse,
+                             _cached_response, _etag_matches)
+    from pattern_salience_engine import PatternSalienceEngine
+    
+    engine = PatternSalienceEngine('pattern_language_generated.json', verbose=False)
+    store = PatternResponseStore(engine)
+    assert store.is_current(engine)
+    
+    pattern = engine.patterns['apl1']
+    expected = PatternResponse(
+        category=engine.category_map.get('apl1'),
+        **{field: pattern.get(field) for field in PatternResponse.__fields__ if field != 'category'}
+    )
+    assert json.loads(store.pattern_responses['apl1'].body) == json.loads(expected.json())
+    
+    page = json.loads(store.page('Towns', 10)[0].body)
+    assert len(page) == 10 and all(p['category'] == 'Towns' for p in page)
+    assert store.page('Towns', 10) is store.page('Towns', 10), "Pages should be memoized"
+    assert store.cached_page('Towns', 10) is store.page('Towns', 10)
+    assert store.cached_page('Towns', 11) is None, "Lookups must not build pages"
+    assert json.loads(store.page('No such category', 10)[0].body) == []
+    
+    def request(**headers):
+        return Request({'type': 'http', 'headers': [
+            (name.replace('_', '-').encode(), value.encode()) for name, value in headers.items()
+        ]})
+    
+    cached, _ = store.page(None, 253)
+    plain = _cached_response(request(), cached)
+    assert plain.status_code == 200 and plain.body == cached.body
+    assert _cached_response(request(if_none_match=plain.headers['etag']), cached).status_code == 304
+    
+    zipped = _cached_response(request(accept_encoding='gzip'), cached)
+    assert zipped.headers['content-encoding'] == 'gzip'
+    assert gzip.decompress(zipped.body) == cached.body
+    assert zipped.body is cached.encoded('gzip'), "Variants should be compressed when the body is built"
+    assert zipped.headers['etag'] != plain.headers['etag']
+    assert 'content-encoding' not in _cached_response(request(accept_encoding='gzip;q=0'), cached).headers
+    
+    assert _etag_matches('W/"a", "b"', '"a"') and _etag_matches('*', '"a"')
+    assert not _etag_matches('"b"', '"a"')
+    
+    # The store is built by the start-up loader, or in the executor if missing
+    import threading
+    import pattern_api
+    from fastapi.testclient import TestClient
+    with TestClient(pattern_api.app) as client:
+        for thread in threading.enumerate():
+            if thread.name == 'pattern-api-load':
+                thread.join()
+        assert pattern_api._response_store is not None, "Loading should build the store"
+        pattern_api._response_store = None
+        completed = pattern_api.engine_executor.threads.completed
+        assert client.get('/categories').status_code == 200
+        assert pattern_api.engine_executor.threads.completed == completed + 1
+        assert pattern_api._response_store is not None
+    
+    print(f"  ✓ {len(store.pattern_responses)} pattern bodies with ETags and gzip variants")
+
+
+def test_api_pagination():
+    """Test cursor pagination, field projection and per-category indexes"""
+    print("Testing API Pagination...")
+    import json
+    from fastapi import HTTPException
+    from pattern_api import PatternResponseStore, _parse_fields
+    from pattern_salience_engine import PatternSalienceEngine
+    
+    engine = PatternSalienceEngine('pattern_language_generated.json', verbose=False)
+    store = PatternResponseStore(engine)
+    
+    for category in [None, 'Towns', 'Buildings', 'Construction']:
+        expected = [pid for pid in engine.patterns
+                    if category is None or engine.category_map.get(pid) == category]
+        assert store.category_index[category] == expected
+        
+        # Walk every page of 17
+        seen, cursor, pages = [], None, 0
+        while True:
+            body, cursor = store.page(category, 17, cursor=cursor, fields=('id',))
+            seen.extend(row['id'] for row in json.loads(body.body))
+            pages += 1
+            if cursor is None:
+                break
+        assert seen == expected, f"Pages should cover {category or 'all'} once, in order"
+        assert pages == -(-len(expected) // 17)
+    
+    fields = _parse_fields('name, id,number')
+    assert fields == ('id', 'number', 'name'), "Fields follow PatternResponse order"
+    assert _parse_fields('id,number,name,asterisks,problem,solution,category,'
+                         'preceding_patterns,following_patterns') is None
+    row = json.loads(store.page(None, 1, fields=fields)[0].body)[0]
+    assert list(row) == ['id', 'number', 'name']
+    
+    try:
+        _parse_fields('id,nonsense')
+        assert False, "Unknown fields should be rejected"
+    except HTTPException as e:
+        assert e.status_code == 400
+    try:
+        store.page('Towns', 5, cursor='apl200')
+        assert False, "A cursor from another category should be rejected"
+    except ValueError:
+        pass
+    
+    print(f"  ✓ Cursor pages cover {len(store.category_index) - 1} categories exactly once")
+
+
+def test_request_metrics():
+    """Test request metrics collection and Prometheus text rendering"""
+    print("Testing Request Metrics...")
+    import asyncio
+    from pattern_metrics import MetricsMiddleware, RequestMetrics
+    
+    async def endpoint(scope, receive, send):
+        await receive()
+        status = 404 if scope['path'] == '/missing' else 200
+        await send({'type': 'http.response.start', 'status': status, 'headers': []})
+        await send({'type': 'http.response.body', 'body': b'x' * 300, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b'y' * 200})
+    
+    class Route:
+        path = '/items/{item_id}'
+    
+    metrics = RequestMetrics(prefix='test')
+    middleware = MetricsMiddleware(endpoint, metrics)
+    
+    async def request(path, body=b''):
+        async def receive():
+            return {'type': 'http.request', 'body': body}
+        async def send(message):
+            pass
+        scope = {'type': 'http', 'method': 'POST', 'path': path}
+        if path != '/missing':
+            scope['route'] = Route()
+        await middleware(scope, receive, send)
+    
+    async def run():
+        for i in range(3):
+            await request(f'/items/{i}', b'{"a": 1}')
+        await request('/missing')
+    asyncio.run(run())
+    
+    text = '\n'.join(metrics.render())
+    assert metrics.in_flight == 0
+    assert 'test_requests_total{method="POST",route="/items/{item_id}",status="200"} 3' in text
+    assert 'test_requests_total{method="POST",route="unmatched",status="404"} 1' in text
+    assert 'test_request_duration_seconds_count{method="POST",route="/items/{item_id}"} 3' in text
+    assert 'test_response_size_bytes_bucket{method="POST",route="unmatched",le="256.0"} 0' in text
+    assert 'test_response_size_bytes_bucket{method="POST",route="unmatched",le="1024.0"} 1' in text
+    assert 'test_request_size_bytes_sum{method="POST",route="/items/{item_id}"} 24' in text
+    assert '# TYPE test_request_duration_seconds histogram' in text
+    
+    print(f"  ✓ Latency, size and status metrics rendered ({len(text.splitlines())} lines)")
+
+
 def test_api_structure():
     """Test API structure without running server"""
     print("Testing API Structure...")
@@ -92,10 +784,12 @@ def test_api_structure():
             '/patterns',
             '/patterns/{pattern_id}',
             '/salience',
+            '/salience/batch',
             '/gestalt',
             '/emergence',
             '/categories',
-            '/health'
+            '/health',
+            '/metrics'
         ]
         
         for endpoint in required_endpoints:
@@ -182,14 +876,35 @@ def main():
     tests = [
         test_data_consistency,
         test_salience_engine,
+        test_vectorized_salience,
+        test_gestalt_clustering,
+        test_salience_cache,
+        test_salience_session,
+        test_centrality,
+        test_salience_batch,
+        test_keyword_index,
+        test_emergence_tracker,
+        test_lazy_startup,
+        test_shared_state,
+        test_engine_executor,
         test_datalog,
         test_api_structure,
+        test_api_response_store,
+        test_api_pagination,
+        test_request_metrics,
         test_visualization_exists,
     ]
     
     results = []
     for test in tests:
-        result = test()
+        try:
+            # Older tests return False on failure; newer ones raise
+            result = test() is not False
+        except Exception as e:
+            print(f"  ✗ Error: {e}")
+            import traceback
+            traceback.print_exc()
+            result = False
         results.append(result)
         print()
     
@@ -337,6 +337,34 @@ class TestDomainTransformer(unittest.TestCase):
         result = transformer.transform_pattern("test1", Domain.SOCIAL)
         self.assertIsNotNone(result)
         self.assertIn("communities", result["transformed_pattern"])
+    
+    def test_transform_pattern_placeholders(self):
+        """Test unmapped placeholders and template replacement"""
+        transformer = DomainTransformer()
+        transformer.archetypal_patterns["test2"] = {
+            "pattern_id": "test2",
+            "archetypal_pattern": "{{elements}} within {{frameworks}} and {{elements}}",
+            "domain_mappings": {"elements": {"physical": "rooms"}},
+        }
+        
+        result = transformer.transform_pattern("test2", Domain.PHYSICAL)
+        self.assertEqual(result["transformed_pattern"], "rooms within {{frameworks}} and rooms")
+        result = transformer.transform_pattern("test2", Domain.SOCIAL)
+        self.assertEqual(result["transformed_pattern"], "{{elements}} within {{frameworks}} and {{elements}}")
+        
+        transformer.archetypal_patterns["test2"] = {
+            "pattern_id": "test2",
+            "archetypal_pattern": "Order of {{elements}}",
+            "domain_mappings": {"elements": {"physical": "rooms"}},
+        }
+        result = transformer.transform_pattern("test2", Domain.PHYSICAL)
+        self.assertEqual(result["transformed_pattern"], "Order of rooms")
+        
+        # An equal template built as a new string reuses the compiled entry
+        transformer.archetypal_patterns["test2"]["archetypal_pattern"] = "".join(["Order of ", "{{elements}}"])
+        result = transformer.transform_pattern("test2", Domain.PHYSICAL)
+        self.assertEqual(result["transformed_pattern"], "Order of rooms")
+        self.assertEqual(len(transformer._templates), 2)
 
 
 def run_tests():